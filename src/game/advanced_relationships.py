@@ -5,11 +5,21 @@ from __future__ import annotations
 from enum import Enum
 from typing import Dict, List, Any, Optional, Set, TYPE_CHECKING
 from dataclasses import dataclass, field
-import random
 import math
+from .rng import get_rng
 from .relationships import EventType
+from .emotion_diffusion import (
+    DEFAULT_EMOTION_STATE,
+    NUMPY_AVAILABLE,
+    EmotionMatrix,
+    diffuse,
+    diffuse_python,
+)
 from .entities import Agent, GameState
 
+if NUMPY_AVAILABLE:
+    import numpy as np
+
 if TYPE_CHECKING:
     from game.narrative_engine import NarrativeTemplate
 
@@ -328,22 +338,23 @@ class AdvancedRelationshipManager:
         self, agent: Agent, secret_type: Optional[SecretType] = None
     ) -> Secret:
         """Generate a secret for an agent"""
+        rng = get_rng("advanced_relationships")
         if secret_type is None:
-            secret_type = random.choice(list(SecretType))
+            secret_type = rng.choice(list(SecretType))
 
         # Find appropriate template
         template_group = next(
             t for t in self.secret_templates if t["type"] == secret_type
         )
-        template = random.choice(template_group["templates"])
+        template = rng.choice(template_group["templates"])
 
         # Generate impact and emotional weight
-        impact = random.uniform(*template_group["impact_range"])
-        emotional_weight = random.uniform(*template_group["emotional_weight_range"])
+        impact = rng.uniform(*template_group["impact_range"])
+        emotional_weight = rng.uniform(*template_group["emotional_weight_range"])
 
         # Create secret
         secret = Secret(
-            id=f"secret_{agent.id}_{random.randint(1000, 9999)}",
+            id=f"secret_{agent.id}_{rng.randint(1000, 9999)}",
             description=template,
             secret_type=secret_type,
             impact=impact,
@@ -361,7 +372,7 @@ class AdvancedRelationshipManager:
         success_chance: float = 0.3,
     ) -> bool:
         """Attempt to spread a rumor about a secret"""
-        if random.random() > success_chance:
+        if get_rng("advanced_relationships").random() > success_chance:
             return False
 
         # Add target to known_by set
@@ -384,7 +395,8 @@ class AdvancedRelationshipManager:
         effectiveness = secret.get_blackmail_potential()
         resistance = self.game_state.agents[target].loyalty / 100.0
 
-        if random.random() < effectiveness * (1 - resistance):
+        roll = get_rng("advanced_relationships").random()
+        if roll < effectiveness * (1 - resistance):
             # Blackmail successful
             secret.weaponized = True
 
@@ -418,15 +430,16 @@ class AdvancedRelationshipManager:
         custom_summary: Optional[str] = None,
     ) -> MemoryEntry:
         """Create a memory entry for an agent"""
+        rng = get_rng("advanced_relationships")
         # Find appropriate template
         template_group = next(
             (t for t in self.memory_templates if t["event_type"] == event_type), None
         )
 
         if template_group:
-            template = random.choice(template_group["templates"])
+            template = rng.choice(template_group["templates"])
             emotional_tone = template_group["emotional_tone"]
-            impact = random.uniform(*template_group["impact_range"])
+            impact = rng.uniform(*template_group["impact_range"])
 
             if other_agent:
                 other_agent_name = self.game_state.agents[other_agent].name
@@ -445,7 +458,7 @@ class AdvancedRelationshipManager:
             impact = 0.0
 
         memory = MemoryEntry(
-            id=f"memory_{agent.id}_{random.randint(1000, 9999)}",
+            id=f"memory_{agent.id}_{rng.randint(1000, 9999)}",
             summary=summary,
             emotional_tone=emotional_tone,
             agent_involved=other_agent,
@@ -456,58 +469,102 @@ class AdvancedRelationshipManager:
         return memory
 
     def propagate_emotions(self):
-        """Propagate emotions through the social network"""
-        for agent_id, agent in self.game_state.agents.items():
-            if not hasattr(agent, "emotion_state"):
-                agent.emotion_state = {
-                    "hope": 0.5,
-                    "fear": 0.3,
-                    "anger": 0.2,
-                    "despair": 0.1,
-                }
-
-            # Get social circle via social network; if empty fall back to direct relationships
-            social_circle = self.game_state.get_social_circle(agent_id)
-            if not social_circle and getattr(agent, "relationships", None):
-                social_circle = [
-                    (other_id, rel) for other_id, rel in agent.relationships.items()
-                ]
-
-            for other_id, relationship in social_circle:
-                if other_id not in self.game_state.agents:
-                    continue
+        """Propagate emotions through the social network
+
+        One synchronous diffusion step over every relationship (see
+        emotion_diffusion): all drifts are computed from this turn's
+        emotions before any are applied, so the result does not depend on
+        agent or relationship order.
+        """
+        agents = self.game_state.agents
+        agent_ids = sorted(agents)
+        for agent_id in agent_ids:
+            if not hasattr(agents[agent_id], "emotion_state"):
+                agents[agent_id].emotion_state = dict(DEFAULT_EMOTION_STATE)
+        states = [agents[agent_id].emotion_state for agent_id in agent_ids]
+        if len(states) < 2:
+            return
 
-                other_agent = self.game_state.agents[other_id]
-                if not hasattr(other_agent, "emotion_state"):
-                    other_agent.emotion_state = {
-                        "hope": 0.5,
-                        "fear": 0.3,
-                        "anger": 0.2,
-                        "despair": 0.1,
-                    }
+        src, dst, strength = self._emotion_edges(agent_ids)
+        # Minimum influence avoids zero-change corner cases
+        if NUMPY_AVAILABLE:
+            influence = np.maximum(strength * self.emotion_propagation_rate, 0.05)
+            matrix = EmotionMatrix(states)
+            diffuse(matrix, src, dst, influence)
+            matrix.write_back(states)
+        else:
+            edges = [
+                (source, target, max(weight * self.emotion_propagation_rate, 0.05))
+                for source, target, weight in zip(src, dst, strength)
+            ]
+            diffuse_python(states, edges)
+
+    def _emotion_edges(self, agent_ids: List[str]):
+        """Relationship edges between agents, sorted by (source, target)
+
+        Agents without any social network relationships fall back to their
+        own relationships dict. Returns NumPy arrays when available, lists
+        otherwise.
+        """
+        index = {agent_id: i for i, agent_id in enumerate(agent_ids)}
+        connected = set()
+        src: List[int] = []
+        dst: List[int] = []
+        strength: List[float] = []
+        network_edges = None
+
+        network = getattr(self.game_state, "social_network", None)
+        if network is not None and NUMPY_AVAILABLE:
+            network_ids, net_src, net_dst, net_strength = network.get_strength_edges()
+            rows = np.array(
+                [index.get(agent_id, -1) for agent_id in network_ids] or [-1],
+                dtype=np.int64,
+            )
+            net_src = rows[net_src]
+            net_dst = rows[net_dst]
+            connected.update(np.unique(net_src[net_src >= 0]).tolist())
+            keep = (net_src >= 0) & (net_dst >= 0)
+            network_edges = (net_src[keep], net_dst[keep], net_strength[keep])
+        elif network is not None:
+            for row, agent_id in enumerate(agent_ids):
+                circle = self.game_state.get_social_circle(agent_id)
+                if circle:
+                    connected.add(row)
+                for other_id, relationship in circle:
+                    if other_id in index:
+                        src.append(row)
+                        dst.append(index[other_id])
+                        strength.append(relationship.get_strength())
+
+        for row, agent_id in enumerate(agent_ids):
+            if row in connected:
+                continue
+            agent = self.game_state.agents[agent_id]
+            for other_id, relationship in (
+                getattr(agent, "relationships", None) or {}
+            ).items():
+                if other_id in index:
+                    src.append(row)
+                    dst.append(index[other_id])
+                    strength.append(relationship.get_strength())
+
+        if not NUMPY_AVAILABLE:
+            order = sorted(range(len(src)), key=lambda edge: (src[edge], dst[edge]))
+            return (
+                [src[edge] for edge in order],
+                [dst[edge] for edge in order],
+                [strength[edge] for edge in order],
+            )
 
-                # Calculate emotional drift with a minimum influence to avoid zero-change corner-cases
-                influence_raw = (
-                    relationship.get_strength() * self.emotion_propagation_rate
-                )
-                influence = max(influence_raw, 0.05)
-
-                for emotion in agent.emotion_state:
-                    if emotion in other_agent.emotion_state:
-                        diff = (
-                            agent.emotion_state[emotion]
-                            - other_agent.emotion_state[emotion]
-                        )
-                        drift = diff * influence
-                        # Move both toward each other (symmetrical)
-                        other_agent.emotion_state[emotion] = max(
-                            0.0,
-                            min(1.0, other_agent.emotion_state[emotion] + drift),
-                        )
-                        agent.emotion_state[emotion] = max(
-                            0.0,
-                            min(1.0, agent.emotion_state[emotion] - drift * 0.5),
-                        )
+        src = np.array(src, dtype=np.int64)
+        dst = np.array(dst, dtype=np.int64)
+        strength = np.array(strength, dtype=np.float64)
+        if network_edges is not None:
+            src = np.concatenate([network_edges[0], src])
+            dst = np.concatenate([network_edges[1], dst])
+            strength = np.concatenate([network_edges[2], strength])
+        order = np.lexsort((dst, src))
+        return src[order], dst[order], strength[order]
 
     def check_faction_fractures(self):
         """Check for faction fractures due to low cohesion"""
@@ -521,6 +578,7 @@ class AdvancedRelationshipManager:
 
     def _trigger_faction_fracture(self, faction_id: str, faction):
         """Trigger a faction fracture event"""
+        rng = get_rng("advanced_relationships")
         # Get faction agents
         faction_agents = [
             a for a in self.game_state.agents.items() if a[1].faction_id == faction_id
@@ -546,7 +604,7 @@ class AdvancedRelationshipManager:
 
         if len(defectors) > 0:
             # Create new faction
-            new_faction_id = f"{faction_id}_splinter_{random.randint(1000, 9999)}"
+            new_faction_id = f"{faction_id}_splinter_{rng.randint(1000, 9999)}"
             new_faction_name = f"{faction.name} Splinter Group"
 
             # Create new faction object
@@ -568,7 +626,10 @@ class AdvancedRelationshipManager:
 
             # Migrate defectors
             for agent in defectors:
-                agent.faction_id = new_faction_id
+                if hasattr(self.game_state, "set_agent_faction"):
+                    self.game_state.set_agent_faction(agent, new_faction_id)
+                else:
+                    agent.faction_id = new_faction_id
 
                 # Update social tags
                 agent.social_tags.add("defector")
@@ -700,6 +761,7 @@ class AdvancedRelationshipManager:
 
     def create_betrayal_plan(self, agent: Agent, target_agent: Agent) -> BetrayalPlan:
         """Create a betrayal plan for an agent"""
+        rng = get_rng("advanced_relationships")
         # Define trigger conditions
         trigger_conditions = {
             "low_trust": 0.3,
@@ -719,11 +781,11 @@ class AdvancedRelationshipManager:
         plan = BetrayalPlan(
             target_agent=target_agent.id,
             trigger_conditions=trigger_conditions,
-            preferred_timing=random.choice(
+            preferred_timing=rng.choice(
                 ["immediate", "during_mission", "after_success"]
             ),
             potential_co_conspirators=co_conspirators[:3],  # Limit to 3
-            plan_confidence=random.uniform(0.3, 0.8),
+            plan_confidence=rng.uniform(0.3, 0.8),
             created_turn=self.game_state.turn_number,
         )
 
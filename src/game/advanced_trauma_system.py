@@ -6,13 +6,13 @@ Implements persistent, intergenerational trauma and emotional scars that
 affect agents over time and can be passed to future generations.
 """
 
-import random
 import logging
 from enum import Enum
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 from collections import defaultdict
+from .rng import get_rng
 
 logger = logging.getLogger(__name__)
 
@@ -601,7 +601,8 @@ class AdvancedTraumaSystem:
                 family_trauma = self._get_agent_trauma(other_id)
                 if (
                     family_trauma
-                    and random.random() < self.generational_inheritance_chance
+                    and get_rng("trauma").random()
+                    < self.generational_inheritance_chance
                 ):
                     # Create generational trauma
                     generational_trauma = self._create_generational_trauma(
@@ -1,6 +1,7 @@
 from src.game.equipment_enhanced import EnhancedEquipmentManager
 from src.game.equipment_integration import EquipmentIntegrationManager
 from src.game.mission_execution_engine import MissionExecutionEngine
+from src.game.success_estimator import ExecutionSuccessModel, SuccessEstimator
 
 import os
 
@@ -93,6 +94,18 @@ def cli_briefing_risk_analysis(
     print("Risk Assessment:")
     for risk_type, risk_level in analysis.risk_assessment.items():
         print(f"  {risk_type.replace('_', ' ').title()}: {risk_level:.2f}")
+    if agents:
+        # A fresh estimator per briefing: loadouts and missions change the
+        # agents between briefings. The odds leave out loadouts and the
+        # equipment boost above, which launching the mission applies
+        probability, team = SuccessEstimator().best_team(
+            ExecutionSuccessModel(mission, mission.get("location", {})),
+            agents,
+            mission.get("team_size", 3),
+        )
+        print(
+            f"Suggested Team: {', '.join(a.get('name', 'Unknown') for a in team)} ({probability:.1%} before equipment)"
+        )
     input("\nPress Enter to return.")
 
 
@@ -6,8 +6,9 @@ for the Years of Lead insurgency simulator.
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple
-import random
+from typing import Dict, List, Any, Optional, Set, Tuple
+from .profiler import TurnProfiler
+from .rng import RNGService, get_rng, set_rng_service, use_rng_service
 from .entities import (
     GamePhase,
     AgentStatus,
@@ -109,7 +110,8 @@ def agent_post_init(self):
     # Initialize default skills if not present
     if not self.skills:
         for skill_type in SkillType:
-            self.skills[skill_type] = Skill(level=random.randint(1, 3))
+            rng = get_rng("agent", self.id)
+            self.skills[skill_type] = Skill(level=rng.randint(1, 3))
 
     # Initialize social tags and ideology
     self._initialize_social_tags()
@@ -190,7 +192,7 @@ def can_detect_mask(self, other_agent_id: str, empathy_skill: float = 0.5) -> bo
 
     # Higher empathy and stronger relationships make detection more likely
     detection_chance = empathy_skill * relationship.get_strength()
-    return random.random() < detection_chance
+    return get_rng("agent", self.id).random() < detection_chance
 
 
 def update_ideology(self, ideology: str, delta: float):
@@ -479,7 +481,14 @@ Agent.deserialize = classmethod(deserialize)
 class GameState(BaseGameState):
     """Main game state manager"""
 
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        # Seeded per-subsystem random streams; unseeded games keep using the
+        # global random module. Creating a game never uninstalls another
+        # game's streams; see rng_scope()
+        self.rng_service: Optional[RNGService] = None
+        if seed is not None:
+            self.seed_rng(seed)
+
         self.turn_number = 1
         self.current_phase = GamePhase.PLANNING
         self.agents: Dict[str, Agent] = {}
@@ -491,6 +500,10 @@ class GameState(BaseGameState):
         ] = []  # Missions planned for current turn
         self.social_network = SocialNetwork()
         self.recent_narrative: List[str] = []
+
+        # faction_id -> agent ids, refreshed when the agents dict changes
+        self._faction_members: Dict[str, Set[str]] = {}
+        self._faction_index_key: Optional[Tuple[int, int]] = None
         self.active_events: List[str] = []
 
         # Advanced relationship manager
@@ -506,6 +519,33 @@ class GameState(BaseGameState):
 
         self.player_interface = PlayerInterface(self)
 
+        # Per-phase turn timings; disabled until something enables it
+        self.profiler = TurnProfiler()
+
+    def seed_rng(self, seed: int):
+        """Derive every subsystem's random stream from a campaign seed"""
+        self.rng_service = RNGService(seed)
+        set_rng_service(self.rng_service)
+
+    def rng_scope(self):
+        """Context in which get_rng() draws from this game's streams
+
+        Unseeded games get the global random module inside the scope, even
+        when another, seeded game installed its streams.
+        """
+        return use_rng_service(self.rng_service)
+
+    def get_rng_state(self) -> Optional[Dict[str, Any]]:
+        """Serializable state of the random streams, or None if unseeded"""
+        if self.rng_service is None:
+            return None
+        return self.rng_service.get_state()
+
+    def set_rng_state(self, state: Dict[str, Any]):
+        """Restore random streams saved with get_rng_state"""
+        self.rng_service = RNGService.from_state(state)
+        set_rng_service(self.rng_service)
+
     def clear_planned_missions(self):
         """Clear all planned missions for the current turn"""
         self.planned_missions = []
@@ -524,20 +564,22 @@ class GameState(BaseGameState):
 
     def initialize_game(self):
         """Initialize the game with default state"""
-        self._create_default_factions()
-        self._create_default_locations()
-        self._create_default_agents()
-        self._initialize_relationships()
-        self._add_initial_narrative()
+        with self.rng_scope():
+            self._create_default_factions()
+            self._create_default_locations()
+            self._create_default_agents()
+            self._initialize_relationships()
+            self._add_initial_narrative()
 
-        # Initialize advanced relationship mechanics
-        self._initialize_advanced_relationships()
+            # Initialize advanced relationship mechanics
+            self._initialize_advanced_relationships()
 
     def _initialize_advanced_relationships(self):
         """Initialize advanced relationship mechanics"""
         # Generate initial secrets for some agents
         for agent_id, agent in self.agents.items():
-            if random.random() < 0.3:  # 30% chance of having a secret
+            # 30% chance of having a secret
+            if get_rng("advanced_relationships").random() < 0.3:
                 secret = self.advanced_relationships.generate_secret_for_agent(agent)
                 agent.add_secret(secret)
 
@@ -547,6 +589,11 @@ class GameState(BaseGameState):
 
     def advance_turn(self, interactive: bool = True):
         """Advance to the next turn with optional interactive player input"""
+        with self.rng_scope():
+            self._advance_turn(interactive)
+
+    def _advance_turn(self, interactive: bool):
+        """One turn, run with this game's random streams active"""
         # Clear any remaining missions from previous turn
         self.clear_planned_missions()
 
@@ -556,29 +603,38 @@ class GameState(BaseGameState):
         for agent in self.agents.values():
             agent._current_turn = self.turn_number
 
-        if interactive:
-            # Interactive player decision phase
-            self._process_interactive_planning_phase()
-        else:
-            # Automated processing (for testing/simulation)
-            self._process_planning_phase()
+        profiler = self.profiler
+        with profiler.turn(self.turn_number):
+            with profiler.phase("planning"):
+                if interactive:
+                    # Interactive player decision phase
+                    self._process_interactive_planning_phase()
+                else:
+                    # Automated processing (for testing/simulation)
+                    self._process_planning_phase()
 
-        # Process all planned missions
-        self._process_action_phase()
-        self._process_resolution_phase()
+            # Process all planned missions
+            with profiler.phase("action"):
+                self._process_action_phase()
+            with profiler.phase("resolution"):
+                self._process_resolution_phase()
 
-        # Process relationship events
-        self._process_relationship_events()
+            # Process relationship events
+            with profiler.phase("relationship_events"):
+                self._process_relationship_events()
 
-        # Process advanced relationship mechanics
-        self.advanced_relationships.process_turn()
+            # Process advanced relationship mechanics
+            with profiler.phase("advanced_relationships"):
+                self.advanced_relationships.process_turn()
 
-        # Apply relationship decay
-        self.social_network.decay_all_relationships()
+            # Apply this turn's decay (and any events queued since) in one pass
+            with profiler.phase("relationship_updates"):
+                self.social_network.apply_turn_updates(self.turn_number)
 
-        # Update faction resources
-        for faction in self.factions.values():
-            self._update_faction_resources(faction)
+            # Update faction resources
+            with profiler.phase("faction_updates"):
+                for faction in self.factions.values():
+                    self._update_faction_resources(faction)
 
         if interactive:
             # Show turn summary to player
@@ -661,7 +717,8 @@ class GameState(BaseGameState):
 
             # Ensure we have required outcome fields
             if "success" not in outcome:
-                outcome["success"] = random.random() < 0.5  # Fallback success chance
+                # Fallback success chance
+                outcome["success"] = get_rng("missions").random() < 0.5
 
             if "description" not in outcome:
                 if outcome["success"]:
@@ -703,7 +760,7 @@ class GameState(BaseGameState):
             # Basic mission resolution logic
             outcome = {
                 "mission_type": mission.mission_type,
-                "success": random.random() < 0.5,
+                "success": get_rng("missions").random() < 0.5,
                 "description": "Mission completed with standard resolution",
                 "casualties": 0,
             }
@@ -721,7 +778,7 @@ class GameState(BaseGameState):
                 for agent in agents:
                     agent.stress = min(100, agent.stress + 10)
 
-                if random.random() < 0.2:
+                if get_rng("missions").random() < 0.2:
                     outcome["casualties"] = 1
                     for agent in agents:
                         agent.stress = min(100, agent.stress + 15)
@@ -1122,8 +1179,8 @@ class GameState(BaseGameState):
                 faction_id=faction_id,
                 location_id=location_id,
                 background=background,
-                loyalty=random.randint(60, 90),
-                stress=random.randint(10, 30),
+                loyalty=get_rng("setup").randint(60, 90),
+                stress=get_rng("setup").randint(10, 30),
             )
 
     def _initialize_relationships(self):
@@ -1216,7 +1273,8 @@ class GameState(BaseGameState):
                 logger.info(
                     f"Executing mission: {mission.id} with {len(agents)} agents"
                 )
-                outcome = self._execute_mission_with_emotions(mission, agents)
+                with self.profiler.phase("mission_execution"):
+                    outcome = self._execute_mission_with_emotions(mission, agents)
                 mission.outcome = outcome
                 mission.phase = MissionPhase.COMPLETED
 
@@ -1224,15 +1282,16 @@ class GameState(BaseGameState):
                 mission.outcome = outcome
 
                 # Update emotional states based on mission outcome
-                for agent in agents:
-                    emotional_changes = (
-                        self.emotional_state_manager.update_agent_emotions(
-                            agent, outcome
+                with self.profiler.phase("emotion_updates"):
+                    for agent in agents:
+                        emotional_changes = (
+                            self.emotional_state_manager.update_agent_emotions(
+                                agent, outcome
+                            )
                         )
-                    )
-                    if "emotional_impacts" not in outcome:
-                        outcome["emotional_impacts"] = {}
-                    outcome["emotional_impacts"][agent.id] = emotional_changes
+                        if "emotional_impacts" not in outcome:
+                            outcome["emotional_impacts"] = {}
+                        outcome["emotional_impacts"][agent.id] = emotional_changes
 
             except Exception as e:
                 logger.error(
@@ -1289,9 +1348,9 @@ class GameState(BaseGameState):
         for faction in self.factions.values():
             self._update_faction_resources(faction)
 
-        # Apply relationship decay and update social clusters
-        self.social_network.decay_all_relationships()
-        self.social_network.get_social_clusters()
+        # Update social clusters (decay is applied once per turn in advance_turn)
+        with self.profiler.phase("social_clusters"):
+            self.social_network.get_social_clusters()
 
         # Clear planned missions after processing
         self.clear_planned_missions()
@@ -1301,9 +1360,13 @@ class GameState(BaseGameState):
 
         # Random relationship events
         for agent_id, agent in self.agents.items():
-            if random.random() < 0.2:  # 20% chance per agent
+            # 20% chance per agent, drawn from the agent's own stream
+            if get_rng("relationship_events", agent_id).random() < 0.2:
                 self._generate_relationship_event(agent)
 
+        # Apply them as one batch, before the later phases read relationships
+        self.social_network.flush_events()
+
     def _generate_relationship_event(self, agent: Agent):
         """Generate a random relationship event for an agent"""
 
@@ -1314,7 +1377,8 @@ class GameState(BaseGameState):
             return
 
         # Pick a random agent from social circle
-        other_id, relationship = random.choice(social_circle)
+        rng = get_rng("relationship_events", agent.id)
+        other_id, relationship = rng.choice(social_circle)
         other_agent = self.agents.get(other_id)
 
         if not other_agent:
@@ -1324,10 +1388,8 @@ class GameState(BaseGameState):
         event_type = self._select_relationship_event_type(relationship)
 
         if event_type:
-            # Apply event effects
-            self.social_network.update_relationship(
-                agent.id, other_id, event_type=event_type
-            )
+            # Queue event effects; _process_relationship_events applies them
+            self.social_network.queue_event(agent.id, other_id, event_type)
 
             # Generate narrative
             narrative = self._generate_relationship_narrative(
@@ -1344,21 +1406,21 @@ class GameState(BaseGameState):
                 EventType.MENTORSHIP,
                 EventType.LOYALTY_TEST,
             ]
-            return random.choice(positive_events)
+            return get_rng("relationship_events").choice(positive_events)
         elif relationship.is_negative():
             negative_events = [
                 EventType.CONFLICT,
                 EventType.COMPETITION,
                 EventType.ABANDONMENT,
             ]
-            return random.choice(negative_events)
+            return get_rng("relationship_events").choice(negative_events)
         else:
             neutral_events = [
                 EventType.COOPERATION,
                 EventType.CONFLICT,
                 EventType.COMPETITION,
             ]
-            return random.choice(neutral_events)
+            return get_rng("relationship_events").choice(neutral_events)
 
     def _generate_relationship_narrative(
         self, agent_a: Agent, agent_b: Agent, event_type: EventType
@@ -1391,15 +1453,16 @@ class GameState(BaseGameState):
             f"{faction.name} establishes new safe house location",
         ]
 
-        event = random.choice(events)
+        event = get_rng("faction_events", faction.id).choice(events)
         self.recent_narrative.append(event)
 
     def _update_faction_resources(self, faction: Faction):
         """Update faction resources based on activities"""
         # Small random resource changes
-        money_change = random.randint(-10, 20)
-        influence_change = random.randint(-2, 5)
-        personnel_change = random.randint(-1, 2)
+        rng = get_rng("factions", faction.id)
+        money_change = rng.randint(-10, 20)
+        influence_change = rng.randint(-2, 5)
+        personnel_change = rng.randint(-1, 2)
 
         faction.resources["money"] = max(0, faction.resources["money"] + money_change)
         faction.resources["influence"] = max(
@@ -1419,14 +1482,12 @@ class GameState(BaseGameState):
         for faction_id, faction in self.factions.items():
             faction_resources[faction_id] = faction.resources.copy()
 
-        # Calculate faction cohesion
-        faction_cohesion = {}
-        for faction_id, faction in self.factions.items():
-            faction_agents = [
-                a.id for a in self.agents.values() if a.faction_id == faction_id
-            ]
-            cohesion = self.social_network.get_faction_cohesion_index(faction_agents)
-            faction_cohesion[faction_id] = cohesion
+        # Calculate faction cohesion from the cached cohesion index
+        self.refresh_faction_index()
+        faction_cohesion = {
+            faction_id: self.social_network.get_faction_cohesion(faction_id)
+            for faction_id in self.factions
+        }
 
         return {
             "turn": self.turn_number,
@@ -1437,6 +1498,7 @@ class GameState(BaseGameState):
             "faction_cohesion": faction_cohesion,
             "recent_narrative": self.recent_narrative[-10:],  # Last 10 events
             "active_events": self.active_events,
+            "performance": self.profiler.summary(),
         }
 
     def get_agent_locations(self) -> Dict[str, List[str]]:
@@ -1455,7 +1517,42 @@ class GameState(BaseGameState):
 
     def add_agent(self, agent: Agent):
         """Add an agent to the game state"""
+        self.refresh_faction_index()
         self.agents[agent.id] = agent
+        self._faction_members.setdefault(agent.faction_id, set()).add(agent.id)
+        self.social_network.set_agent_faction(agent.id, agent.faction_id)
+        self._faction_index_key = (id(self.agents), len(self.agents))
+
+    def get_faction_members(self, faction_id: str) -> Set[str]:
+        """Get the ids of all agents belonging to a faction"""
+        self.refresh_faction_index()
+        return self._faction_members.get(faction_id, set())
+
+    def set_agent_faction(self, agent: Agent, faction_id: str):
+        """Move an agent to another faction, keeping the faction indexes current"""
+        self.refresh_faction_index()
+        self._faction_members.get(agent.faction_id, set()).discard(agent.id)
+        agent.faction_id = faction_id
+        self._faction_members.setdefault(faction_id, set()).add(agent.id)
+        self.social_network.set_agent_faction(agent.id, faction_id)
+
+    def refresh_faction_index(self, force: bool = False):
+        """Rebuild the faction membership index if the agents dict changed
+
+        Changes made through add_agent() and set_agent_faction() are tracked
+        directly; pass force=True after editing agent.faction_id by hand.
+        """
+        key = (id(self.agents), len(self.agents))
+        if not force and key == self._faction_index_key:
+            return
+
+        self._faction_members = {}
+        for agent in self.agents.values():
+            self._faction_members.setdefault(agent.faction_id, set()).add(agent.id)
+        self.social_network.set_agent_factions(
+            {agent.id: agent.faction_id for agent in self.agents.values()}
+        )
+        self._faction_index_key = key
 
     def update_relationship(
         self,
@@ -1499,7 +1596,5 @@ class GameState(BaseGameState):
 
     def get_faction_cohesion(self, faction_id: str) -> float:
         """Get cohesion index for a faction"""
-        faction_agents = [
-            a.id for a in self.agents.values() if a.faction_id == faction_id
-        ]
-        return self.social_network.get_faction_cohesion_index(faction_agents)
+        self.refresh_faction_index()
+        return self.social_network.get_faction_cohesion(faction_id)
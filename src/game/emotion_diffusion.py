@@ -0,0 +1,111 @@
+"""
+Emotion Diffusion for Years of Lead
+
+Emotions spread along relationships once per turn. Every agent's emotion
+state is laid out as a row of one matrix (columns are emotion names) and a
+single synchronous step moves each pair of related agents toward each other:
+
+    drift        = (source - target) * influence
+    target      += drift
+    source      -= drift * source_share
+
+All drifts of a step are computed from the emotions at the start of the
+step and summed per agent before anything is written, so the result does
+not depend on the order agents or relationships are visited. With NumPy the
+sums are sparse scatter-adds over the edge arrays; without it the same step
+runs over plain dicts.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    NUMPY_AVAILABLE = False
+
+DEFAULT_EMOTION_STATE = {"hope": 0.5, "fear": 0.3, "anger": 0.2, "despair": 0.1}
+
+
+class EmotionMatrix:
+    """Agents' emotion states as an (agents x emotions) matrix
+
+    ``present`` marks which emotions each agent actually has, since agents
+    are not required to share the same emotion keys.
+    """
+
+    def __init__(self, states: Sequence[Dict[str, float]]):
+        self.emotions: List[str] = sorted({name for state in states for name in state})
+        columns = {name: i for i, name in enumerate(self.emotions)}
+        self.values = np.zeros((len(states), len(self.emotions)))
+        self.present = np.zeros((len(states), len(self.emotions)), dtype=bool)
+        for row, state in enumerate(states):
+            for name, value in state.items():
+                self.values[row, columns[name]] = value
+                self.present[row, columns[name]] = True
+
+    def write_back(self, states: Sequence[Dict[str, float]]):
+        """Copy the matrix into the emotion dicts it was built from"""
+        for row, state in enumerate(states):
+            values = self.values[row]
+            for column, name in enumerate(self.emotions):
+                if name in state:
+                    state[name] = float(values[column])
+
+
+def diffuse(
+    matrix: "EmotionMatrix",
+    src: "np.ndarray",
+    dst: "np.ndarray",
+    influence: "np.ndarray",
+    source_share: float = 0.5,
+):
+    """Apply one synchronous diffusion step to ``matrix`` in place
+
+    ``src``/``dst``/``influence`` describe directed edges: the source's
+    emotions pull the target's, and the source moves back by
+    ``source_share`` of that drift. Emotions only flow between agents that
+    both have them. Values are clipped to [0, 1].
+    """
+    if src.size == 0 or not matrix.emotions:
+        return
+
+    values = matrix.values
+    shared = matrix.present[src] & matrix.present[dst]
+    drift = (values[src] - values[dst]) * influence[:, None] * shared
+
+    rows = values.shape[0]
+    delta = np.empty_like(values)
+    for column in range(values.shape[1]):
+        delta[:, column] = np.bincount(
+            dst, weights=drift[:, column], minlength=rows
+        ) - source_share * np.bincount(src, weights=drift[:, column], minlength=rows)
+    np.clip(values + delta, 0.0, 1.0, out=values)
+
+
+def diffuse_python(
+    states: Sequence[Dict[str, float]],
+    edges: Sequence[Tuple[int, int, float]],
+    source_share: float = 0.5,
+):
+    """Pure-Python version of diffuse() over a list of emotion dicts"""
+    deltas: List[Optional[Dict[str, float]]] = [None] * len(states)
+    for source, target, influence in edges:
+        source_state = states[source]
+        target_state = states[target]
+        for name, value in source_state.items():
+            if name not in target_state:
+                continue
+            drift = (value - target_state[name]) * influence
+            if deltas[target] is None:
+                deltas[target] = {}
+            if deltas[source] is None:
+                deltas[source] = {}
+            deltas[target][name] = deltas[target].get(name, 0.0) + drift
+            deltas[source][name] = deltas[source].get(name, 0.0) - drift * source_share
+
+    for state, delta in zip(states, deltas):
+        if delta:
+            for name, change in delta.items():
+                state[name] = max(0.0, min(1.0, state[name] + change))
@@ -6,10 +6,10 @@ tracking how traumatic events and experiences affect their psychological well-be
 Based on Plutchik's Wheel of Emotions with trauma persistence modeling.
 """
 
-import random
 from typing import Dict, Any
 from dataclasses import dataclass
 from copy import deepcopy
+from .rng import get_rng
 
 
 @dataclass
@@ -332,7 +332,7 @@ class EmotionalState:
                 "fearful",
                 "determined",
             ]
-            personality_type = random.choice(personality_types)
+            personality_type = get_rng("emotions").choice(personality_types)
 
         # Reset to neutral first
         self.fear = 0.0
@@ -393,7 +393,7 @@ class EmotionalState:
             "disgust",
         ]:
             current_value = getattr(self, emotion)
-            variation = random.uniform(-0.1, 0.1)
+            variation = get_rng("emotions").uniform(-0.1, 0.1)
             new_value = current_value + variation
             setattr(self, emotion, new_value)
 
@@ -457,7 +457,9 @@ class EmotionalState:
                 current = getattr(self, emotion)
                 # Scale delta by agent's current state (emotions are more volatile when already high)
                 scaled_delta = (
-                    delta * (1.0 - abs(current)) * (0.8 + 0.4 * random.random())
+                    delta
+                    * (1.0 - abs(current))
+                    * (0.8 + 0.4 * get_rng("emotions").random())
                 )
                 new_value = max(-1.0, min(1.0, current + scaled_delta))
                 setattr(self, emotion, new_value)
@@ -469,14 +471,20 @@ class EmotionalState:
                 "success", False
             ):
                 # Recruiting is exciting and builds trust
-                self.joy = min(1.0, self.joy + 0.3 * (0.8 + 0.4 * random.random()))
+                self.joy = min(
+                    1.0, self.joy + 0.3 * (0.8 + 0.4 * get_rng("emotions").random())
+                )
                 changes["joy"] += 0.3
-                self.trust = min(1.0, self.trust + 0.2 * (0.8 + 0.4 * random.random()))
+                self.trust = min(
+                    1.0, self.trust + 0.2 * (0.8 + 0.4 * get_rng("emotions").random())
+                )
                 changes["trust"] += 0.2
 
             if outcome["mission_type"] == "SABOTAGE":
                 # Sabotage can be stressful
-                self.fear = min(1.0, self.fear + 0.2 * (0.8 + 0.4 * random.random()))
+                self.fear = min(
+                    1.0, self.fear + 0.2 * (0.8 + 0.4 * get_rng("emotions").random())
+                )
                 changes["fear"] += 0.2
 
         # Ensure all values are within bounds
@@ -508,12 +516,12 @@ def create_random_emotional_state(
 
     for emotion in emotions:
         # Most emotions start near neutral with some variation
-        value = random.gauss(0.0, 0.3)
+        value = get_rng("emotions").gauss(0.0, 0.3)
         setattr(state, emotion, value)
 
     # Set random trauma level within specified range
     min_trauma, max_trauma = trauma_range
-    state.trauma_level = random.uniform(min_trauma, max_trauma)
+    state.trauma_level = get_rng("emotions").uniform(min_trauma, max_trauma)
 
     state._clamp_values()
     return state
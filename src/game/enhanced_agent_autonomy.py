@@ -6,12 +6,12 @@ faction loyalty, trust, and mission priorities. Agents make independent
 decisions that affect the game world dynamically.
 """
 
-import random
 import logging
 from enum import Enum
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from collections import defaultdict
+from .rng import get_rng
 
 
 logger = logging.getLogger(__name__)
@@ -226,7 +226,7 @@ class EnhancedAgentAutonomySystem:
         if agent.stress > (self.stress_decision_threshold * 100):
             base_prob += 0.3
 
-        return random.random() < base_prob
+        return get_rng("autonomy").random() < base_prob
 
     def _generate_autonomous_decision(
         self, agent, profile: AgentAutonomyProfile
@@ -379,7 +379,7 @@ class EnhancedAgentAutonomySystem:
                     if rel.affinity < -20
                 ]
                 if enemies:
-                    target = random.choice(enemies)
+                    target = get_rng("autonomy").choice(enemies)
                     decisions.append(
                         AutonomousDecision(
                             agent_id=agent.id,
@@ -485,13 +485,13 @@ class EnhancedAgentAutonomySystem:
         # Add some randomness but prefer higher-scored decisions
         if len(scored_decisions) > 1:
             # 70% chance to pick best, 20% second best, 10% others
-            rand = random.random()
+            rand = get_rng("autonomy").random()
             if rand < 0.7:
                 return scored_decisions[0][1]
             elif rand < 0.9 and len(scored_decisions) > 1:
                 return scored_decisions[1][1]
             else:
-                return random.choice(scored_decisions)[1]
+                return get_rng("autonomy").choice(scored_decisions)[1]
 
         return scored_decisions[0][1] if scored_decisions else None
 
@@ -652,7 +652,7 @@ class EnhancedAgentAutonomySystem:
         # Impulsive agents are more likely to proceed despite risk
         proceed_chance += profile.impulsiveness * 0.3
 
-        return random.random() < max(0.0, proceed_chance)
+        return get_rng("autonomy").random() < max(0.0, proceed_chance)
 
     def _execute_autonomous_decision(
         self, decision: AutonomousDecision
@@ -675,7 +675,7 @@ class EnhancedAgentAutonomySystem:
             return outcome
 
         # Roll for success
-        success_roll = random.random()
+        success_roll = get_rng("autonomy").random()
         outcome["success"] = success_roll <= decision.success_probability
 
         # Execute specific action
@@ -736,7 +736,7 @@ class EnhancedAgentAutonomySystem:
         """Execute intelligence gathering action"""
         if outcome["success"]:
             # Generate intelligence value
-            intel_value = random.randint(5, 15)
+            intel_value = get_rng("autonomy").randint(5, 15)
             outcome["effects"]["intelligence_gathered"] = intel_value
             outcome[
                 "narrative"
@@ -773,7 +773,7 @@ class EnhancedAgentAutonomySystem:
             ] = f"{agent.name} wants to build relationships but finds no one available"
             return outcome
 
-        target_agent = random.choice(other_agents)
+        target_agent = get_rng("autonomy").choice(other_agents)
 
         if outcome["success"]:
             # Improve relationship
@@ -786,7 +786,7 @@ class EnhancedAgentAutonomySystem:
                         agent_a_id=agent.id,
                         agent_b_id=target_agent.id,
                         bond_type=BondType.ACQUAINTANCE,
-                        affinity=random.randint(5, 15),
+                        affinity=get_rng("autonomy").randint(5, 15),
                         trust=0.1,
                         loyalty=0.0,
                     )
@@ -794,7 +794,8 @@ class EnhancedAgentAutonomySystem:
                 else:
                     # Improve existing relationship
                     rel = agent.relationships[target_agent.id]
-                    rel.affinity = min(100, rel.affinity + random.randint(5, 10))
+                    boost = get_rng("autonomy").randint(5, 10)
+                    rel.affinity = min(100, rel.affinity + boost)
                     rel.trust = min(1.0, rel.trust + 0.1)
 
             outcome["effects"]["relationship_improved"] = target_agent.id
@@ -6,14 +6,15 @@ Implements continuous intelligence gathering, counter-intelligence operations,
 and pattern analysis for actionable insights.
 """
 
-import random
 import uuid
 import logging
+from bisect import bisect_left, insort
 from enum import Enum
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
+from .rng import get_rng
 
 logger = logging.getLogger(__name__)
 
@@ -120,6 +121,204 @@ class CounterIntelligenceOperation:
     cost: int = 0
 
 
+class StreamingPatternAnalyzer:
+    """Sliding-window pattern detection over real-time intelligence
+
+    Events enter the window when they arrive and leave it when they lose
+    freshness or are dropped. Per-type, per-location and per-source groups,
+    per-location source counters and a time-sorted buffer are updated from
+    the entering or leaving event only. Only groups touched since the last
+    update are re-evaluated, so the cost of each turn follows the number of
+    arriving and expiring events rather than the number stored.
+    """
+
+    TYPE_THRESHOLD = 3
+    LOCATION_THRESHOLD = 4
+    SOURCE_THRESHOLD = 3
+    SEQUENCE_THRESHOLD = 3
+    RAPID_INTERVAL = 3600  # Seconds between events of a rapid sequence
+
+    def __init__(self):
+        self.window: Dict[str, RealTimeIntelEvent] = {}
+        self.by_type: Dict[str, Dict[str, RealTimeIntelEvent]] = defaultdict(dict)
+        self.by_location: Dict[str, Dict[str, RealTimeIntelEvent]] = defaultdict(dict)
+        self.by_source: Dict[
+            IntelligenceSource, Dict[str, RealTimeIntelEvent]
+        ] = defaultdict(dict)
+        self.location_sources: Dict[str, Counter] = defaultdict(Counter)
+
+        # (timestamp, arrival order, event id), kept sorted
+        self.timeline: List[Tuple[datetime, int, str]] = []
+        self._time_keys: Dict[str, Tuple[datetime, int, str]] = {}
+        self._arrivals = 0
+
+        # Active patterns keyed by (pattern type, subject)
+        self.patterns: Dict[Tuple[str, Any], IntelligencePattern] = {}
+        self._dirty_types: Set[str] = set()
+        self._dirty_locations: Set[str] = set()
+        self._timeline_changed = False
+        self._below_minimum = False
+
+    def __contains__(self, event_id: str) -> bool:
+        return event_id in self.window
+
+    def add(self, event: RealTimeIntelEvent):
+        """Add an arriving event to the window"""
+        if event.id in self.window:
+            self.discard(event.id)
+
+        self.window[event.id] = event
+        self.by_type[event.type][event.id] = event
+        self.by_location[event.location][event.id] = event
+        self.by_source[event.source][event.id] = event
+        self.location_sources[event.location][event.source] += 1
+
+        time_key = (event.timestamp, self._arrivals, event.id)
+        self._arrivals += 1
+        insort(self.timeline, time_key)
+        self._time_keys[event.id] = time_key
+
+        self._dirty_types.add(event.type)
+        self._dirty_locations.add(event.location)
+        self._timeline_changed = True
+
+    def discard(self, event_id: str):
+        """Remove an event that expired or was dropped"""
+        event = self.window.pop(event_id, None)
+        if event is None:
+            return
+
+        self.by_type[event.type].pop(event_id, None)
+        self.by_location[event.location].pop(event_id, None)
+        self.by_source[event.source].pop(event_id, None)
+        sources = self.location_sources[event.location]
+        sources[event.source] -= 1
+        if sources[event.source] <= 0:
+            del sources[event.source]
+
+        time_key = self._time_keys.pop(event_id)
+        index = bisect_left(self.timeline, time_key)
+        if index < len(self.timeline) and self.timeline[index] == time_key:
+            del self.timeline[index]
+
+        self._dirty_types.add(event.type)
+        self._dirty_locations.add(event.location)
+        self._timeline_changed = True
+
+    def update(
+        self, builder, min_events: int = 0
+    ) -> Dict[str, List[IntelligencePattern]]:
+        """Re-evaluate changed groups and return the pattern deltas
+
+        ``builder(pattern_type, subject, events)`` creates the pattern for a
+        group that qualifies. No group qualifies while the window holds
+        fewer than ``min_events`` events. Returns lists of "new", "updated"
+        and "expired" patterns; unchanged groups keep their pattern object.
+        """
+        below_minimum = len(self.window) < min_events
+        if below_minimum != self._below_minimum:
+            # Crossing the minimum changes the verdict for every group
+            self._dirty_types.update(self.by_type)
+            self._dirty_locations.update(self.by_location)
+            self._timeline_changed = True
+            self._below_minimum = below_minimum
+
+        candidates: Dict[Tuple[str, Any], List[RealTimeIntelEvent]] = {}
+        checked: Set[Tuple[str, Any]] = set()
+
+        for intel_type in self._dirty_types:
+            key = ("type_clustering", intel_type)
+            checked.add(key)
+            events = list(self.by_type[intel_type].values())
+            if len(events) >= self.TYPE_THRESHOLD:
+                candidates[key] = events
+            if not events:
+                del self.by_type[intel_type]
+
+        for location in self._dirty_locations:
+            focus_key = ("location_focus", location)
+            cross_key = ("multi_source_correlation", location)
+            checked.update((focus_key, cross_key))
+            events = list(self.by_location[location].values())
+            if len(events) >= self.LOCATION_THRESHOLD:
+                candidates[focus_key] = events
+                if len(self.location_sources[location]) >= self.SOURCE_THRESHOLD:
+                    candidates[cross_key] = events
+            if not events:
+                del self.by_location[location]
+                del self.location_sources[location]
+
+        if self._timeline_changed:
+            checked.update(
+                key for key in self.patterns if key[0] == "temporal_clustering"
+            )
+            for sequence in self._rapid_sequences():
+                candidates[("temporal_clustering", sequence[0].id)] = sequence
+
+        self._dirty_types.clear()
+        self._dirty_locations.clear()
+        self._timeline_changed = False
+        if below_minimum:
+            candidates.clear()
+
+        deltas: Dict[str, List[IntelligencePattern]] = {
+            "new": [],
+            "updated": [],
+            "expired": [],
+        }
+        for key in checked:
+            if key not in candidates and key in self.patterns:
+                deltas["expired"].append(self.patterns.pop(key))
+
+        for key, events in candidates.items():
+            current = self.patterns.get(key)
+            event_ids = [e.id for e in events]
+            if current is not None and current.events_involved == event_ids:
+                continue
+
+            pattern = builder(key[0], key[1], events)
+            if current is None:
+                deltas["new"].append(pattern)
+            else:
+                pattern.id = current.id
+                pattern.created_timestamp = current.created_timestamp
+                deltas["updated"].append(pattern)
+            self.patterns[key] = pattern
+
+        return deltas
+
+    def _rapid_sequences(self) -> List[List[RealTimeIntelEvent]]:
+        """Runs of events spaced less than RAPID_INTERVAL apart"""
+        sequences = []
+        current: List[RealTimeIntelEvent] = []
+        previous_time = None
+        for timestamp, _, event_id in self.timeline:
+            if (
+                previous_time is not None
+                and (timestamp - previous_time).total_seconds() >= self.RAPID_INTERVAL
+            ):
+                if len(current) >= self.SEQUENCE_THRESHOLD:
+                    sequences.append(current)
+                current = []
+            current.append(self.window[event_id])
+            previous_time = timestamp
+
+        if len(current) >= self.SEQUENCE_THRESHOLD:
+            sequences.append(current)
+        return sequences
+
+    def active_patterns(self) -> List[IntelligencePattern]:
+        """Active patterns, grouped by pattern type"""
+        order = {
+            "type_clustering": 0,
+            "location_focus": 1,
+            "temporal_clustering": 2,
+            "multi_source_correlation": 3,
+        }
+        keys = sorted(self.patterns, key=lambda key: order.get(key[0], len(order)))
+        return [self.patterns[key] for key in keys]
+
+
 class EnhancedIntelligenceSystem:
     """Enhanced real-time intelligence system"""
 
@@ -131,7 +330,7 @@ class EnhancedIntelligenceSystem:
 
         # System parameters
         self.max_events_stored = 100
-        self.pattern_detection_threshold = 3
+        self.pattern_detection_threshold = 3  # Fresh events needed for patterns
         self.counter_intel_budget = 1000
         self.threat_escalation_threshold = 0.7
 
@@ -145,13 +344,18 @@ class EnhancedIntelligenceSystem:
         self.priority_alerts: List[Dict[str, Any]] = []
         self.actionable_intelligence: List[RealTimeIntelEvent] = []
 
+        # Events fresh enough for pattern analysis, and the pattern changes
+        # produced by the last analysis
+        self.pattern_analyzer = StreamingPatternAnalyzer()
+        self.last_pattern_deltas: Dict[str, List[IntelligencePattern]] = {}
+
         self._initialize_baseline_data()
 
     def _initialize_baseline_data(self):
         """Initialize baseline intelligence data"""
         # Initialize source reliability
         for source in IntelligenceSource:
-            self.source_reliability[source] = random.uniform(0.6, 0.9)
+            self.source_reliability[source] = get_rng("intelligence").uniform(0.6, 0.9)
 
         # Initialize location threat levels
         if hasattr(self.game_state, "locations"):
@@ -175,10 +379,14 @@ class EnhancedIntelligenceSystem:
         # Add new intelligence to the system
         for event in new_intel:
             self.real_time_events.append(event)
+            self.pattern_analyzer.add(event)
 
         # Limit stored events to max capacity
         if len(self.real_time_events) > self.max_events_stored:
-            self.real_time_events = self.real_time_events[-self.max_events_stored :]
+            overflow = len(self.real_time_events) - self.max_events_stored
+            for event in self.real_time_events[:overflow]:
+                self.pattern_analyzer.discard(event.id)
+            self.real_time_events = self.real_time_events[overflow:]
 
         results["new_intelligence"] = new_intel
 
@@ -188,6 +396,7 @@ class EnhancedIntelligenceSystem:
         # Perform pattern analysis
         new_patterns = self._perform_pattern_analysis()
         results["patterns_detected"] = new_patterns
+        results["pattern_deltas"] = self.last_pattern_deltas
 
         # Update threat assessments
         threat_updates = self._update_threat_assessments()
@@ -262,7 +471,7 @@ class EnhancedIntelligenceSystem:
                 )
                 intel_chance += anticipation_bonus
 
-            if random.random() < intel_chance:
+            if get_rng("intelligence").random() < intel_chance:
                 intel_event = self._create_agent_intel_event(agent)
                 if intel_event:
                     intel_events.append(intel_event)
@@ -281,7 +490,7 @@ class EnhancedIntelligenceSystem:
             ("civilian_sentiment", "Public sentiment analysis from local contacts"),
         ]
 
-        intel_type, base_description = random.choice(intel_types)
+        intel_type, base_description = get_rng("intelligence").choice(intel_types)
 
         # Determine reliability based on agent's track record
         base_reliability = 0.7
@@ -291,7 +500,8 @@ class EnhancedIntelligenceSystem:
             base_reliability = success_rate
 
         # Add some randomness
-        reliability = max(0.1, min(1.0, base_reliability + random.uniform(-0.2, 0.2)))
+        jitter = get_rng("intelligence").uniform(-0.2, 0.2)
+        reliability = max(0.1, min(1.0, base_reliability + jitter))
 
         event = RealTimeIntelEvent(
             id=str(uuid.uuid4()),
@@ -325,11 +535,11 @@ class EnhancedIntelligenceSystem:
         ]
 
         # Generate 1-3 technical intel events per turn
-        num_events = random.randint(1, 3)
+        num_events = get_rng("intelligence").randint(1, 3)
 
         for _ in range(num_events):
-            if random.random() < 0.4:  # 40% chance per potential event
-                source_type, description = random.choice(tech_sources)
+            if get_rng("intelligence").random() < 0.4:  # 40% chance per potential event
+                source_type, description = get_rng("intelligence").choice(tech_sources)
 
                 event = RealTimeIntelEvent(
                     id=str(uuid.uuid4()),
@@ -337,8 +547,8 @@ class EnhancedIntelligenceSystem:
                     source=IntelligenceSource.TECHNICAL_RECON,
                     type=source_type,
                     location=self._get_random_location(),
-                    priority=random.choice(["low", "medium", "high"]),
-                    reliability=random.uniform(
+                    priority=get_rng("intelligence").choice(["low", "medium", "high"]),
+                    reliability=get_rng("intelligence").uniform(
                         0.8, 0.95
                     ),  # Technical intel generally reliable
                     content=f"Technical surveillance: {description}",
@@ -365,14 +575,14 @@ class EnhancedIntelligenceSystem:
         ]
 
         # Generate 0-2 human asset events per turn
-        num_events = random.randint(0, 2)
+        num_events = get_rng("intelligence").randint(0, 2)
 
         for _ in range(num_events):
-            if random.random() < 0.3:  # 30% chance per potential event
-                asset_type, description = random.choice(asset_types)
+            if get_rng("intelligence").random() < 0.3:  # 30% chance per potential event
+                asset_type, description = get_rng("intelligence").choice(asset_types)
 
                 # Human assets have variable reliability
-                reliability = random.uniform(0.5, 0.9)
+                reliability = get_rng("intelligence").uniform(0.5, 0.9)
 
                 event = RealTimeIntelEvent(
                     id=str(uuid.uuid4()),
@@ -380,7 +590,7 @@ class EnhancedIntelligenceSystem:
                     source=IntelligenceSource.HUMAN_ASSETS,
                     type=asset_type,
                     location=self._get_random_location(),
-                    priority=random.choice(["medium", "high"]),
+                    priority=get_rng("intelligence").choice(["medium", "high"]),
                     reliability=reliability,
                     content=f"Human asset report: {description}",
                     raw_data={
@@ -405,11 +615,11 @@ class EnhancedIntelligenceSystem:
         ]
 
         # Generate 0-1 signal intel events per turn
-        if random.random() < 0.25:  # 25% chance per turn
-            signal_type, description = random.choice(signal_types)
+        if get_rng("intelligence").random() < 0.25:  # 25% chance per turn
+            signal_type, description = get_rng("intelligence").choice(signal_types)
 
             # Signal intel reliability depends on encryption/security
-            reliability = random.uniform(0.6, 0.85)
+            reliability = get_rng("intelligence").uniform(0.6, 0.85)
 
             event = RealTimeIntelEvent(
                 id=str(uuid.uuid4()),
@@ -417,7 +627,7 @@ class EnhancedIntelligenceSystem:
                 source=IntelligenceSource.SIGNAL_INTERCEPT,
                 type=signal_type,
                 location=self._get_random_location(),
-                priority=random.choice(["high", "critical"]),
+                priority=get_rng("intelligence").choice(["high", "critical"]),
                 reliability=reliability,
                 content=f"Signal intelligence: {description}",
                 raw_data={"signal_type": signal_type},
@@ -430,223 +640,150 @@ class EnhancedIntelligenceSystem:
     def _get_random_location(self) -> str:
         """Get a random location from available locations"""
         if hasattr(self.game_state, "locations") and self.game_state.locations:
-            return random.choice(list(self.game_state.locations.keys()))
+            locations = list(self.game_state.locations.keys())
+            return get_rng("intelligence").choice(locations)
         return "unknown_location"
 
     def _update_intelligence_freshness(self):
         """Update freshness of existing intelligence"""
         for event in self.real_time_events:
             event.update_freshness(1.0)  # 1 turn passed
+            if event.freshness <= 0.5 and event.id in self.pattern_analyzer:
+                self.pattern_analyzer.discard(event.id)
 
         # Remove stale intelligence
         self.real_time_events = [e for e in self.real_time_events if not e.is_stale()]
 
     def _perform_pattern_analysis(self) -> List[IntelligencePattern]:
-        """Perform pattern analysis on collected intelligence"""
-        new_patterns = []
-
-        # Collect recent events for analysis
-        recent_events = [e for e in self.real_time_events if e.freshness > 0.5]
-
-        if len(recent_events) < self.pattern_detection_threshold:
-            return new_patterns
-
-        # Analyze patterns by type
-        type_patterns = self._analyze_type_patterns(recent_events)
-        new_patterns.extend(type_patterns)
-
-        # Analyze location patterns
-        location_patterns = self._analyze_location_patterns(recent_events)
-        new_patterns.extend(location_patterns)
-
-        # Analyze temporal patterns
-        temporal_patterns = self._analyze_temporal_patterns(recent_events)
-        new_patterns.extend(temporal_patterns)
-
-        # Cross-reference patterns
-        cross_patterns = self._analyze_cross_reference_patterns(recent_events)
-        new_patterns.extend(cross_patterns)
-
-        return new_patterns
-
-    def _analyze_type_patterns(
-        self, events: List[RealTimeIntelEvent]
-    ) -> List[IntelligencePattern]:
-        """Analyze patterns by intelligence type"""
-        patterns = []
-
-        # Group events by type
-        type_groups = defaultdict(list)
-        for event in events:
-            type_groups[event.type].append(event)
-
-        for intel_type, type_events in type_groups.items():
-            if len(type_events) >= 3:  # Pattern threshold
-                confidence = min(0.9, len(type_events) * 0.2)
-
-                pattern = IntelligencePattern(
-                    id=str(uuid.uuid4()),
-                    pattern_type="type_clustering",
-                    events_involved=[e.id for e in type_events],
-                    confidence=confidence,
-                    description=f"Increased {intel_type} activity detected",
-                    implications=[
-                        f"Government may be escalating {intel_type} operations",
-                        "Possible security crackdown incoming",
-                        "Need to adjust operational security",
-                    ],
-                    recommended_actions=[
-                        f"Increase monitoring of {intel_type} activities",
-                        "Review security protocols",
-                        "Prepare contingency plans",
-                    ],
-                    threat_assessment=self._assess_pattern_threat(type_events),
-                    created_timestamp=datetime.now(),
-                    last_updated=datetime.now(),
-                )
-
-                patterns.append(pattern)
-
-        return patterns
-
-    def _analyze_location_patterns(
-        self, events: List[RealTimeIntelEvent]
-    ) -> List[IntelligencePattern]:
-        """Analyze patterns by location"""
-        patterns = []
-
-        # Group events by location
-        location_groups = defaultdict(list)
-        for event in events:
-            location_groups[event.location].append(event)
-
-        for location, location_events in location_groups.items():
-            if len(location_events) >= 4:  # Higher threshold for location patterns
-                confidence = min(0.85, len(location_events) * 0.15)
-
-                pattern = IntelligencePattern(
-                    id=str(uuid.uuid4()),
-                    pattern_type="location_focus",
-                    events_involved=[e.id for e in location_events],
-                    confidence=confidence,
-                    description=f"Concentrated activity in {location}",
-                    implications=[
-                        f"{location} is becoming a focus of attention",
-                        "Possible government operation planned",
-                        "Agents in area may be at risk",
-                    ],
-                    recommended_actions=[
-                        f"Increase security measures in {location}",
-                        "Consider relocating assets",
-                        "Deploy counter-surveillance",
-                    ],
-                    threat_assessment=ThreatLevel.HIGH,
-                    created_timestamp=datetime.now(),
-                    last_updated=datetime.now(),
-                )
-
-                patterns.append(pattern)
-
-        return patterns
-
-    def _analyze_temporal_patterns(
-        self, events: List[RealTimeIntelEvent]
-    ) -> List[IntelligencePattern]:
-        """Analyze temporal patterns in intelligence"""
-        patterns = []
-
-        # Sort events by timestamp
-        sorted_events = sorted(events, key=lambda e: e.timestamp)
-
-        # Look for rapid succession of events (potential operations)
-        rapid_sequences = []
-        current_sequence = [sorted_events[0]] if sorted_events else []
-
-        for i in range(1, len(sorted_events)):
-            time_diff = (
-                sorted_events[i].timestamp - sorted_events[i - 1].timestamp
-            ).total_seconds()
+        """Update patterns from events that arrived or expired since last turn
 
-            if time_diff < 3600:  # Within 1 hour (rapid succession)
-                current_sequence.append(sorted_events[i])
-            else:
-                if len(current_sequence) >= 3:
-                    rapid_sequences.append(current_sequence)
-                current_sequence = [sorted_events[i]]
-
-        # Check final sequence
-        if len(current_sequence) >= 3:
-            rapid_sequences.append(current_sequence)
-
-        for sequence in rapid_sequences:
-            pattern = IntelligencePattern(
-                id=str(uuid.uuid4()),
-                pattern_type="temporal_clustering",
-                events_involved=[e.id for e in sequence],
-                confidence=0.8,
-                description=f"Rapid sequence of {len(sequence)} intelligence events",
-                implications=[
-                    "Possible coordinated government operation",
-                    "Intelligence gathering surge detected",
-                    "Heightened alert status warranted",
-                ],
-                recommended_actions=[
-                    "Implement emergency protocols",
-                    "Increase communication security",
-                    "Prepare for possible raids",
-                ],
-                threat_assessment=ThreatLevel.HIGH,
-                created_timestamp=datetime.now(),
-                last_updated=datetime.now(),
-            )
-
-            patterns.append(pattern)
-
-        return patterns
-
-    def _analyze_cross_reference_patterns(
-        self, events: List[RealTimeIntelEvent]
-    ) -> List[IntelligencePattern]:
-        """Analyze cross-referenced patterns between different sources"""
-        patterns = []
-
-        # Group by source
-        source_groups = defaultdict(list)
-        for event in events:
-            source_groups[event.source].append(event)
+        Returns every active pattern; the new, updated and expired patterns
+        are kept in last_pattern_deltas.
+        """
+        self.last_pattern_deltas = self.pattern_analyzer.update(
+            self._build_pattern, self.pattern_detection_threshold
+        )
+        self.intelligence_patterns = self.pattern_analyzer.active_patterns()
+        return self.intelligence_patterns
+
+    def _build_pattern(
+        self, pattern_type: str, subject: Any, events: List[RealTimeIntelEvent]
+    ) -> IntelligencePattern:
+        """Create the pattern for a group of events"""
+        if pattern_type == "type_clustering":
+            return self._type_pattern(subject, events)
+        if pattern_type == "location_focus":
+            return self._location_pattern(subject, events)
+        if pattern_type == "temporal_clustering":
+            return self._temporal_pattern(events)
+        return self._cross_reference_pattern(subject, events)
+
+    def _type_pattern(
+        self, intel_type: str, type_events: List[RealTimeIntelEvent]
+    ) -> IntelligencePattern:
+        """Pattern for a cluster of events of one intelligence type"""
+        confidence = min(0.9, len(type_events) * 0.2)
+
+        return IntelligencePattern(
+            id=str(uuid.uuid4()),
+            pattern_type="type_clustering",
+            events_involved=[e.id for e in type_events],
+            confidence=confidence,
+            description=f"Increased {intel_type} activity detected",
+            implications=[
+                f"Government may be escalating {intel_type} operations",
+                "Possible security crackdown incoming",
+                "Need to adjust operational security",
+            ],
+            recommended_actions=[
+                f"Increase monitoring of {intel_type} activities",
+                "Review security protocols",
+                "Prepare contingency plans",
+            ],
+            threat_assessment=self._assess_pattern_threat(type_events),
+            created_timestamp=datetime.now(),
+            last_updated=datetime.now(),
+        )
 
-        # Look for corroborating intelligence from multiple sources
-        for location in set(e.location for e in events):
-            location_events = [e for e in events if e.location == location]
-            source_types = set(e.source for e in location_events)
+    def _location_pattern(
+        self, location: str, location_events: List[RealTimeIntelEvent]
+    ) -> IntelligencePattern:
+        """Pattern for concentrated activity in one location"""
+        confidence = min(0.85, len(location_events) * 0.15)
 
-            if len(source_types) >= 3 and len(location_events) >= 4:
-                confidence = min(0.95, len(source_types) * 0.25)
+        return IntelligencePattern(
+            id=str(uuid.uuid4()),
+            pattern_type="location_focus",
+            events_involved=[e.id for e in location_events],
+            confidence=confidence,
+            description=f"Concentrated activity in {location}",
+            implications=[
+                f"{location} is becoming a focus of attention",
+                "Possible government operation planned",
+                "Agents in area may be at risk",
+            ],
+            recommended_actions=[
+                f"Increase security measures in {location}",
+                "Consider relocating assets",
+                "Deploy counter-surveillance",
+            ],
+            threat_assessment=ThreatLevel.HIGH,
+            created_timestamp=datetime.now(),
+            last_updated=datetime.now(),
+        )
 
-                pattern = IntelligencePattern(
-                    id=str(uuid.uuid4()),
-                    pattern_type="multi_source_correlation",
-                    events_involved=[e.id for e in location_events],
-                    confidence=confidence,
-                    description=f"Multiple sources confirm activity in {location}",
-                    implications=[
-                        "High confidence intelligence correlation",
-                        f"Significant operations likely in {location}",
-                        "Cross-source verification achieved",
-                    ],
-                    recommended_actions=[
-                        "Prioritize intelligence from this area",
-                        "Deploy additional assets for confirmation",
-                        "Prepare operational response",
-                    ],
-                    threat_assessment=ThreatLevel.CRITICAL,
-                    created_timestamp=datetime.now(),
-                    last_updated=datetime.now(),
-                )
+    def _temporal_pattern(
+        self, sequence: List[RealTimeIntelEvent]
+    ) -> IntelligencePattern:
+        """Pattern for a rapid succession of events (potential operations)"""
+        return IntelligencePattern(
+            id=str(uuid.uuid4()),
+            pattern_type="temporal_clustering",
+            events_involved=[e.id for e in sequence],
+            confidence=0.8,
+            description=f"Rapid sequence of {len(sequence)} intelligence events",
+            implications=[
+                "Possible coordinated government operation",
+                "Intelligence gathering surge detected",
+                "Heightened alert status warranted",
+            ],
+            recommended_actions=[
+                "Implement emergency protocols",
+                "Increase communication security",
+                "Prepare for possible raids",
+            ],
+            threat_assessment=ThreatLevel.HIGH,
+            created_timestamp=datetime.now(),
+            last_updated=datetime.now(),
+        )
 
-                patterns.append(pattern)
+    def _cross_reference_pattern(
+        self, location: str, location_events: List[RealTimeIntelEvent]
+    ) -> IntelligencePattern:
+        """Pattern for one location corroborated by multiple sources"""
+        source_types = set(e.source for e in location_events)
+        confidence = min(0.95, len(source_types) * 0.25)
 
-        return patterns
+        return IntelligencePattern(
+            id=str(uuid.uuid4()),
+            pattern_type="multi_source_correlation",
+            events_involved=[e.id for e in location_events],
+            confidence=confidence,
+            description=f"Multiple sources confirm activity in {location}",
+            implications=[
+                "High confidence intelligence correlation",
+                f"Significant operations likely in {location}",
+                "Cross-source verification achieved",
+            ],
+            recommended_actions=[
+                "Prioritize intelligence from this area",
+                "Deploy additional assets for confirmation",
+                "Prepare operational response",
+            ],
+            threat_assessment=ThreatLevel.CRITICAL,
+            created_timestamp=datetime.now(),
+            last_updated=datetime.now(),
+        )
 
     def _assess_pattern_threat(self, events: List[RealTimeIntelEvent]) -> ThreatLevel:
         """Assess threat level for a pattern"""
@@ -769,7 +906,7 @@ class EnhancedIntelligenceSystem:
         """Resolve a completed counter-intelligence operation"""
 
         # Roll for success
-        success_roll = random.random()
+        success_roll = get_rng("intelligence").random()
         success = success_roll <= op.success_probability
 
         result = {
@@ -789,7 +926,7 @@ class EnhancedIntelligenceSystem:
             # Generate specific results based on operation type
             if op.operation_type == CounterIntelOp.SURVEILLANCE_DETECTION:
                 # Detect enemy surveillance
-                detected_surveillance = random.randint(1, 3)
+                detected_surveillance = get_rng("intelligence").randint(1, 3)
                 result["threats_discovered"] = [
                     f"surveillance_team_{i}" for i in range(detected_surveillance)
                 ]
@@ -797,7 +934,8 @@ class EnhancedIntelligenceSystem:
 
             elif op.operation_type == CounterIntelOp.MOLE_HUNT:
                 # Search for internal threats
-                if random.random() < 0.3:  # 30% chance of finding something
+                # 30% chance of finding something
+                if get_rng("intelligence").random() < 0.3:
                     result["threats_discovered"] = ["potential_mole_identified"]
                     result["intelligence_gained"] = [
                         "Internal security breach detected"
@@ -810,7 +948,7 @@ class EnhancedIntelligenceSystem:
 
             elif op.operation_type == CounterIntelOp.SECURITY_AUDIT:
                 # Security assessment
-                vulnerabilities = random.randint(2, 5)
+                vulnerabilities = get_rng("intelligence").randint(2, 5)
                 result["vulnerabilities_found"] = vulnerabilities
                 result["security_improved"] = True
         else:
@@ -831,21 +969,21 @@ class EnhancedIntelligenceSystem:
         ]
 
         for location in high_threat_locations[:2]:  # Limit to 2 new ops per turn
-            if random.random() < 0.4:  # 40% chance to launch op
-                op_type = random.choice(list(CounterIntelOp))
+            if get_rng("intelligence").random() < 0.4:  # 40% chance to launch op
+                op_type = get_rng("intelligence").choice(list(CounterIntelOp))
 
                 new_op = CounterIntelligenceOperation(
                     id=str(uuid.uuid4()),
                     operation_type=op_type,
                     target=location,
                     status="active",
-                    effectiveness=random.uniform(0.6, 0.9),
+                    effectiveness=get_rng("intelligence").uniform(0.6, 0.9),
                     resources_committed={
-                        "agents": random.randint(1, 3),
-                        "budget": random.randint(100, 500),
+                        "agents": get_rng("intelligence").randint(1, 3),
+                        "budget": get_rng("intelligence").randint(100, 500),
                     },
-                    duration=random.randint(2, 5),
-                    success_probability=random.uniform(0.5, 0.8),
+                    duration=get_rng("intelligence").randint(2, 5),
+                    success_probability=get_rng("intelligence").uniform(0.5, 0.8),
                 )
 
                 new_ops.append(new_op)
@@ -6,12 +6,12 @@ Implements contextual narrative generation based on agent interactions,
 emotional states, and factional dynamics with emergent plotlines.
 """
 
-import random
 import logging
 from enum import Enum
 from typing import Dict, List, Any, Optional, Tuple, Set
 from dataclasses import dataclass, field
 from collections import defaultdict
+from .rng import get_rng
 
 logger = logging.getLogger(__name__)
 
@@ -296,7 +296,7 @@ class EnhancedDynamicNarrativeSystem:
         current_turn = getattr(self.game_state, "turn_number", 1)
 
         # Check for new narrative triggers
-        if random.random() < self.narrative_frequency:
+        if get_rng("narrative").random() < self.narrative_frequency:
             new_arcs = self._check_for_narrative_triggers(current_turn)
             results["new_arcs"] = new_arcs
 
@@ -513,7 +513,7 @@ class EnhancedDynamicNarrativeSystem:
 
             # Check if arc should advance
             advancement_chance = self._calculate_arc_advancement_chance(arc)
-            if random.random() < advancement_chance:
+            if get_rng("narrative").random() < advancement_chance:
                 # Advance the arc
                 old_stage = arc.current_stage
                 arc.advance_stage()
@@ -599,7 +599,7 @@ class EnhancedDynamicNarrativeSystem:
         templates = story_templates.get(
             arc.arc_type, [f"The story continues for {', '.join(agent_names)}"]
         )
-        description = random.choice(templates)
+        description = get_rng("narrative").choice(templates)
 
         return {
             "stage": arc.current_stage,
@@ -851,7 +851,7 @@ class EnhancedDynamicNarrativeSystem:
 
             # Generate development event
             development_chance = 0.4  # 40% chance per turn
-            if random.random() < development_chance:
+            if get_rng("narrative").random() < development_chance:
                 event = self._generate_plotline_development(plotline, current_turn)
                 plotline.add_story_event(event)
 
@@ -886,7 +886,7 @@ class EnhancedDynamicNarrativeSystem:
         templates = development_templates.get(
             plotline.plotline_type, ["The situation continues to develop"]
         )
-        description = random.choice(templates)
+        description = get_rng("narrative").choice(templates)
 
         return {
             "turn": current_turn,
@@ -12,10 +12,12 @@ This system coordinates all enhanced features into a unified simulation experien
 """
 
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from .turn_history import TurnHistory
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,12 +36,75 @@ class SimulationTurn:
     system_synergies: List[Dict[str, Any]] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class SubsystemStage:
+    """One subsystem step of an enhanced turn
+
+    The stages run one after another in declared order: each one reads the
+    agents the previous stages changed.
+    """
+
+    name: str
+    system: str  # EnhancedSimulationIntegration attribute holding the system
+    method: str
+    result_field: str  # SimulationTurn field receiving the result dict
+    log_key: str
+    log_unit: str = "events"
+
+
+# Subsystem steps in their sequential order
+SUBSYSTEM_STAGES = (
+    SubsystemStage(
+        "autonomy",
+        "autonomy_system",
+        "process_autonomous_decisions",
+        "autonomy_results",
+        log_key="decisions_made",
+        log_unit="decisions",
+    ),
+    SubsystemStage(
+        "intelligence",
+        "intelligence_system",
+        "process_real_time_intelligence",
+        "intelligence_results",
+        log_key="new_intelligence",
+    ),
+    SubsystemStage(
+        "narrative",
+        "narrative_system",
+        "process_dynamic_narrative",
+        "narrative_results",
+        log_key="story_events",
+    ),
+    SubsystemStage(
+        "trauma",
+        "trauma_system",
+        "process_trauma_system",
+        "trauma_results",
+        log_key="new_trauma_events",
+    ),
+)
+
+
 class EnhancedSimulationIntegration:
     """Main integration system for all enhanced simulation features"""
 
-    def __init__(self, game_state):
+    def __init__(
+        self,
+        game_state,
+        history_capacity: int = 100,
+        history_path: Optional[str] = None,
+    ):
         self.game_state = game_state
-        self.turn_history: List[SimulationTurn] = []
+
+        # Recent turns stay in memory; older ones, with their performance
+        # metrics, are streamed to a JSON Lines log (see TurnHistory)
+        self.turn_history = TurnHistory(
+            SimulationTurn,
+            capacity=history_capacity,
+            spill_path=history_path,
+            on_spill=self._spill_turn_metrics,
+        )
 
         # Initialize all enhanced systems
         self.initialize_enhanced_systems()
@@ -49,9 +114,9 @@ class EnhancedSimulationIntegration:
         self.cross_system_impact_modifier = 0.3
         self.emergent_complexity_enabled = True
 
-        # Performance tracking
+        # Performance tracking, for the turns still held in memory
         self.system_performance: Dict[str, Dict[str, Any]] = {}
-        self.integration_metrics: Dict[str, float] = {}
+        self.integration_metrics: Dict[str, Dict[str, float]] = {}
 
         logger.info("Enhanced Simulation Integration System initialized")
 
@@ -121,32 +186,9 @@ class EnhancedSimulationIntegration:
 
         logger.info(f"Processing enhanced turn {current_turn}")
 
-        # Process each enhanced system
-        if self.autonomy_system:
-            turn.autonomy_results = self.autonomy_system.process_autonomous_decisions()
-            logger.debug(
-                f"Autonomy system processed: {len(turn.autonomy_results.get('decisions_made', []))} decisions"
-            )
-
-        if self.intelligence_system:
-            turn.intelligence_results = (
-                self.intelligence_system.process_real_time_intelligence()
-            )
-            logger.debug(
-                f"Intelligence system processed: {len(turn.intelligence_results.get('new_intelligence', []))} events"
-            )
-
-        if self.narrative_system:
-            turn.narrative_results = self.narrative_system.process_dynamic_narrative()
-            logger.debug(
-                f"Narrative system processed: {len(turn.narrative_results.get('story_events', []))} events"
-            )
-
-        if self.trauma_system:
-            turn.trauma_results = self.trauma_system.process_trauma_system()
-            logger.debug(
-                f"Trauma system processed: {len(turn.trauma_results.get('new_trauma_events', []))} events"
-            )
+        # Process each enhanced system in turn
+        for stage in SUBSYSTEM_STAGES:
+            self._run_subsystem(turn, stage)
 
         # Process cross-system integration
         turn.integration_events = self._process_cross_system_integration(turn)
@@ -168,6 +210,23 @@ class EnhancedSimulationIntegration:
 
         return turn
 
+    def _run_subsystem(self, turn: SimulationTurn, stage: SubsystemStage):
+        """Run one subsystem, if available, and store its result on the turn"""
+        system = getattr(self, stage.system)
+        if not system:
+            return
+
+        result = getattr(system, stage.method)()
+        setattr(turn, stage.result_field, result)
+        logger.debug(
+            f"{stage.name.title()} system processed: "
+            f"{len(result.get(stage.log_key, []))} {stage.log_unit}"
+        )
+
+    def close(self):
+        """Close the turn history log"""
+        self.turn_history.close()
+
     def _process_cross_system_integration(
         self, turn: SimulationTurn
     ) -> List[Dict[str, Any]]:
@@ -576,6 +635,41 @@ class EnhancedSimulationIntegration:
             ),
         }
 
+    def _spill_turn_metrics(self, turn: SimulationTurn) -> Dict[str, Any]:
+        """Move a turn's metrics out of memory along with the turn itself"""
+        key = f"turn_{turn.turn_number}"
+        return {
+            "system_performance": self.system_performance.pop(key, {}),
+            "integration_metrics": self.integration_metrics.pop(key, {}),
+        }
+
+    def get_turn(self, turn_number: int) -> Optional[SimulationTurn]:
+        """Look up a processed turn, whether in memory or spilled to disk"""
+        return self.turn_history.find(turn_number)
+
+    def get_turn_metrics(self, turn_number: int) -> Dict[str, Any]:
+        """System performance and integration metrics of a processed turn"""
+        key = f"turn_{turn_number}"
+        if key in self.system_performance or key in self.integration_metrics:
+            return {
+                "system_performance": self.system_performance.get(key, {}),
+                "integration_metrics": self.integration_metrics.get(key, {}),
+            }
+
+        record = self.turn_history.find_record(turn_number)
+        if record is None:
+            return {}
+        return {
+            "system_performance": record.get("system_performance", {}),
+            "integration_metrics": record.get("integration_metrics", {}),
+        }
+
+    def iter_turns(
+        self, start: Optional[int] = None, end: Optional[int] = None
+    ) -> Iterator[SimulationTurn]:
+        """Processed turns with turn numbers in [start, end], oldest first"""
+        return self.turn_history.turns(start, end)
+
     def _calculate_autonomy_success_rate(
         self, autonomy_results: Dict[str, Any]
     ) -> float:
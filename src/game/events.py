@@ -3,10 +3,13 @@ Event management system for Years of Lead
 Handles event dispatching, listeners, and event processing
 """
 
-from typing import Dict, List, Any, Callable, Optional
+from typing import Dict, List, Any, Callable, Optional, Tuple
+from string import Formatter
 import time
 from loguru import logger
 
+from .rng import get_rng
+
 
 class EventManager:
     """
@@ -189,6 +192,66 @@ class EventTypes:
     SYMBOLIC_PATTERN_DETECTED = "symbolic.pattern.detected"
 
 
+class RenderPlan:
+    """
+    A template string parsed once into literal segments and variable slots.
+
+    ``literals`` always has one more entry than ``fields``; rendering
+    interleaves them. A plan with ``fields`` set to None could not be
+    parsed as a plain format string and renders with its braces stripped.
+    """
+
+    __slots__ = ("template", "literals", "fields")
+
+    def __init__(
+        self,
+        template: str,
+        literals: Tuple[str, ...],
+        fields: Optional[Tuple[str, ...]],
+    ):
+        self.template = template
+        self.literals = literals
+        self.fields = fields
+
+    @classmethod
+    def compile(cls, template: str) -> "RenderPlan":
+        """Parse a template into a render plan"""
+        literals = []
+        fields = []
+        pending = ""
+        try:
+            for literal, field, spec, conversion in Formatter().parse(template):
+                pending += literal
+                if field is None:
+                    continue
+                if spec or conversion or not field.isidentifier():
+                    # Resolvers only fill plain names, not attribute access,
+                    # indexing or format specs
+                    return cls.unparsed(template)
+                literals.append(pending)
+                fields.append(field)
+                pending = ""
+        except ValueError:
+            return cls.unparsed(template)
+        literals.append(pending)
+        return cls(template, tuple(literals), tuple(fields))
+
+    @classmethod
+    def unparsed(cls, template: str) -> "RenderPlan":
+        """Plan for a malformed template: render it with braces stripped"""
+        return cls(template, (template.replace("{", "").replace("}", ""),), None)
+
+    def render(self, values: Dict[str, Any]) -> str:
+        """Fill the slots from ``values`` (keyed by field name)"""
+        if not self.fields:
+            return self.literals[0]
+        parts = [self.literals[0]]
+        for field, literal in zip(self.fields, self.literals[1:]):
+            parts.append(format(values[field]))
+            parts.append(literal)
+        return "".join(parts)
+
+
 class EventSystem:
     """
     Narrative event generation system for Years of Lead.
@@ -201,6 +264,7 @@ class EventSystem:
         """Initialize the event system"""
         self.game_state = game_state
         self.event_templates = self._initialize_event_templates()
+        self.render_plans = self._compile_render_plans(self.event_templates)
         self.recent_events = []
         self.recently_used_templates = (
             []
@@ -249,6 +313,10 @@ class EventSystem:
             "trainer_name": ["a veteran", "an experienced agent", "your mentor"],
         }
 
+        # Name pools read from the game state, rebuilt once per turn
+        self._state_pools: Dict[str, List[str]] = {}
+        self._state_pools_turn = None
+
     def _initialize_event_templates(self) -> Dict[str, List[Dict[str, Any]]]:
         """Initialize event templates for different contexts"""
         return {
@@ -725,6 +793,18 @@ class EventSystem:
             ],
         }
 
+    def _compile_render_plans(
+        self, event_templates: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, RenderPlan]:
+        """Parse every template description into a render plan up front"""
+        plans = {}
+        for templates in event_templates.values():
+            for template in templates:
+                description = template.get("description")
+                if description is not None and description not in plans:
+                    plans[description] = RenderPlan.compile(description)
+        return plans
+
     def generate_event(
         self, event_category: str, context: Dict[str, Any] = None
     ) -> Optional[Dict[str, Any]]:
@@ -758,9 +838,7 @@ class EventSystem:
             ]
 
         # Select a template that hasn't been recently used
-        import random
-
-        selected_index, template = random.choice(available_templates)
+        selected_index, template = get_rng("events").choice(available_templates)
 
         # Track this template as recently used
         self.recently_used_templates.append(selected_index)
@@ -832,15 +910,9 @@ class EventSystem:
         """Resolve agent name with fallbacks"""
         if self.game_state and self.game_state.agents:
             # Try to get a random active agent
-            active_agents = [
-                agent
-                for agent in self.game_state.agents.values()
-                if agent.status.value == "active"
-            ]
+            active_agents = self._state_pool("active_agents", self._active_agent_names)
             if active_agents:
-                import random
-
-                return random.choice(active_agents).name
+                return get_rng("events").choice(active_agents)
 
         # Fallback to context or default
         return context.get("agent_name", self._get_random_fallback("agent_name"))
@@ -849,19 +921,9 @@ class EventSystem:
         """Resolve cell leader with fallbacks"""
         if self.game_state and self.game_state.agents:
             # Look for agents with leadership roles or high skills
-            potential_leaders = []
-            for agent in self.game_state.agents.values():
-                if (
-                    agent.status.value == "active"
-                    and hasattr(agent.skills, "get")
-                    and agent.skills.get("persuasion", 0).level > 2
-                ):
-                    potential_leaders.append(agent.name)
-
+            potential_leaders = self._state_pool("leaders", self._leader_names)
             if potential_leaders:
-                import random
-
-                return random.choice(potential_leaders)
+                return get_rng("events").choice(potential_leaders)
 
         return context.get("cell_leader", "your cell leader")
 
@@ -869,33 +931,27 @@ class EventSystem:
         """Resolve safehouse with fallbacks"""
         if self.game_state and self.game_state.locations:
             # Look for locations with low security (potential safehouses)
-            safe_locations = []
-            for location in self.game_state.locations.values():
-                if location.security_level < 4:  # Low security = safer
-                    safe_locations.append(location.name)
-
+            safe_locations = self._state_pool("safehouses", self._safehouse_names)
             if safe_locations:
-                import random
-
-                return random.choice(safe_locations)
+                return get_rng("events").choice(safe_locations)
 
         return context.get("safehouse", self._get_random_fallback("location"))
 
     def _resolve_location(self, context: Dict[str, Any]) -> str:
         """Resolve location with fallbacks"""
         if self.game_state and self.game_state.locations:
-            import random
-
-            return random.choice(list(self.game_state.locations.values())).name
+            return get_rng("events").choice(
+                self._state_pool("locations", self._location_names)
+            )
 
         return context.get("location", self._get_random_fallback("location"))
 
     def _resolve_faction_name(self, context: Dict[str, Any]) -> str:
         """Resolve faction name with fallbacks"""
         if self.game_state and self.game_state.factions:
-            import random
-
-            return random.choice(list(self.game_state.factions.values())).name
+            return get_rng("events").choice(
+                self._state_pool("factions", self._faction_names)
+            )
 
         return context.get("faction_name", self._get_random_fallback("faction_name"))
 
@@ -911,9 +967,8 @@ class EventSystem:
             "money",
             "clothing",
         ]
-        import random
 
-        return context.get("resource_type", random.choice(resource_types))
+        return context.get("resource_type", get_rng("events").choice(resource_types))
 
     def _resolve_destination(self, context: Dict[str, Any]) -> str:
         """Resolve destination with fallbacks"""
@@ -925,9 +980,8 @@ class EventSystem:
             "the port",
             "the airport",
         ]
-        import random
 
-        return context.get("destination", random.choice(destinations))
+        return context.get("destination", get_rng("events").choice(destinations))
 
     def _resolve_hiding_place(self, context: Dict[str, Any]) -> str:
         """Resolve hiding place with fallbacks"""
@@ -941,9 +995,8 @@ class EventSystem:
             "an attic",
             "a cellar",
         ]
-        import random
 
-        return context.get("hiding_place", random.choice(hiding_places))
+        return context.get("hiding_place", get_rng("events").choice(hiding_places))
 
     def _resolve_relative(self, context: Dict[str, Any]) -> str:
         """Resolve relative with fallbacks"""
@@ -955,9 +1008,8 @@ class EventSystem:
             "a childhood companion",
             "a distant relative",
         ]
-        import random
 
-        return context.get("relative", random.choice(relatives))
+        return context.get("relative", get_rng("events").choice(relatives))
 
     def _resolve_district(self, context: Dict[str, Any]) -> str:
         """Resolve district with fallbacks"""
@@ -969,16 +1021,15 @@ class EventSystem:
             "the old town",
             "the suburbs",
         ]
-        import random
 
-        return context.get("district", random.choice(districts))
+        return context.get("district", get_rng("events").choice(districts))
 
     def _resolve_contact_name(self, context: Dict[str, Any]) -> str:
         """Resolve contact name with fallbacks"""
         if self.game_state and self.game_state.agents:
-            import random
-
-            return random.choice(list(self.game_state.agents.values())).name
+            return get_rng("events").choice(
+                self._state_pool("agents", self._agent_names)
+            )
 
         return context.get("contact_name", self._get_random_fallback("contact_name"))
 
@@ -991,16 +1042,15 @@ class EventSystem:
             "the capital",
             "the metropolis",
         ]
-        import random
 
-        return context.get("city", random.choice(cities))
+        return context.get("city", get_rng("events").choice(cities))
 
     def _resolve_traitor_name(self, context: Dict[str, Any]) -> str:
         """Resolve traitor name with fallbacks"""
         if self.game_state and self.game_state.agents:
-            import random
-
-            return random.choice(list(self.game_state.agents.values())).name
+            return get_rng("events").choice(
+                self._state_pool("agents", self._agent_names)
+            )
 
         return context.get("traitor_name", self._get_random_fallback("traitor_name"))
 
@@ -1008,63 +1058,103 @@ class EventSystem:
         """Resolve trainer name with fallbacks"""
         if self.game_state and self.game_state.agents:
             # Look for experienced agents
-            experienced_agents = []
-            for agent in self.game_state.agents.values():
-                if agent.status.value == "active":
-                    total_skill = sum(skill.level for skill in agent.skills.values())
-                    if total_skill > 10:  # Experienced agent
-                        experienced_agents.append(agent.name)
-
+            experienced_agents = self._state_pool("trainers", self._trainer_names)
             if experienced_agents:
-                import random
-
-                return random.choice(experienced_agents)
+                return get_rng("events").choice(experienced_agents)
 
         return context.get("trainer_name", "a veteran agent")
 
     def _get_random_fallback(self, variable_name: str) -> str:
         """Get a random fallback value for a variable"""
         if variable_name in self.fallbacks:
-            import random
-
-            return random.choice(self.fallbacks[variable_name])
+            return get_rng("events").choice(self.fallbacks[variable_name])
         return f"{{{variable_name}}}"
 
+    def _state_pool(self, name: str, builder: Callable[[], List[str]]) -> List[str]:
+        """Candidate names derived from the game state, memoized per turn"""
+        turn = getattr(self.game_state, "turn_number", None)
+        if turn != self._state_pools_turn:
+            self._state_pools = {}
+            self._state_pools_turn = turn
+        pool = self._state_pools.get(name)
+        if pool is None:
+            pool = builder()
+            self._state_pools[name] = pool
+        return pool
+
+    def invalidate_state_pools(self) -> None:
+        """Drop memoized name pools, e.g. after agents change mid-turn"""
+        self._state_pools = {}
+        self._state_pools_turn = None
+
+    def _active_agent_names(self) -> List[str]:
+        """Names of active agents"""
+        return [
+            agent.name
+            for agent in self.game_state.agents.values()
+            if agent.status.value == "active"
+        ]
+
+    def _leader_names(self) -> List[str]:
+        """Names of active agents with persuasion above 2"""
+        return [
+            agent.name
+            for agent in self.game_state.agents.values()
+            if agent.status.value == "active"
+            and hasattr(agent.skills, "get")
+            and agent.skills.get("persuasion", 0).level > 2
+        ]
+
+    def _safehouse_names(self) -> List[str]:
+        """Names of low-security locations"""
+        return [
+            location.name
+            for location in self.game_state.locations.values()
+            if location.security_level < 4
+        ]
+
+    def _location_names(self) -> List[str]:
+        """Names of all locations"""
+        return [location.name for location in self.game_state.locations.values()]
+
+    def _faction_names(self) -> List[str]:
+        """Names of all factions"""
+        return [faction.name for faction in self.game_state.factions.values()]
+
+    def _agent_names(self) -> List[str]:
+        """Names of all agents"""
+        return [agent.name for agent in self.game_state.agents.values()]
+
+    def _trainer_names(self) -> List[str]:
+        """Names of active agents with high total skill"""
+        return [
+            agent.name
+            for agent in self.game_state.agents.values()
+            if agent.status.value == "active"
+            and sum(skill.level for skill in agent.skills.values()) > 10
+        ]
+
     def _substitute_variables(self, template: str, context: Dict[str, Any]) -> str:
         """Substitute variables in a template string with robust fallbacks"""
-        try:
-            # Find all variables in the template
-            import re
-
-            variable_pattern = r"\{([^}]+)\}"
-            variables = re.findall(variable_pattern, template)
+        plan = self.render_plans.get(template)
+        if plan is None:
+            plan = RenderPlan.compile(template)
+            self.render_plans[template] = plan
+        if not plan.fields:
+            return plan.literals[0]
 
-            # Build substitution dictionary
+        try:
             substitutions = {}
-            for var_name in variables:
-                if var_name in self.variable_resolvers:
-                    substitutions[var_name] = self.variable_resolvers[var_name](context)
+            for var_name in plan.fields:
+                if var_name in substitutions:
+                    continue
+                resolver = self.variable_resolvers.get(var_name)
+                if resolver is not None:
+                    substitutions[var_name] = resolver(context)
                 else:
                     # Unknown variable, use context or fallback
                     substitutions[var_name] = context.get(var_name, f"{{{var_name}}}")
-
-            # Perform substitution with error handling
-            try:
-                return template.format(**substitutions)
-            except (KeyError, ValueError):
-                # If substitution fails, try with safe fallbacks
-                safe_substitutions = {}
-                for var_name in variables:
-                    safe_substitutions[var_name] = substitutions.get(
-                        var_name, f"{{{var_name}}}"
-                    )
-
-                try:
-                    return template.format(**safe_substitutions)
-                except (KeyError, ValueError):
-                    # Last resort: replace with generic text
-                    return template.replace("{", "").replace("}", "")
-
+            return plan.render(substitutions)
         except Exception:
             # If all else fails, return the original template
             return template
@@ -8,8 +8,9 @@ event information, narrative consequences, and mechanical effects.
 import random
 import uuid
 import logging
+from bisect import bisect_left, bisect_right, insort
 from enum import Enum
-from typing import Dict, List, Any
+from typing import Dict, Iterable, List, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
@@ -145,34 +146,88 @@ class IntelligenceDatabase:
         self.analysis_reports: Dict[str, str] = {}
         self.patterns: List[Dict[str, Any]] = []
         self.threat_assessments: Dict[str, Dict[str, Any]] = {}
+
+        # Secondary indexes kept in step with self.events. The time index
+        # holds (timestamp, sequence, event id) sorted by timestamp; the
+        # sequence number breaks ties in insertion order.
+        self._by_type: Dict[IntelligenceType, Dict[str, IntelligenceEvent]] = {}
+        self._by_priority: Dict[IntelligencePriority, Dict[str, IntelligenceEvent]] = {}
+        self._by_time: List[Tuple[datetime, int, str]] = []
+        self._time_keys: Dict[str, Tuple[datetime, int, str]] = {}
+        self._sequence = 0
         logger.info("IntelligenceDatabase initialized")
 
     def add_event(self, event: IntelligenceEvent):
         """Add new intelligence event with validation"""
         try:
-            if not isinstance(event, IntelligenceEvent):
-                raise TypeError(f"Event must be IntelligenceEvent, got {type(event)}")
+            self._validate_event(event)
+            self._index_event(event)
+            self._update_analysis()
 
-            if not event.id:
-                raise ValueError("Event must have an ID")
+        except Exception as e:
+            logger.error("Failed to add intelligence event: %s", str(e))
+            raise
 
-            if event.id in self.events:
-                logger.warning("Overwriting existing event with ID: %s", event.id)
+    def add_events(self, events: Iterable[IntelligenceEvent]) -> int:
+        """Add many events, running the analysis once at the end
 
-            self.events[event.id] = event
-            logger.info(
-                "Added intelligence event: %s (Type: %s, Priority: %s)",
-                event.title,
-                event.type.value,
-                event.priority.value,
-            )
-
-            self._update_analysis()
+        Every event is validated before any is stored, so an invalid event
+        leaves the database unchanged. Returns the number of events added.
+        """
+        try:
+            events = list(events)
+            for event in events:
+                self._validate_event(event)
+            for event in events:
+                self._index_event(event)
+            if events:
+                self._update_analysis()
+            return len(events)
 
         except Exception as e:
-            logger.error("Failed to add intelligence event: %s", str(e))
+            logger.error("Failed to add intelligence events: %s", str(e))
             raise
 
+    def _validate_event(self, event: IntelligenceEvent):
+        """Raise if an event cannot be stored"""
+        if not isinstance(event, IntelligenceEvent):
+            raise TypeError(f"Event must be IntelligenceEvent, got {type(event)}")
+
+        if not event.id:
+            raise ValueError("Event must have an ID")
+
+    def _index_event(self, event: IntelligenceEvent):
+        """Store an event and add it to the secondary indexes"""
+        if event.id in self.events:
+            logger.warning("Overwriting existing event with ID: %s", event.id)
+            self._unindex_event(self.events[event.id])
+
+        self.events[event.id] = event
+        self._by_type.setdefault(event.type, {})[event.id] = event
+        self._by_priority.setdefault(event.priority, {})[event.id] = event
+
+        time_key = (event.timestamp, self._sequence, event.id)
+        self._sequence += 1
+        insort(self._by_time, time_key)
+        self._time_keys[event.id] = time_key
+
+        logger.info(
+            "Added intelligence event: %s (Type: %s, Priority: %s)",
+            event.title,
+            event.type.value,
+            event.priority.value,
+        )
+
+    def _unindex_event(self, event: IntelligenceEvent):
+        """Remove a stored event from the secondary indexes"""
+        self._by_type.get(event.type, {}).pop(event.id, None)
+        self._by_priority.get(event.priority, {}).pop(event.id, None)
+        time_key = self._time_keys.pop(event.id, None)
+        if time_key is not None:
+            index = bisect_left(self._by_time, time_key)
+            if index < len(self._by_time) and self._by_time[index] == time_key:
+                del self._by_time[index]
+
     def get_events_by_type(
         self, event_type: IntelligenceType
     ) -> List[IntelligenceEvent]:
@@ -189,9 +244,7 @@ class IntelligenceDatabase:
                         f"Event type must be IntelligenceType enum, got {type(event_type)}"
                     )
 
-            events = [
-                event for event in self.events.values() if event.type == event_type
-            ]
+            events = list(self._by_type.get(event_type, {}).values())
             logger.debug(
                 "Retrieved %d events of type: %s", len(events), event_type.value
             )
@@ -217,9 +270,7 @@ class IntelligenceDatabase:
                         f"Priority must be IntelligencePriority enum, got {type(priority)}"
                     )
 
-            events = [
-                event for event in self.events.values() if event.priority == priority
-            ]
+            events = list(self._by_priority.get(priority, {}).values())
             logger.debug(
                 "Retrieved %d events with priority: %s", len(events), priority.value
             )
@@ -230,7 +281,7 @@ class IntelligenceDatabase:
             return []
 
     def get_recent_events(self, hours: int = 24) -> List[IntelligenceEvent]:
-        """Get events from the last N hours with validation"""
+        """Get events from the last N hours, oldest first, with validation"""
         try:
             if not isinstance(hours, int):
                 raise TypeError(f"Hours must be an integer, got {type(hours)}")
@@ -241,10 +292,7 @@ class IntelligenceDatabase:
                     "Requesting events from more than 1 week ago: %d hours", hours
                 )
 
-            cutoff_time = datetime.now() - timedelta(hours=hours)
-            events = [
-                event for event in self.events.values() if event.timestamp > cutoff_time
-            ]
+            events = [self.events[key[2]] for key in self._recent_keys(hours)]
             logger.debug("Retrieved %d events from last %d hours", len(events), hours)
             return events
 
@@ -252,6 +300,18 @@ class IntelligenceDatabase:
             logger.error("Failed to get recent events: %s", str(e))
             return []
 
+    def _recent_keys(self, hours: int) -> List[Tuple[datetime, int, str]]:
+        """Time index entries newer than N hours ago"""
+        cutoff_time = datetime.now() - timedelta(hours=hours)
+        start = bisect_right(self._by_time, (cutoff_time, float("inf")))
+        return self._by_time[start:]
+
+    def _count_by_type(self, event_type: IntelligenceType) -> int:
+        return len(self._by_type.get(event_type, {}))
+
+    def _count_by_priority(self, priority: IntelligencePriority) -> int:
+        return len(self._by_priority.get(priority, {}))
+
     def get_critical_events(self) -> List[IntelligenceEvent]:
         """Get all critical priority events"""
         return self.get_events_by_priority(IntelligencePriority.CRITICAL)
@@ -276,60 +336,60 @@ class IntelligenceDatabase:
             self.patterns = []  # Reset patterns
 
             # Analyze government movements
-            gov_events = self.get_events_by_type(IntelligenceType.GOVERNMENT_MOVEMENT)
-            if len(gov_events) >= 3:
+            gov_events = self._count_by_type(IntelligenceType.GOVERNMENT_MOVEMENT)
+            if gov_events >= 3:
                 self.patterns.append(
                     {
                         "type": "government_activity",
                         "description": "Increased government activity detected",
-                        "confidence": min(0.8, len(gov_events) * 0.2),
+                        "confidence": min(0.8, gov_events * 0.2),
                         "implications": [
                             "Possible crackdown",
                             "Increased surveillance",
                             "Policy changes",
                         ],
-                        "event_count": len(gov_events),
+                        "event_count": gov_events,
                     }
                 )
                 logger.info(
-                    "Detected government activity pattern: %d events", len(gov_events)
+                    "Detected government activity pattern: %d events", gov_events
                 )
 
             # Analyze security changes
-            security_events = self.get_events_by_type(IntelligenceType.SECURITY_CHANGES)
-            if len(security_events) >= 2:
+            security_events = self._count_by_type(IntelligenceType.SECURITY_CHANGES)
+            if security_events >= 2:
                 self.patterns.append(
                     {
                         "type": "security_escalation",
                         "description": "Security measures being enhanced",
-                        "confidence": min(0.7, len(security_events) * 0.3),
+                        "confidence": min(0.7, security_events * 0.3),
                         "implications": [
                             "Harder to operate",
                             "Need for new tactics",
                             "Increased risk",
                         ],
-                        "event_count": len(security_events),
+                        "event_count": security_events,
                     }
                 )
                 logger.info(
                     "Detected security escalation pattern: %d events",
-                    len(security_events),
+                    security_events,
                 )
 
             # Analyze economic data
-            economic_events = self.get_events_by_type(IntelligenceType.ECONOMIC_DATA)
-            if len(economic_events) >= 2:
+            economic_events = self._count_by_type(IntelligenceType.ECONOMIC_DATA)
+            if economic_events >= 2:
                 self.patterns.append(
                     {
                         "type": "economic_manipulation",
                         "description": "Economic manipulation detected",
-                        "confidence": min(0.6, len(economic_events) * 0.25),
+                        "confidence": min(0.6, economic_events * 0.25),
                         "implications": [
                             "Financial pressure",
                             "Resource scarcity",
                             "Economic warfare",
                         ],
-                        "event_count": len(economic_events),
+                        "event_count": economic_events,
                     }
                 )
 
@@ -345,12 +405,10 @@ class IntelligenceDatabase:
         """Update threat assessments based on intelligence with error handling"""
         try:
             # Calculate overall threat level
-            critical_events = len(self.get_critical_events())
-            high_priority_events = len(
-                self.get_events_by_priority(IntelligencePriority.HIGH)
-            )
-            medium_priority_events = len(
-                self.get_events_by_priority(IntelligencePriority.MEDIUM)
+            critical_events = self._count_by_priority(IntelligencePriority.CRITICAL)
+            high_priority_events = self._count_by_priority(IntelligencePriority.HIGH)
+            medium_priority_events = self._count_by_priority(
+                IntelligencePriority.MEDIUM
             )
 
             # Determine threat level
@@ -414,8 +472,8 @@ OVERALL ASSESSMENT:
 """
 
         total_events = len(self.events)
-        critical_events = len(self.get_critical_events())
-        high_events = len(self.get_events_by_priority(IntelligencePriority.HIGH))
+        critical_events = self._count_by_priority(IntelligencePriority.CRITICAL)
+        high_events = self._count_by_priority(IntelligencePriority.HIGH)
 
         report += f"Total Intelligence Events: {total_events}\n"
         report += f"Critical Priority Events: {critical_events}\n"
@@ -429,11 +487,11 @@ OVERALL ASSESSMENT:
             report += "\n✅ Situation appears stable.\n"
 
         # Recent activity
-        recent_events = self.get_recent_events(24)
-        if recent_events:
+        recent_keys = self._recent_keys(24)
+        if recent_keys:
             report += "\nRECENT ACTIVITY (Last 24 Hours):\n"
-            for event in recent_events[:5]:  # Show top 5
-                report += f"  • {event.get_summary()}\n"
+            for _, _, event_id in recent_keys[:5]:  # Show top 5
+                report += f"  • {self.events[event_id].get_summary()}\n"
 
         # Patterns
         if self.patterns:
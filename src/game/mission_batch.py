@@ -0,0 +1,271 @@
+"""
+Batched Mission Resolution for Years of Lead
+
+MissionExecutionEngine.execute_mission resolves one mission through a chain
+of dict-based helpers. This module resolves many missions at once: each
+mission's agents, location and equipment effects are reduced to rows of a
+structure-of-arrays feature table, and success, outcome, cost and exposure
+are computed for all of them with NumPy. The math mirrors the scalar
+helpers exactly; only the order in which random rolls are drawn differs.
+
+MissionExecutionEngine.execute_missions_batch drives this module and
+wraps the columns in a MissionBatchResult.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .mission_execution_engine import (
+    BASE_NETWORK_EXPOSURE,
+    BASE_RESOURCE_COSTS,
+    BASE_SAFE_HOUSE_RISK,
+    DEFAULT_MISSION_SKILLS,
+    DEFAULT_RESOURCE_COST,
+    EXPOSURE_OUTCOME_MULTIPLIERS,
+    MISSION_SKILLS,
+    MISSION_TYPE_MODIFIERS,
+    OUTCOME_COST_MODIFIERS,
+    OUTCOMES,
+    SAFE_HOUSE_OUTCOME_MULTIPLIERS,
+    ExecutionOutcome,
+)
+
+# Known mission types get their own row in the lookup tables; the last row
+# holds the defaults used for any other type
+MISSION_TYPES: List[str] = sorted(
+    set(MISSION_TYPE_MODIFIERS) | set(MISSION_SKILLS) | set(BASE_RESOURCE_COSTS)
+)
+TYPE_CODES: Dict[str, int] = {name: i for i, name in enumerate(MISSION_TYPES)}
+OTHER_TYPE = len(MISSION_TYPES)
+
+SKILLS: List[str] = sorted(
+    {skill for skills in MISSION_SKILLS.values() for skill in skills}
+    | set(DEFAULT_MISSION_SKILLS)
+)
+
+
+def _type_table(values: Dict[str, float], default: float) -> np.ndarray:
+    return np.array([values.get(name, default) for name in MISSION_TYPES] + [default])
+
+
+def _outcome_table(values: Dict[ExecutionOutcome, float]) -> np.ndarray:
+    return np.array([values.get(outcome, 1.0) for outcome in OUTCOMES])
+
+
+TYPE_MODIFIER = _type_table(MISSION_TYPE_MODIFIERS, 0.0)
+COST_MONEY = np.array(
+    [BASE_RESOURCE_COSTS.get(n, DEFAULT_RESOURCE_COST).money for n in MISSION_TYPES]
+    + [DEFAULT_RESOURCE_COST.money],
+    dtype=np.float64,
+)
+COST_EQUIPMENT = np.array(
+    [BASE_RESOURCE_COSTS.get(n, DEFAULT_RESOURCE_COST).equipment for n in MISSION_TYPES]
+    + [DEFAULT_RESOURCE_COST.equipment],
+    dtype=np.float64,
+)
+COST_HOURS = np.array(
+    [
+        BASE_RESOURCE_COSTS.get(n, DEFAULT_RESOURCE_COST).agent_time_hours
+        for n in MISSION_TYPES
+    ]
+    + [DEFAULT_RESOURCE_COST.agent_time_hours],
+    dtype=np.float64,
+)
+EXPOSURE = _type_table(BASE_NETWORK_EXPOSURE, 0.3)
+SAFE_HOUSE_RISK = _type_table(BASE_SAFE_HOUSE_RISK, 0.3)
+COST_OUTCOME = _outcome_table(OUTCOME_COST_MODIFIERS)
+EXPOSURE_OUTCOME = _outcome_table(EXPOSURE_OUTCOME_MULTIPLIERS)
+SAFE_HOUSE_OUTCOME = _outcome_table(SAFE_HOUSE_OUTCOME_MULTIPLIERS)
+
+# (types x skills) weights: 1 / len(relevant skills) for each relevant skill
+SKILL_WEIGHTS = np.zeros((len(MISSION_TYPES) + 1, len(SKILLS)))
+for _name, _code in list(TYPE_CODES.items()) + [(None, OTHER_TYPE)]:
+    _skills = MISSION_SKILLS.get(_name, DEFAULT_MISSION_SKILLS)
+    for _skill in _skills:
+        SKILL_WEIGHTS[_code, SKILLS.index(_skill)] += 1.0 / len(_skills)
+
+# Mission types whose success benefits from equipment concealment
+CONCEALMENT_TYPES = np.array(
+    [name in ("intelligence", "sabotage") for name in MISSION_TYPES] + [False]
+)
+
+
+def _skill_level(value: Any) -> float:
+    """Skill level from either a float or a {"level": ...} dict"""
+    if isinstance(value, dict):
+        return value.get("level", 0.0)
+    return float(value)
+
+
+class MissionFeatures:
+    """Structure-of-arrays view of a batch of missions
+
+    Mission rows hold per-mission features; agent rows hold one entry per
+    assigned agent with ``agent_mission`` pointing back at its mission.
+    """
+
+    def __init__(
+        self,
+        orders: List[Dict[str, Any]],
+        equipment_effects: List[Optional[Dict[str, Any]]],
+    ):
+        count = len(orders)
+        self.count = count
+        self.type_code = np.empty(count, dtype=np.int64)
+        self.agent_count = np.zeros(count, dtype=np.int64)
+        self.security = np.empty(count)
+        self.surveillance = np.empty(count)
+        self.complexity = np.empty(count)
+
+        # Equipment effects
+        self.success_modifier = np.zeros(count)
+        self.skill_bonus = np.zeros(count)
+        self.concealment = np.zeros(count)
+        self.legal_risk = np.zeros(count)
+        self.confidence = np.zeros(count)
+        self.fear = np.zeros(count)
+        self.broken = np.zeros(count)
+        self.maintenance = np.zeros(count)
+        self.repair_costs = np.zeros(count)
+
+        agent_mission: List[int] = []
+        skill_rows: List[List[float]] = []
+        trauma: List[float] = []
+
+        for i, order in enumerate(orders):
+            mission = order["mission"]
+            location = order.get("location") or {}
+            agents = order.get("agents") or []
+
+            self.type_code[i] = TYPE_CODES.get(
+                mission.get("type", "propaganda"), OTHER_TYPE
+            )
+            self.agent_count[i] = len(agents)
+            self.security[i] = location.get("security_level", 5)
+            self.surveillance[i] = location.get("surveillance_level", 5)
+            self.complexity[i] = mission.get("complexity", 5)
+
+            for agent in agents:
+                skills = agent.get("skills", {})
+                agent_mission.append(i)
+                skill_rows.append([_skill_level(skills.get(s, 0.0)) for s in SKILLS])
+                emotional_state = agent.get("emotional_state", {})
+                trauma.append(emotional_state.get("trauma_level", 0.0))
+
+            effects = equipment_effects[i]
+            if effects:
+                self._add_equipment(i, effects)
+
+        self.agent_mission = np.array(agent_mission, dtype=np.int64)
+        self.agent_skills = np.array(skill_rows, dtype=np.float64).reshape(
+            len(skill_rows), len(SKILLS)
+        )
+        self.agent_trauma = np.array(trauma, dtype=np.float64)
+
+    def _add_equipment(self, i: int, effects: Dict[str, Any]):
+        """Reduce one mission's equipment effects dict to feature columns"""
+        self.success_modifier[i] = effects.get("success_modifier", 0.0)
+        self.skill_bonus[i] = sum(effects.get("skill_bonuses", {}).values())
+        self.concealment[i] = effects.get("concealment_rating", 0.0)
+        self.legal_risk[i] = effects.get("legal_risk", 0.0)
+
+        emotional = effects.get("emotional_effects", {})
+        self.confidence[i] = max(0.0, emotional.get("confidence", 0.0))
+        self.fear[i] = max(0.0, emotional.get("fear", 0.0))
+
+        for degradation in effects.get("equipment_degradation", {}).values():
+            for result in degradation.values():
+                if result.get("broken", False):
+                    self.broken[i] += 1
+                elif result.get("maintenance_required", False):
+                    self.maintenance[i] += 1
+                if result.get("broken", False) or result.get(
+                    "maintenance_required", False
+                ):
+                    self.repair_costs[i] += result.get("repair_cost", 100)
+
+
+def success_probabilities(features: MissionFeatures) -> np.ndarray:
+    """Vectorized _calculate_base_success_with_equipment followed by
+    _apply_execution_modifiers_with_equipment"""
+    count = features.count
+    agents = features.agent_count
+
+    # Agent competency: per-agent weighted skill average, then team mean
+    per_agent = (
+        features.agent_skills
+        * SKILL_WEIGHTS[features.type_code[features.agent_mission]]
+    ).sum(axis=1) / 5.0
+    competency_sum = np.bincount(
+        features.agent_mission, weights=per_agent, minlength=count
+    )
+    competency = np.full(count, 0.1)
+    np.divide(competency_sum, agents, out=competency, where=agents > 0)
+
+    difficulty = np.clip((features.security + features.surveillance) / 20.0, 0.0, 1.0)
+    complexity = 1.0 - np.abs(features.complexity - 5) / 5.0
+
+    base = (
+        (competency * 0.6)
+        + ((1.0 - difficulty) * 0.3)
+        + (complexity * 0.1)
+        + TYPE_MODIFIER[features.type_code]
+    )
+    base = np.clip(base, 0.05, 0.95)
+
+    # Equipment modifiers on the base success
+    base = base + features.success_modifier + features.skill_bonus * 0.1
+    base = base + np.where(
+        CONCEALMENT_TYPES[features.type_code], features.concealment * 0.15, 0.0
+    )
+    base = np.clip(base - features.legal_risk * 0.1, 0.05, 0.95)
+
+    # Execution modifiers: trauma and equipment emotions apply per agent
+    trauma = np.bincount(
+        features.agent_mission, weights=features.agent_trauma, minlength=count
+    )
+    modified = base - trauma * 0.15
+    modified = modified + agents * (features.confidence * 0.05 - features.fear * 0.03)
+    modified = modified - features.broken * 0.1 - features.maintenance * 0.05
+    return np.clip(modified, 0.05, 0.95)
+
+
+def roll_outcomes(probabilities: np.ndarray, rolls: np.ndarray) -> np.ndarray:
+    """Vectorized _determine_outcome; returns indexes into OUTCOMES"""
+    p = probabilities
+    return np.select(
+        [
+            rolls <= p * 0.3,
+            rolls <= p * 0.7,
+            rolls <= p,
+            rolls <= p + 0.2,
+            rolls <= p + 0.4,
+        ],
+        [0, 1, 2, 3, 4],
+        default=5,
+    )
+
+
+def resource_columns(
+    features: MissionFeatures, codes: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """Vectorized _calculate_resource_costs_with_equipment, one array per
+    ResourceCost field"""
+    types = features.type_code
+    multiplier = features.agent_count * 0.7 + 0.3
+    modifier = COST_OUTCOME[codes]
+
+    def scaled(base: np.ndarray) -> np.ndarray:
+        return np.trunc(base[types] * multiplier * modifier).astype(np.int64)
+
+    return {
+        "money": scaled(COST_MONEY) + np.trunc(features.repair_costs).astype(np.int64),
+        "equipment": scaled(COST_EQUIPMENT),
+        "agent_time_hours": scaled(COST_HOURS),
+        "network_exposure": np.clip(EXPOSURE[types] * EXPOSURE_OUTCOME[codes], 0, 1),
+        "safe_house_risk": np.clip(
+            SAFE_HOUSE_RISK[types] * SAFE_HOUSE_OUTCOME[codes], 0, 1
+        ),
+        "equipment_repair_costs": features.repair_costs,
+    }
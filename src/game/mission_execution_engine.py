@@ -5,17 +5,25 @@ Comprehensive mission execution with nuanced success/failure mechanics,
 resource management, and meaningful narrative consequences.
 """
 
-import random
 import logging
 from enum import Enum
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
 
 # Import equipment integration
+from .rng import get_rng
 from .equipment_integration import (
     AgentLoadout,
 )
 from .equipment_enhanced import EnhancedEquipmentProfile
+from .mission_patterns import MissionPatternLog
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -90,15 +98,207 @@ class ExecutionResult:
     equipment_effects: Dict[str, Any]  # New: equipment effects and degradation
 
 
+OUTCOMES = list(ExecutionOutcome)
+
+RESOURCE_FIELDS = (
+    "money",
+    "equipment",
+    "agent_time_hours",
+    "network_exposure",
+    "safe_house_risk",
+    "equipment_repair_costs",
+)
+
+# Mission type base modifiers - REDUCED SABOTAGE DIFFICULTY
+MISSION_TYPE_MODIFIERS = {
+    "propaganda": 0.0,  # No modifier
+    "intelligence": -0.05,  # Slightly harder
+    "sabotage": -0.15,  # REDUCED from -0.25 to -0.15
+    "recruitment": -0.05,  # Slightly harder
+    "rescue": -0.20,  # Hard
+    "assassination": -0.30,  # Very hard
+}
+
+# Map mission types to relevant skills
+MISSION_SKILLS = {
+    "propaganda": ["social", "intelligence"],
+    "sabotage": ["technical", "stealth"],
+    "assassination": ["combat", "stealth"],
+    "rescue": ["combat", "medical"],
+    "intelligence": ["intelligence", "stealth"],
+    "recruitment": ["social", "intelligence"],
+}
+DEFAULT_MISSION_SKILLS = ["intelligence"]
+
+BASE_RESOURCE_COSTS = {
+    "propaganda": ResourceCost(money=500, equipment=1, agent_time_hours=8),
+    "sabotage": ResourceCost(money=2000, equipment=3, agent_time_hours=12),
+    "intelligence": ResourceCost(money=300, equipment=1, agent_time_hours=16),
+    "recruitment": ResourceCost(money=800, equipment=1, agent_time_hours=10),
+    "rescue": ResourceCost(money=3000, equipment=3, agent_time_hours=6),
+    "assassination": ResourceCost(money=5000, equipment=4, agent_time_hours=4),
+}
+DEFAULT_RESOURCE_COST = ResourceCost(money=1000, agent_time_hours=8)
+
+# Outcome modifiers
+OUTCOME_COST_MODIFIERS = {
+    ExecutionOutcome.PERFECT_SUCCESS: 0.8,  # Efficient execution
+    ExecutionOutcome.SUCCESS_WITH_COMPLICATIONS: 1.2,  # Extra resources needed
+    ExecutionOutcome.PARTIAL_SUCCESS: 1.1,
+    ExecutionOutcome.FAILURE_WITH_INTEL: 1.3,  # Wasted resources
+    ExecutionOutcome.COMPLETE_FAILURE: 1.5,
+    ExecutionOutcome.CATASTROPHIC_FAILURE: 2.0,
+}
+
+BASE_NETWORK_EXPOSURE = {
+    "propaganda": 0.1,
+    "intelligence": 0.2,
+    "sabotage": 0.4,
+    "recruitment": 0.3,
+    "rescue": 0.6,
+    "assassination": 0.8,
+}
+
+EXPOSURE_OUTCOME_MULTIPLIERS = {
+    ExecutionOutcome.PERFECT_SUCCESS: 0.3,
+    ExecutionOutcome.SUCCESS_WITH_COMPLICATIONS: 0.7,
+    ExecutionOutcome.PARTIAL_SUCCESS: 1.0,
+    ExecutionOutcome.FAILURE_WITH_INTEL: 1.2,
+    ExecutionOutcome.COMPLETE_FAILURE: 1.8,
+    ExecutionOutcome.CATASTROPHIC_FAILURE: 3.0,
+}
+
+BASE_SAFE_HOUSE_RISK = {
+    "propaganda": 0.1,
+    "sabotage": 0.3,
+    "intelligence": 0.2,
+    "recruitment": 0.15,
+    "rescue": 0.4,
+    "assassination": 0.6,
+}
+
+SAFE_HOUSE_OUTCOME_MULTIPLIERS = {
+    ExecutionOutcome.PERFECT_SUCCESS: 0.5,
+    ExecutionOutcome.SUCCESS_WITH_COMPLICATIONS: 0.8,
+    ExecutionOutcome.PARTIAL_SUCCESS: 1.0,
+    ExecutionOutcome.COMPLETE_FAILURE: 1.5,
+    ExecutionOutcome.CATASTROPHIC_FAILURE: 2.0,
+}
+
+
+class MissionBatchResult:
+    """Outcomes of a batch of missions, stored column-wise
+
+    ``success_probability``, ``outcome_codes`` (indexes into OUTCOMES) and
+    the ResourceCost columns are indexed like the input orders. result(i)
+    assembles the dict execute_mission would return for one mission, and
+    narrative(i) generates the narrative text on first use.
+    """
+
+    def __init__(
+        self,
+        engine: "MissionExecutionEngine",
+        orders: List[Dict[str, Any]],
+        agent_loadouts: List[Dict[str, AgentLoadout]],
+        equipment_effects: List[Dict[str, Any]],
+        success_probability,
+        outcome_codes,
+        resource_columns: Dict[str, Any],
+    ):
+        self.engine = engine
+        self.orders = orders
+        self.agent_loadouts = agent_loadouts
+        self.equipment_effects = equipment_effects
+        self.success_probability = success_probability
+        self.outcome_codes = outcome_codes
+        for name in RESOURCE_FIELDS:
+            setattr(self, name, resource_columns[name])
+
+        # Filled in when the batch is resolved for real
+        self.consequences: List[List[MissionConsequence]] = []
+        self.network_effects: List[Dict[str, Any]] = []
+        self._narratives: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def outcome(self, i: int) -> ExecutionOutcome:
+        return OUTCOMES[int(self.outcome_codes[i])]
+
+    def success_rate(self) -> float:
+        """Share of missions that ended in some kind of success"""
+        if not self.orders:
+            return 0.0
+        successes = sum(1 for code in self.outcome_codes if code <= 2)
+        return successes / len(self.orders)
+
+    def resource_costs(self, i: int) -> ResourceCost:
+        return ResourceCost(
+            money=int(self.money[i]),
+            equipment=int(self.equipment[i]),
+            agent_time_hours=int(self.agent_time_hours[i]),
+            network_exposure=float(self.network_exposure[i]),
+            safe_house_risk=float(self.safe_house_risk[i]),
+            equipment_repair_costs=float(self.equipment_repair_costs[i]),
+        )
+
+    def narrative(self, i: int) -> str:
+        """Narrative text for mission ``i``, generated on first request"""
+        if i not in self._narratives:
+            order = self.orders[i]
+            engine = self.engine
+            self._narratives[i] = engine._generate_mission_narrative_with_equipment(
+                order["mission"],
+                order.get("agents") or [],
+                order.get("location") or {},
+                self.outcome(i),
+                self.equipment_effects[i],
+            )
+        return self._narratives[i]
+
+    def result(self, i: int, include_narrative: bool = True) -> Dict[str, Any]:
+        """The execute_mission result dict for mission ``i``"""
+        order = self.orders[i]
+        result = {
+            "outcome": self.outcome(i),
+            "success_probability": float(self.success_probability[i]),
+            "resource_costs": self.resource_costs(i),
+            "consequences": self.consequences[i] if self.consequences else [],
+            "network_effects": self.network_effects[i] if self.network_effects else {},
+            "agents_affected": len(order.get("agents") or []),
+            "mission_type": order["mission"].get("type", "unknown"),
+            "equipment_effects": self.equipment_effects[i],
+            "agent_loadouts": self.agent_loadouts[i],
+        }
+        if include_narrative:
+            result["narrative"] = self.narrative(i)
+        return result
+
+
 class MissionExecutionEngine:
     """Enhanced mission execution engine with spy network integration"""
 
-    def __init__(self, game_state, equipment_manager):
+    def __init__(
+        self,
+        game_state,
+        equipment_manager,
+        pattern_spill_path: Optional[str] = None,
+        pattern_buffer_size: int = 256,
+    ):
         self.game_state = game_state
-        self.execution_history = []
+        # With a spill path, execution records beyond the buffer move to
+        # that JSON Lines file instead of staying in memory all campaign
+        self.pattern_log = MissionPatternLog(
+            spill_path=pattern_spill_path, buffer_size=pattern_buffer_size
+        )
         self.network_compromise_tracker = {}
         self.equipment_manager = equipment_manager
 
+    @property
+    def execution_history(self) -> List[Dict[str, Any]]:
+        """The most recent execution records; pattern_log holds them all"""
+        return list(self.pattern_log.recent)
+
     def execute_mission(
         self,
         mission: Dict[str, Any],
@@ -173,6 +373,142 @@ class MissionExecutionEngine:
             "agent_loadouts": agent_loadouts,  # New: updated loadouts
         }
 
+    def execute_missions_batch(
+        self,
+        orders: List[Dict[str, Any]],
+        hypothetical: bool = False,
+        rng=None,
+    ) -> MissionBatchResult:
+        """Resolve many missions at once
+
+        Each order is a dict with "mission", "agents" and "location", and
+        optionally "agent_loadouts" and precomputed "equipment_effects".
+        Success, outcome and resource costs are computed for the whole batch
+        with NumPy (see mission_batch), using the same formulas as
+        execute_mission.
+
+        With ``hypothetical`` set the game is left untouched: equipment is
+        not used (only precomputed "equipment_effects" count) and no
+        consequences, network effects or execution patterns are recorded.
+        That is the mode for planners and Monte Carlo runs. Otherwise every
+        mission is followed through like execute_mission. Narrative text is
+        only generated when the result asks for it. ``rng`` replaces the
+        "missions" stream for the outcome rolls; hypothetical batches default
+        to a stream of their own, so planning never shifts the rolls of real
+        missions.
+        """
+        if rng is None:
+            rng = (
+                get_rng("missions", "hypothetical")
+                if hypothetical
+                else get_rng("missions")
+            )
+
+        agent_loadouts = []
+        equipment_effects = []
+        for order in orders:
+            agents = order.get("agents") or []
+            loadouts = order.get("agent_loadouts")
+            effects = order.get("equipment_effects")
+            if loadouts is None and not hypothetical:
+                loadouts = {}
+                for agent in agents:
+                    agent_id = agent.get("id")
+                    if agent_id:
+                        loadouts[
+                            agent_id
+                        ] = self.equipment_manager.create_agent_loadout(agent_id)
+            if effects is None and not hypothetical:
+                effects = self.equipment_manager.apply_equipment_effects_to_mission(
+                    order["mission"], agents, loadouts
+                )
+            agent_loadouts.append(loadouts or {})
+            equipment_effects.append(effects or {})
+
+        rolls = [rng.random() for _ in orders]
+
+        if NUMPY_AVAILABLE:
+            from .mission_batch import (
+                MissionFeatures,
+                resource_columns,
+                roll_outcomes,
+                success_probabilities,
+            )
+
+            features = MissionFeatures(orders, equipment_effects)
+            probabilities = success_probabilities(features)
+            codes = roll_outcomes(probabilities, np.array(rolls))
+            columns = resource_columns(features, codes)
+        else:
+            logger.warning("NumPy not available, resolving missions one at a time")
+            probabilities, codes, columns = self._resolve_batch_scalar(
+                orders, equipment_effects, rolls
+            )
+
+        batch = MissionBatchResult(
+            self,
+            orders,
+            agent_loadouts,
+            equipment_effects,
+            probabilities,
+            codes,
+            columns,
+        )
+        if hypothetical:
+            return batch
+
+        for i, order in enumerate(orders):
+            mission = order["mission"]
+            agents = order.get("agents") or []
+            outcome = batch.outcome(i)
+            consequences = self._generate_mission_consequences_with_equipment(
+                mission,
+                agents,
+                order.get("location") or {},
+                outcome,
+                equipment_effects[i],
+            )
+            batch.consequences.append(consequences)
+            batch.network_effects.append(
+                self._apply_network_effects(mission, agents, outcome)
+            )
+            self._track_execution_patterns(mission, outcome, consequences)
+            self._update_agent_loadouts(agent_loadouts[i], equipment_effects[i])
+
+        return batch
+
+    def _resolve_batch_scalar(
+        self,
+        orders: List[Dict[str, Any]],
+        equipment_effects: List[Dict[str, Any]],
+        rolls: List[float],
+    ):
+        """Per-mission fallback for execute_missions_batch without NumPy"""
+        probabilities = []
+        codes = []
+        columns = {name: [] for name in RESOURCE_FIELDS}
+        for order, effects, roll in zip(orders, equipment_effects, rolls):
+            mission = order["mission"]
+            agents = order.get("agents") or []
+            location = order.get("location") or {}
+
+            base_success = self._calculate_base_success_with_equipment(
+                mission, agents, location, effects
+            )
+            success = self._apply_execution_modifiers_with_equipment(
+                base_success, mission, agents, location, effects
+            )
+            outcome = self._determine_outcome(success, roll)
+            costs = self._calculate_resource_costs_with_equipment(
+                mission, agents, outcome, effects
+            )
+
+            probabilities.append(success)
+            codes.append(OUTCOMES.index(outcome))
+            for name in RESOURCE_FIELDS:
+                columns[name].append(getattr(costs, name))
+        return probabilities, codes, columns
+
     def _calculate_base_success_with_equipment(
         self,
         mission: Dict[str, Any],
@@ -455,18 +791,8 @@ class MissionExecutionEngine:
         # Mission complexity
         complexity_modifier = self._get_complexity_modifier(mission)
 
-        # Mission type base modifiers - REDUCED SABOTAGE DIFFICULTY
         mission_type = mission.get("type", "propaganda")
-        type_base_modifiers = {
-            "propaganda": 0.0,  # No modifier
-            "intelligence": -0.05,  # Slightly harder
-            "sabotage": -0.15,  # REDUCED from -0.25 to -0.15
-            "recruitment": -0.05,  # Slightly harder
-            "rescue": -0.20,  # Hard
-            "assassination": -0.30,  # Very hard
-        }
-
-        type_modifier = type_base_modifiers.get(mission_type, 0.0)
+        type_modifier = MISSION_TYPE_MODIFIERS.get(mission_type, 0.0)
 
         # Base success calculation with improved balance
         base_success = (
@@ -548,10 +874,13 @@ class MissionExecutionEngine:
 
         return max(0.05, min(0.95, modified_success))
 
-    def _determine_outcome(self, success_probability: float) -> ExecutionOutcome:
+    def _determine_outcome(
+        self, success_probability: float, roll: float = None
+    ) -> ExecutionOutcome:
         """Determine mission outcome based on probability"""
 
-        roll = random.random()
+        if roll is None:
+            roll = get_rng("missions").random()
 
         if roll <= success_probability * 0.3:
             return ExecutionOutcome.PERFECT_SUCCESS
@@ -575,33 +904,12 @@ class MissionExecutionEngine:
         """Calculate resources consumed during mission"""
 
         mission_type = mission.get("type", "propaganda")
-        base_costs = {
-            "propaganda": ResourceCost(money=500, equipment=1, agent_time_hours=8),
-            "sabotage": ResourceCost(money=2000, equipment=3, agent_time_hours=12),
-            "intelligence": ResourceCost(money=300, equipment=1, agent_time_hours=16),
-            "recruitment": ResourceCost(money=800, equipment=1, agent_time_hours=10),
-            "rescue": ResourceCost(money=3000, equipment=3, agent_time_hours=6),
-            "assassination": ResourceCost(money=5000, equipment=4, agent_time_hours=4),
-        }
-
-        base_cost = base_costs.get(
-            mission_type, ResourceCost(money=1000, agent_time_hours=8)
-        )
+        base_cost = BASE_RESOURCE_COSTS.get(mission_type, DEFAULT_RESOURCE_COST)
 
         # Scale by number of agents
         multiplier = len(agents) * 0.7 + 0.3
 
-        # Outcome modifiers
-        outcome_modifiers = {
-            ExecutionOutcome.PERFECT_SUCCESS: 0.8,  # Efficient execution
-            ExecutionOutcome.SUCCESS_WITH_COMPLICATIONS: 1.2,  # Extra resources needed
-            ExecutionOutcome.PARTIAL_SUCCESS: 1.1,
-            ExecutionOutcome.FAILURE_WITH_INTEL: 1.3,  # Wasted resources
-            ExecutionOutcome.COMPLETE_FAILURE: 1.5,
-            ExecutionOutcome.CATASTROPHIC_FAILURE: 2.0,
-        }
-
-        modifier = outcome_modifiers.get(outcome, 1.0)
+        modifier = OUTCOME_COST_MODIFIERS.get(outcome, 1.0)
 
         return ResourceCost(
             money=int(base_cost.money * multiplier * modifier),
@@ -616,49 +924,16 @@ class MissionExecutionEngine:
     ) -> float:
         """Calculate how much the mission exposes the broader network"""
         mission_type = mission.get("type", "propaganda")
-        base_exposure = {
-            "propaganda": 0.1,
-            "intelligence": 0.2,
-            "sabotage": 0.4,
-            "recruitment": 0.3,
-            "rescue": 0.6,
-            "assassination": 0.8,
-        }.get(mission_type, 0.3)
-
-        outcome_multipliers = {
-            ExecutionOutcome.PERFECT_SUCCESS: 0.3,
-            ExecutionOutcome.SUCCESS_WITH_COMPLICATIONS: 0.7,
-            ExecutionOutcome.PARTIAL_SUCCESS: 1.0,
-            ExecutionOutcome.FAILURE_WITH_INTEL: 1.2,
-            ExecutionOutcome.COMPLETE_FAILURE: 1.8,
-            ExecutionOutcome.CATASTROPHIC_FAILURE: 3.0,
-        }
-
-        return base_exposure * outcome_multipliers.get(outcome, 1.0)
+        base_exposure = BASE_NETWORK_EXPOSURE.get(mission_type, 0.3)
+        return base_exposure * EXPOSURE_OUTCOME_MULTIPLIERS.get(outcome, 1.0)
 
     def _calculate_safe_house_risk(
         self, mission: Dict[str, Any], outcome: ExecutionOutcome
     ) -> float:
         """Calculate risk to safe houses from mission"""
         mission_type = mission.get("type", "propaganda")
-        base_risk = {
-            "propaganda": 0.1,
-            "sabotage": 0.3,
-            "intelligence": 0.2,
-            "recruitment": 0.15,
-            "rescue": 0.4,
-            "assassination": 0.6,
-        }.get(mission_type, 0.3)
-
-        outcome_multipliers = {
-            ExecutionOutcome.PERFECT_SUCCESS: 0.5,
-            ExecutionOutcome.SUCCESS_WITH_COMPLICATIONS: 0.8,
-            ExecutionOutcome.PARTIAL_SUCCESS: 1.0,
-            ExecutionOutcome.COMPLETE_FAILURE: 1.5,
-            ExecutionOutcome.CATASTROPHIC_FAILURE: 2.0,
-        }
-
-        return base_risk * outcome_multipliers.get(outcome, 1.0)
+        base_risk = BASE_SAFE_HOUSE_RISK.get(mission_type, 0.3)
+        return base_risk * SAFE_HOUSE_OUTCOME_MULTIPLIERS.get(outcome, 1.0)
 
     def _generate_mission_consequences(
         self,
@@ -1004,15 +1279,15 @@ class MissionExecutionEngine:
                     "communication_intercepts",
                 ]
                 for intel_type in intel_types:
-                    if random.random() < 0.6:  # 60% chance per type
+                    if get_rng("missions").random() < 0.6:  # 60% chance per type
                         intel_gathered.append(
                             {
                                 "type": intel_type,
                                 "reliability": 0.8
                                 if outcome == ExecutionOutcome.PERFECT_SUCCESS
                                 else 0.6,
-                                "urgency": random.randint(3, 8),
-                                "actionable": random.random() < 0.7,
+                                "urgency": get_rng("missions").randint(3, 8),
+                                "actionable": get_rng("missions").random() < 0.7,
                             }
                         )
 
@@ -1046,8 +1321,9 @@ class MissionExecutionEngine:
         if outcome == ExecutionOutcome.CATASTROPHIC_FAILURE:
             # Catastrophic failures can compromise multiple network elements
             effects["network_cascade_risk"] = base_exposure * 1.5
-            effects["communication_compromise"] = random.random() < base_exposure
-            effects["asset_exposure"] = random.random() < (base_exposure * 0.7)
+            rng = get_rng("missions")
+            effects["communication_compromise"] = rng.random() < base_exposure
+            effects["asset_exposure"] = rng.random() < (base_exposure * 0.7)
 
         return effects
 
@@ -1071,43 +1347,20 @@ class MissionExecutionEngine:
             "agent_count": len(mission.get("participants", [])),
         }
 
-        self.execution_history.append(execution_record)
-
-        # Keep only recent history (last 50 missions)
-        if len(self.execution_history) > 50:
-            self.execution_history = self.execution_history[-50:]
+        self.pattern_log.append(execution_record)
 
-    def get_mission_success_patterns(self, mission_type: str = None) -> Dict[str, Any]:
+    def get_mission_success_patterns(
+        self, mission_type: str = None, location_id: str = None
+    ) -> Dict[str, Any]:
         """Analyze historical mission success patterns"""
 
-        relevant_missions = self.execution_history
-        if mission_type:
-            relevant_missions = [
-                m for m in self.execution_history if m["mission_type"] == mission_type
-            ]
-
-        if not relevant_missions:
-            return {"total_missions": 0, "success_rate": 0.0, "average_severity": 0.0}
-
-        successful_outcomes = [
-            "PERFECT_SUCCESS",
-            "SUCCESS_WITH_COMPLICATIONS",
-            "PARTIAL_SUCCESS",
-        ]
-        successes = sum(
-            1 for m in relevant_missions if m["outcome"] in successful_outcomes
+        aggregate = self.pattern_log.aggregate(
+            mission_type=mission_type or None, location_id=location_id
         )
+        if aggregate is None or not aggregate.count:
+            return {"total_missions": 0, "success_rate": 0.0, "average_severity": 0.0}
 
-        return {
-            "total_missions": len(relevant_missions),
-            "success_rate": successes / len(relevant_missions),
-            "average_severity": sum(m["severity_total"] for m in relevant_missions)
-            / len(relevant_missions),
-            "most_common_outcome": max(
-                set(m["outcome"] for m in relevant_missions),
-                key=lambda x: sum(1 for m in relevant_missions if m["outcome"] == x),
-            ),
-        }
+        return aggregate.summary()
 
     # Helper methods
     def _assess_agent_competency(
@@ -1122,15 +1375,7 @@ class MissionExecutionEngine:
             skills = agent.get("skills", {})
             mission_type = mission.get("type", "propaganda")
 
-            # Map mission types to relevant skills
-            relevant_skills = {
-                "propaganda": ["social", "intelligence"],
-                "sabotage": ["technical", "stealth"],
-                "assassination": ["combat", "stealth"],
-                "rescue": ["combat", "medical"],
-                "intelligence": ["intelligence", "stealth"],
-                "recruitment": ["social", "intelligence"],
-            }.get(mission_type, ["intelligence"])
+            relevant_skills = MISSION_SKILLS.get(mission_type, DEFAULT_MISSION_SKILLS)
 
             agent_competency = 0
             for skill in relevant_skills:
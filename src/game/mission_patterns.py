@@ -0,0 +1,233 @@
+"""
+Mission Execution Patterns for Years of Lead
+
+MissionExecutionEngine records one row per executed mission for AI learning
+and balance analysis. MissionPatternLog keeps every row of the campaign in
+an append-only log and folds each row into running aggregates as it
+arrives: overall, per mission type, per location, per (type, location) pair
+and per outcome. Queries read an aggregate directly instead of rescanning
+the history.
+
+Rows can be spilled to a JSON Lines file so the in-memory log stays small.
+records() streams the file followed by whatever is still buffered, and
+MissionPatternLog.load() rebuilds the aggregates from an existing file.
+"""
+
+import json
+import os
+from collections import deque
+from typing import Any, Dict, Hashable, Iterator, List, Optional
+
+SUCCESSFUL_OUTCOMES = frozenset(
+    ["perfect_success", "success_with_complications", "partial_success"]
+)
+
+# Turns for a mission's weight in the decayed rates to halve
+DEFAULT_HALF_LIFE = 10.0
+
+
+class PatternAggregate:
+    """Running totals over every mission record folded into it
+
+    Decayed rates weight each record by 0.5 ** (turns since it ran /
+    half_life), so they follow recent play while the plain rates cover the
+    whole campaign.
+    """
+
+    __slots__ = (
+        "half_life",
+        "count",
+        "successes",
+        "severity_total",
+        "outcome_counts",
+        "most_common_outcome",
+        "_last_turn",
+        "_decayed_weight",
+        "_decayed_successes",
+        "_decayed_severity",
+    )
+
+    def __init__(self, half_life: float = DEFAULT_HALF_LIFE):
+        self.half_life = half_life
+        self.count = 0
+        self.successes = 0
+        self.severity_total = 0.0
+        self.outcome_counts: Dict[str, int] = {}
+        self.most_common_outcome: Optional[str] = None
+        self._last_turn = 0
+        self._decayed_weight = 0.0
+        self._decayed_successes = 0.0
+        self._decayed_severity = 0.0
+
+    def add(self, record: Dict[str, Any]):
+        outcome = record["outcome"]
+        success = outcome in SUCCESSFUL_OUTCOMES
+        severity = record.get("severity_total", 0.0)
+        turn = record.get("turn") or 0
+
+        if self.count:
+            elapsed = max(0, turn - self._last_turn)
+            if elapsed:
+                factor = 0.5 ** (elapsed / self.half_life)
+                self._decayed_weight *= factor
+                self._decayed_successes *= factor
+                self._decayed_severity *= factor
+        self._last_turn = max(self._last_turn, turn)
+        self._decayed_weight += 1.0
+        self._decayed_successes += success
+        self._decayed_severity += severity
+
+        self.count += 1
+        self.successes += success
+        self.severity_total += severity
+
+        # Counts only grow, so the leader can only be overtaken by this one
+        count = self.outcome_counts.get(outcome, 0) + 1
+        self.outcome_counts[outcome] = count
+        if (
+            self.most_common_outcome is None
+            or count > self.outcome_counts[self.most_common_outcome]
+        ):
+            self.most_common_outcome = outcome
+
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.count if self.count else 0.0
+
+    @property
+    def average_severity(self) -> float:
+        return self.severity_total / self.count if self.count else 0.0
+
+    @property
+    def decayed_success_rate(self) -> float:
+        if not self._decayed_weight:
+            return 0.0
+        return self._decayed_successes / self._decayed_weight
+
+    @property
+    def decayed_average_severity(self) -> float:
+        if not self._decayed_weight:
+            return 0.0
+        return self._decayed_severity / self._decayed_weight
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "total_missions": self.count,
+            "success_rate": self.success_rate,
+            "average_severity": self.average_severity,
+            "most_common_outcome": self.most_common_outcome,
+            "decayed_success_rate": self.decayed_success_rate,
+            "decayed_average_severity": self.decayed_average_severity,
+            "outcome_counts": dict(self.outcome_counts),
+        }
+
+
+class MissionPatternLog:
+    """Append-only mission record log with per-key aggregates
+
+    Without ``spill_path`` every record stays in memory. With it, records
+    are appended to that JSON Lines file in chunks of ``buffer_size``.
+    ``recent`` always holds the last ``recent_size`` records.
+    """
+
+    def __init__(
+        self,
+        spill_path: Optional[str] = None,
+        buffer_size: int = 256,
+        recent_size: int = 50,
+        half_life: float = DEFAULT_HALF_LIFE,
+    ):
+        self.spill_path = spill_path
+        self.buffer_size = buffer_size
+        self.half_life = half_life
+        self.recent: deque = deque(maxlen=recent_size)
+        self.overall = PatternAggregate(half_life)
+        self.by_type: Dict[Hashable, PatternAggregate] = {}
+        self.by_location: Dict[Hashable, PatternAggregate] = {}
+        self.by_type_location: Dict[Hashable, PatternAggregate] = {}
+        self.by_outcome: Dict[str, PatternAggregate] = {}
+        self._buffer: List[Dict[str, Any]] = []
+        self._count = 0
+
+    @classmethod
+    def load(cls, spill_path: str, **kwargs) -> "MissionPatternLog":
+        """Open an existing spill file and rebuild its aggregates"""
+        log = cls(spill_path=spill_path, **kwargs)
+        for record in log._read_spilled():
+            log._fold(record)
+        return log
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, record: Dict[str, Any]):
+        """Add one mission record"""
+        self._fold(record)
+        self._buffer.append(record)
+        if self.spill_path and len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Write buffered records to the spill file, if there is one"""
+        if not self.spill_path or not self._buffer:
+            return
+        with open(self.spill_path, "a", encoding="utf-8") as f:
+            for record in self._buffer:
+                f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._buffer.clear()
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Every record in the order it was appended"""
+        yield from self._read_spilled()
+        yield from list(self._buffer)
+
+    def aggregate(
+        self,
+        mission_type: Hashable = None,
+        location_id: Hashable = None,
+        outcome: str = None,
+    ) -> Optional[PatternAggregate]:
+        """The aggregate for one key, or the overall one when none is given
+
+        A mission type and a location together select their pair's
+        aggregate; an outcome cannot be combined with either.
+        """
+        if outcome is not None and (
+            mission_type is not None or location_id is not None
+        ):
+            raise ValueError("An outcome aggregate cannot be narrowed further")
+        if mission_type is not None and location_id is not None:
+            return self.by_type_location.get((mission_type, location_id))
+        if mission_type is not None:
+            return self.by_type.get(mission_type)
+        if location_id is not None:
+            return self.by_location.get(location_id)
+        if outcome is not None:
+            return self.by_outcome.get(outcome)
+        return self.overall
+
+    def _fold(self, record: Dict[str, Any]):
+        self._count += 1
+        self.recent.append(record)
+        self.overall.add(record)
+        for table, key in (
+            (self.by_type, record.get("mission_type")),
+            (self.by_location, record.get("location_id")),
+            (
+                self.by_type_location,
+                (record.get("mission_type"), record.get("location_id")),
+            ),
+            (self.by_outcome, record["outcome"]),
+        ):
+            aggregate = table.get(key)
+            if aggregate is None:
+                aggregate = table[key] = PatternAggregate(self.half_life)
+            aggregate.add(record)
+
+    def _read_spilled(self) -> Iterator[Dict[str, Any]]:
+        if not self.spill_path or not os.path.exists(self.spill_path):
+            return
+        with open(self.spill_path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
@@ -9,9 +9,10 @@ import random
 import uuid
 import logging
 from enum import Enum
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 from dataclasses import dataclass, field
 from .character_creation import Character
+from .success_estimator import PlanSuccessModel, SuccessEstimator
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -137,43 +138,7 @@ class MissionPlan:
 
     def calculate_success_probability(self) -> float:
         """Calculate probability of mission success"""
-        base_probability = 0.5
-
-        # Adjust based on objective difficulty
-        difficulty_modifier = (10 - self.objective.difficulty) * 0.05
-        base_probability += difficulty_modifier
-
-        # Adjust based on participant skills
-        skill_bonus = 0
-        required_skills = self._get_required_skills()
-        for skill, required_level in required_skills.items():
-            team_skill = sum(
-                getattr(char.skills, skill, 1) for char in self.participants
-            )
-            if team_skill >= required_level:
-                skill_bonus += 0.1
-            elif team_skill >= required_level * 0.7:
-                skill_bonus += 0.05
-
-        base_probability += skill_bonus
-
-        # Adjust based on location risk
-        location_risks = self.location.get_risk_assessment()
-        risk_penalty = (location_risks["overall_risk"] - 5) * 0.05
-        base_probability -= risk_penalty
-
-        # Adjust based on planning quality
-        planning_bonus = 0
-        if self.approach_method:
-            planning_bonus += 0.1
-        if self.escape_plan:
-            planning_bonus += 0.1
-        if len(self.contingency_plans) > 0:
-            planning_bonus += min(0.2, len(self.contingency_plans) * 0.05)
-
-        base_probability += planning_bonus
-
-        return max(0.1, min(0.95, base_probability))
+        return PlanSuccessModel(self).evaluate(self.participants)
 
     def _get_required_skills(self) -> Dict[str, int]:
         """Get skills required for this mission type"""
@@ -645,6 +610,44 @@ class MissionPlanner:
             logger.error("Failed to create mission plan: %s", str(e))
             raise
 
+    def suggest_team(
+        self,
+        mission_type: MissionType,
+        location_name: str,
+        candidates: List[Character],
+        team_size: int,
+    ) -> Tuple[float, List[Character]]:
+        """
+        Find the team of team_size candidates with the best planned odds
+
+        Each call uses a fresh SuccessEstimator: characters carry no version
+        stamp, so features cached across calls would miss skill changes.
+
+        Returns:
+            (success probability, team) with approach, escape and
+            contingency plans left blank
+
+        Raises:
+            ValueError: If the location or mission type is unknown
+        """
+        location = self.available_locations.get(location_name)
+        objective = self.available_objectives.get(mission_type)
+        if not location:
+            raise ValueError(f"Location not found: {location_name}")
+        if not objective:
+            raise ValueError(f"Mission type not supported: {mission_type}")
+
+        plan = MissionPlan(
+            id="",
+            mission_type=mission_type,
+            objective=objective,
+            location=location,
+            participants=[],
+        )
+        return SuccessEstimator().best_team(
+            PlanSuccessModel(plan), candidates, team_size
+        )
+
     def _validate_mission_inputs(
         self,
         mission_type: MissionType,
@@ -0,0 +1,352 @@
+"""
+Headless Monte Carlo Campaign Runner for Years of Lead
+
+Runs many independent, seeded campaigns with automated turns and aggregates
+the outcomes, so balance changes can be checked against distributions
+instead of single playthroughs. Campaigns are fanned out across a process
+pool; each one reports compact per-turn records built from
+GameState.get_status_summary(), which can be streamed turn by turn.
+
+The headless GameState has no victory or defeat conditions of its own (the
+CLI keeps those), so campaigns are classified by the runner's own rule: see
+campaign_outcome().
+
+Usage:
+    python -m src.game.monte_carlo --campaigns 200 --turns 100 --workers 8
+"""
+
+import argparse
+import json
+import multiprocessing
+import queue
+import random
+import statistics
+import sys
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+
+@dataclass
+class CampaignConfig:
+    """Settings shared by every campaign in a batch"""
+
+    turns: int = 100
+    victory_influence: int = 200  # Runner's rule, not the game's: see below
+    stop_on_outcome: bool = True  # Stop a campaign at victory or defeat
+
+
+def campaign_outcome(summary: Dict[str, Any], config: CampaignConfig) -> Optional[str]:
+    """Classify a status summary as "victory", "defeat" or None
+
+    This is a stand-in rule for balance runs, not the game's victory and
+    defeat conditions: a campaign is lost when no agent is active or every
+    faction is out of money, and won when any faction reaches
+    ``config.victory_influence``.
+    """
+    if summary["active_agents"] == 0:
+        return "defeat"
+    factions = summary["factions"]
+    if factions and all(res.get("money", 0) <= 0 for res in factions.values()):
+        return "defeat"
+    if any(
+        res.get("influence", 0) >= config.victory_influence for res in factions.values()
+    ):
+        return "victory"
+    return None
+
+
+def compact_record(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a status summary to the numbers the aggregates need"""
+    return {
+        "turn": summary["turn"],
+        "active_agents": summary["active_agents"],
+        "resources": {
+            faction_id: [
+                res.get("money", 0),
+                res.get("influence", 0),
+                res.get("personnel", 0),
+            ]
+            for faction_id, res in summary["factions"].items()
+        },
+        "cohesion": {
+            faction_id: round(value, 4)
+            for faction_id, value in summary["faction_cohesion"].items()
+        },
+    }
+
+
+RecordCallback = Callable[[int, Dict[str, Any]], None]
+
+
+def run_campaign(
+    seed: int,
+    config: Optional[CampaignConfig] = None,
+    on_record: Optional[RecordCallback] = None,
+) -> Dict[str, Any]:
+    """Play one automated campaign from a seed and return its records
+
+    ``on_record`` is called with the seed and each per-turn record as soon
+    as the turn has been played.
+    """
+    from .core import GameState
+    from .rng import get_rng_service, set_rng_service
+
+    config = config or CampaignConfig()
+    # Subsystems draw from streams derived from the seed; the global random
+    # module is seeded as well for code that does not use the streams yet.
+    # Both are put back afterwards
+    random_state = random.getstate()
+    active_service = get_rng_service()
+    random.seed(seed)
+    try:
+        game_state = GameState(seed=seed)
+        return _play_campaign(game_state, seed, config, on_record)
+    finally:
+        set_rng_service(active_service)
+        random.setstate(random_state)
+
+
+def _play_campaign(
+    game_state,
+    seed: int,
+    config: CampaignConfig,
+    on_record: Optional[RecordCallback] = None,
+) -> Dict[str, Any]:
+    """Advance an initialized-on-entry game until the turn limit or an outcome"""
+    game_state.initialize_game()
+
+    records = []
+    outcome = None
+    outcome_turn = None
+    for _ in range(config.turns):
+        game_state.advance_turn(interactive=False)
+        summary = game_state.get_status_summary()
+        record = compact_record(summary)
+        records.append(record)
+        if on_record is not None:
+            on_record(seed, record)
+
+        if outcome is None:
+            outcome = campaign_outcome(summary, config)
+            if outcome is not None:
+                outcome_turn = summary["turn"]
+                if config.stop_on_outcome:
+                    break
+
+    return {
+        "seed": seed,
+        "outcome": outcome,
+        "outcome_turn": outcome_turn,
+        "turns_played": len(records),
+        "records": records,
+    }
+
+
+def _run_queued_campaign(seed: int, config: CampaignConfig, records) -> Dict[str, Any]:
+    """Pool worker: run a campaign, putting each record on a shared queue"""
+    return run_campaign(seed, config, lambda *item: records.put(item))
+
+
+def _drain_records(records, on_record: RecordCallback):
+    """Hand every queued (seed, record) pair to ``on_record``"""
+    while True:
+        try:
+            seed, record = records.get_nowait()
+        except queue.Empty:
+            return
+        on_record(seed, record)
+
+
+def iter_campaigns(
+    seeds: Sequence[int],
+    config: Optional[CampaignConfig] = None,
+    workers: Optional[int] = None,
+    on_record: Optional[RecordCallback] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Run campaigns for the given seeds, yielding results as they finish
+
+    With ``workers=1`` campaigns run in this process, in seed order.
+    Otherwise they are spread over a process pool (``None`` uses one worker
+    per CPU) and yielded in completion order. ``on_record`` receives
+    per-turn records while campaigns are still running, in this process;
+    all of a campaign's records arrive before its result is yielded.
+    """
+    config = config or CampaignConfig()
+    if workers == 1:
+        for seed in seeds:
+            yield run_campaign(seed, config, on_record)
+        return
+
+    if on_record is None:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_campaign, seed, config) for seed in seeds]
+            for future in as_completed(futures):
+                yield future.result()
+        return
+
+    with multiprocessing.Manager() as manager, ProcessPoolExecutor(
+        max_workers=workers
+    ) as executor:
+        records = manager.Queue()
+        pending = {
+            executor.submit(_run_queued_campaign, seed, config, records)
+            for seed in seeds
+        }
+        while pending:
+            done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            # A worker's records are queued before its future completes, so
+            # they are handed on before the campaign's result
+            _drain_records(records, on_record)
+            for future in done:
+                yield future.result()
+
+
+def _distribution(values: List[float]) -> Dict[str, Any]:
+    """Count, mean, spread and quantiles of a sample"""
+    if not values:
+        return {"count": 0}
+    result = {
+        "count": len(values),
+        "mean": statistics.fmean(values),
+        "stdev": statistics.pstdev(values),
+        "min": min(values),
+        "max": max(values),
+    }
+    if len(values) > 1:
+        p10, _, _, _, p50, _, _, _, p90 = statistics.quantiles(values, n=10)
+        result.update({"p10": p10, "p50": p50, "p90": p90})
+    else:
+        result.update({"p10": values[0], "p50": values[0], "p90": values[0]})
+    return result
+
+
+def aggregate_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Aggregate campaign results into outcome and resource distributions"""
+    outcomes: Dict[str, int] = {}
+    victory_turns = []
+    defeat_turns = []
+    final_resources: Dict[str, Dict[str, List[float]]] = {}
+    final_cohesion: Dict[str, List[float]] = {}
+
+    for result in results:
+        outcome = result["outcome"] or "undecided"
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+        if result["outcome"] == "victory":
+            victory_turns.append(result["outcome_turn"])
+        elif result["outcome"] == "defeat":
+            defeat_turns.append(result["outcome_turn"])
+
+        if not result["records"]:
+            continue
+        final = result["records"][-1]
+        for faction_id, (money, influence, personnel) in final["resources"].items():
+            faction = final_resources.setdefault(
+                faction_id, {"money": [], "influence": [], "personnel": []}
+            )
+            faction["money"].append(money)
+            faction["influence"].append(influence)
+            faction["personnel"].append(personnel)
+        for faction_id, cohesion in final["cohesion"].items():
+            final_cohesion.setdefault(faction_id, []).append(cohesion)
+
+    return {
+        "campaigns": len(results),
+        "outcomes": outcomes,
+        "victory_turn": _distribution(victory_turns),
+        "defeat_turn": _distribution(defeat_turns),
+        "final_resources": {
+            faction_id: {
+                name: _distribution(values) for name, values in resources.items()
+            }
+            for faction_id, resources in final_resources.items()
+        },
+        "final_cohesion": {
+            faction_id: _distribution(values)
+            for faction_id, values in final_cohesion.items()
+        },
+    }
+
+
+def run_batch(
+    campaigns: int,
+    base_seed: int = 0,
+    config: Optional[CampaignConfig] = None,
+    workers: Optional[int] = None,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    on_record: Optional[RecordCallback] = None,
+) -> Dict[str, Any]:
+    """Run ``campaigns`` seeded campaigns and return their aggregate
+
+    Seeds are ``base_seed .. base_seed + campaigns - 1``, so a batch is
+    reproducible. ``on_result`` is called with each campaign result as soon
+    as it finishes, and ``on_record`` with the seed and record of every
+    turn as it is played, for example to stream records to disk.
+    """
+    config = config or CampaignConfig()
+    seeds = range(base_seed, base_seed + campaigns)
+    results = []
+    for result in iter_campaigns(seeds, config, workers, on_record):
+        if on_result is not None:
+            on_result(result)
+        results.append(result)
+
+    results.sort(key=lambda result: result["seed"])
+    aggregate = aggregate_results(results)
+    aggregate["config"] = asdict(config)
+    aggregate["base_seed"] = base_seed
+    return aggregate
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Run seeded headless campaigns")
+    parser.add_argument("--campaigns", type=int, default=100)
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument(
+        "--seed", type=int, default=0, help="Seed of the first campaign"
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--victory-influence", type=int, default=200)
+    parser.add_argument(
+        "--records", help="Stream every campaign's per-turn records to this JSONL file"
+    )
+    parser.add_argument("--output", help="Write the aggregate JSON to this file")
+    args = parser.parse_args(argv)
+
+    config = CampaignConfig(turns=args.turns, victory_influence=args.victory_influence)
+
+    records_file = open(args.records, "w") if args.records else None
+    try:
+
+        def on_record(seed, record):
+            line = json.dumps(dict(record, seed=seed), separators=(",", ":"))
+            records_file.write(line + "\n")
+
+        aggregate = run_batch(
+            args.campaigns,
+            args.seed,
+            config,
+            args.workers,
+            on_record=on_record if records_file is not None else None,
+        )
+    finally:
+        if records_file is not None:
+            records_file.close()
+
+    text = json.dumps(aggregate, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
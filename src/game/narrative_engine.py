@@ -7,7 +7,8 @@ for enhanced narrative generation and emotional storytelling.
 
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
-import random
+from .narrative_index import TemplateIndex
+from .rng import get_rng
 from .relationships import Relationship, BondType, EventType
 from .core import Agent, GameState
 from .advanced_relationships import Secret, MemoryEntry, SecretType
@@ -54,6 +55,13 @@ class NarrativeEngine:
         self.recently_used = []
         self.max_recent = 10
 
+        # Compiled constraints of self.templates, rebuilt when the list changes
+        self._template_index: Optional[TemplateIndex] = None
+        # The indexed list itself is kept so a replaced list cannot be
+        # mistaken for it through a recycled id()
+        self._template_index_source: Optional[List[NarrativeTemplate]] = None
+        self._template_index_size = 0
+
         # SYLVA/WREN integration placeholders
         self.sylva_enabled = False
         self.wren_enabled = False
@@ -441,87 +449,34 @@ class NarrativeEngine:
         context: Dict[str, Any],
     ) -> Optional[NarrativeTemplate]:
         """Find a template that matches the current situation"""
-
-        # Filter templates by basic criteria
-        candidates = []
-
-        for template in self.templates:
-            # Skip recently used templates
-            if template.id in self.recently_used:
-                continue
-
-            # Check bond type requirement
-            if (
-                template.required_bond_type
-                and relationship.bond_type != template.required_bond_type
-            ):
-                continue
-
-            # Check affinity requirements
-            if (
-                template.min_affinity is not None
-                and relationship.affinity < template.min_affinity
-            ):
-                continue
-            if (
-                template.max_affinity is not None
-                and relationship.affinity > template.max_affinity
-            ):
-                continue
-
-            # Check trust requirements
-            if (
-                template.min_trust is not None
-                and relationship.trust < template.min_trust
-            ):
-                continue
-            if (
-                template.max_trust is not None
-                and relationship.trust > template.max_trust
-            ):
-                continue
-
-            # Check loyalty requirements
-            if (
-                template.min_loyalty is not None
-                and relationship.loyalty < template.min_loyalty
-            ):
-                continue
-            if (
-                template.max_loyalty is not None
-                and relationship.loyalty > template.max_loyalty
-            ):
-                continue
-
-            # Check tag requirements
-            if template.required_tags:
-                agent_tags = agent_a.social_tags.union(agent_b.social_tags)
-                if not any(tag in agent_tags for tag in template.required_tags):
-                    continue
-
-            if template.excluded_tags:
-                agent_tags = agent_a.social_tags.union(agent_b.social_tags)
-                if any(tag in agent_tags for tag in template.excluded_tags):
-                    continue
-
-            candidates.append(template)
-
+        index = self._get_template_index()
+        candidates = index.match(
+            relationship,
+            agent_a.social_tags | agent_b.social_tags,
+            exclude_ids=self.recently_used,
+        )
         if not candidates:
             return None
 
-        # Weight by rarity and complexity
-        weighted_candidates = []
-        for template in candidates:
-            weight = template.rarity * (
-                6 - template.complexity
-            )  # Higher complexity = lower weight
-            weighted_candidates.extend([template] * int(weight * 10))
-
-        if weighted_candidates:
-            return random.choice(weighted_candidates)
+        # Weighted by rarity and complexity (higher complexity = lower weight)
+        table = index.table(candidates)
+        if table:
+            return table.sample(get_rng("narrative_engine"))
 
         return None
 
+    def _get_template_index(self) -> TemplateIndex:
+        """Template index for the current template list"""
+        if (
+            self._template_index is None
+            or self._template_index_source is not self.templates
+            or self._template_index_size != len(self.templates)
+        ):
+            self._template_index = TemplateIndex(self.templates)
+            self._template_index_source = self.templates
+            self._template_index_size = len(self.templates)
+        return self._template_index
+
     def _generate_fallback_narrative(
         self,
         agent_a: Agent,
@@ -635,6 +590,7 @@ class NarrativeEngine:
     def add_custom_template(self, template: NarrativeTemplate):
         """Add a custom narrative template"""
         self.templates.append(template)
+        self._template_index = None
 
     def get_template_statistics(self) -> Dict[str, Any]:
         """Get statistics about template usage"""
@@ -696,20 +652,20 @@ class NarrativeEngine:
         if not relationship:
             return None
 
-        # Filter templates by advanced requirements
-        candidates = []
-
-        for template in self.templates:
-            if template.id in self.recently_used:
-                continue
-
-            # Check basic requirements
-            if not self._check_basic_requirements(
-                template, agent_a, agent_b, relationship
-            ):
-                continue
+        # Static requirements come from the index; the advanced ones depend
+        # on the agents' secrets, memories and personas and are checked on
+        # the remaining candidates only
+        index = self._get_template_index()
+        matched = index.match(
+            relationship,
+            agent_a.social_tags | agent_b.social_tags,
+            exclude_ids=self.recently_used,
+            require_all_tags=True,
+        )
 
-            # Check advanced requirements
+        candidates = []
+        candidate_mask = 0
+        for bit, template in index.iter_members(matched):
             if template.requires_secret and not self._check_secret_requirement(
                 template, agent_a, agent_b
             ):
@@ -732,79 +688,17 @@ class NarrativeEngine:
                 continue
 
             candidates.append(template)
+            candidate_mask |= bit
 
         if not candidates:
             return None
 
-        # Weight by rarity and complexity
-        weighted_candidates = []
-        for template in candidates:
-            weight = template.rarity * (
-                6 - template.complexity
-            )  # Higher complexity = lower weight
-            weighted_candidates.extend([template] * int(weight * 10))
-
-        if not weighted_candidates:
-            return random.choice(candidates)
-
-        return random.choice(weighted_candidates)
-
-    def _check_basic_requirements(
-        self,
-        template: NarrativeTemplate,
-        agent_a: Agent,
-        agent_b: Agent,
-        relationship: Relationship,
-    ) -> bool:
-        """Check if basic template requirements are met"""
-        # Check bond type requirement
-        if (
-            template.required_bond_type
-            and relationship.bond_type != template.required_bond_type
-        ):
-            return False
-
-        # Check affinity range
-        if (
-            template.min_affinity is not None
-            and relationship.affinity < template.min_affinity
-        ):
-            return False
-        if (
-            template.max_affinity is not None
-            and relationship.affinity > template.max_affinity
-        ):
-            return False
-
-        # Check trust range
-        if template.min_trust is not None and relationship.trust < template.min_trust:
-            return False
-        if template.max_trust is not None and relationship.trust > template.max_trust:
-            return False
-
-        # Check loyalty range
-        if (
-            template.min_loyalty is not None
-            and relationship.loyalty < template.min_loyalty
-        ):
-            return False
-        if (
-            template.max_loyalty is not None
-            and relationship.loyalty > template.max_loyalty
-        ):
-            return False
-
-        # Check required tags
-        for tag in template.required_tags:
-            if tag not in agent_a.social_tags and tag not in agent_b.social_tags:
-                return False
-
-        # Check excluded tags
-        for tag in template.excluded_tags:
-            if tag in agent_a.social_tags or tag in agent_b.social_tags:
-                return False
+        # Weight by rarity and complexity (higher complexity = lower weight)
+        table = index.table(candidate_mask)
+        if not table:
+            return get_rng("narrative_engine").choice(candidates)
 
-        return True
+        return table.sample(get_rng("narrative_engine"))
 
     def _check_secret_requirement(
         self, template: NarrativeTemplate, agent_a: Agent, agent_b: Agent
@@ -950,9 +844,9 @@ class NarrativeEngine:
         # Prefer weaponized secrets for dramatic effect
         weaponized = [s for s in all_secrets if s.weaponized]
         if weaponized:
-            return random.choice(weaponized)
+            return get_rng("narrative_engine").choice(weaponized)
 
-        return random.choice(all_secrets)
+        return get_rng("narrative_engine").choice(all_secrets)
 
     def _get_relevant_memory(
         self, agent_a: Agent, agent_b: Agent, memory_tone: Optional[str]
@@ -974,9 +868,9 @@ class NarrativeEngine:
             m for m in all_memories if m.get_age(self.game_state.turn_number) <= 5
         ]
         if recent_memories:
-            return random.choice(recent_memories)
+            return get_rng("narrative_engine").choice(recent_memories)
 
-        return random.choice(all_memories)
+        return get_rng("narrative_engine").choice(all_memories)
 
     def register_character_voice(
         self, character_id: str, voice_config: VoiceConfiguration
@@ -1114,9 +1008,9 @@ class NarrativeEngine:
                 t for t in suitable_templates if t.id not in self.recently_used
             ]
             if unused_templates:
-                return random.choice(unused_templates)
+                return get_rng("narrative_engine").choice(unused_templates)
             else:
-                return random.choice(suitable_templates)
+                return get_rng("narrative_engine").choice(suitable_templates)
 
         return None
 
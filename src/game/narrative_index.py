@@ -0,0 +1,181 @@
+"""
+Narrative Template Index for Years of Lead
+
+Precompiles the static constraints of narrative templates so matching a
+relationship against them does not walk every template. Templates are held
+as bit positions in Python ints:
+
+- one mask per required bond type (templates without one are always in)
+- for each numeric threshold (affinity, trust, loyalty), templates sorted by
+  their minimum and maximum with prefix masks, so "all templates whose range
+  admits this value" is a bisect plus a lookup
+- one mask per required and per excluded social tag
+
+Weighted sampling over a candidate mask uses an AliasTable that is cached
+per mask, since the same few relationship states recur turn after turn.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .sampling import AliasTable
+
+NUMERIC_FIELDS = ("affinity", "trust", "loyalty")
+
+
+class _ThresholdIndex:
+    """Masks of templates whose [min, max] range admits a value"""
+
+    def __init__(self, bounds: Sequence[Tuple[Optional[float], Optional[float]]]):
+        unbounded_min = 0
+        unbounded_max = 0
+        mins: List[Tuple[float, int]] = []
+        maxes: List[Tuple[float, int]] = []
+        for position, (low, high) in enumerate(bounds):
+            bit = 1 << position
+            if low is None:
+                unbounded_min |= bit
+            else:
+                mins.append((low, bit))
+            if high is None:
+                unbounded_max |= bit
+            else:
+                maxes.append((high, bit))
+
+        # Ascending minimums: prefix i holds templates with min <= mins[i-1]
+        mins.sort(key=lambda item: item[0])
+        self._min_values = [value for value, _ in mins]
+        self._min_prefix = [unbounded_min]
+        for _, bit in mins:
+            self._min_prefix.append(self._min_prefix[-1] | bit)
+
+        # Ascending maximums: suffix i holds templates with max >= maxes[i]
+        maxes.sort(key=lambda item: item[0])
+        self._max_values = [value for value, _ in maxes]
+        self._max_suffix = [unbounded_max] * (len(maxes) + 1)
+        for i in range(len(maxes) - 1, -1, -1):
+            self._max_suffix[i] = self._max_suffix[i + 1] | maxes[i][1]
+
+    def admitting(self, value: float) -> int:
+        """Mask of templates with min <= value <= max"""
+        low_ok = self._min_prefix[bisect_right(self._min_values, value)]
+        high_ok = self._max_suffix[bisect_left(self._max_values, value)]
+        return low_ok & high_ok
+
+
+class TemplateIndex:
+    """Bitset index over a list of NarrativeTemplates"""
+
+    def __init__(self, templates: Sequence[Any], cache_size: int = 1024):
+        self.templates = list(templates)
+        self.cache_size = cache_size
+        self.all_mask = (1 << len(self.templates)) - 1
+
+        self._bond_masks: Dict[Any, int] = {}
+        self._any_bond_mask = 0
+        self._positions: Dict[str, int] = {}
+        self._no_required_tags = 0
+        self._required_tag_masks: Dict[str, int] = {}
+        self._excluded_tag_masks: Dict[str, int] = {}
+        self.weights: List[int] = []
+
+        for position, template in enumerate(self.templates):
+            bit = 1 << position
+            self._positions[template.id] = self._positions.get(template.id, 0) | bit
+
+            if template.required_bond_type is None:
+                self._any_bond_mask |= bit
+            else:
+                self._bond_masks[template.required_bond_type] = (
+                    self._bond_masks.get(template.required_bond_type, 0) | bit
+                )
+
+            if not template.required_tags:
+                self._no_required_tags |= bit
+            for tag in template.required_tags:
+                self._required_tag_masks[tag] = (
+                    self._required_tag_masks.get(tag, 0) | bit
+                )
+            for tag in template.excluded_tags:
+                self._excluded_tag_masks[tag] = (
+                    self._excluded_tag_masks.get(tag, 0) | bit
+                )
+
+            # Same weighting as replicating a template int(weight * 10) times
+            weight = template.rarity * (6 - template.complexity)
+            self.weights.append(max(0, int(weight * 10)))
+
+        self._thresholds = {
+            name: _ThresholdIndex(
+                [
+                    (getattr(t, f"min_{name}"), getattr(t, f"max_{name}"))
+                    for t in self.templates
+                ]
+            )
+            for name in NUMERIC_FIELDS
+        }
+        self._tables: Dict[int, AliasTable] = {}
+
+    def ids_mask(self, template_ids: Iterable[str]) -> int:
+        """Mask of the templates with the given ids"""
+        mask = 0
+        for template_id in template_ids:
+            mask |= self._positions.get(template_id, 0)
+        return mask
+
+    def match(
+        self,
+        relationship: Any,
+        agent_tags: Set[str],
+        exclude_ids: Iterable[str] = (),
+        require_all_tags: bool = False,
+    ) -> int:
+        """Mask of templates whose static constraints the situation meets
+
+        ``require_all_tags`` selects between needing any one of a template's
+        required tags (the default) or all of them.
+        """
+        mask = self._any_bond_mask | self._bond_masks.get(relationship.bond_type, 0)
+        for name in NUMERIC_FIELDS:
+            mask &= self._thresholds[name].admitting(getattr(relationship, name))
+            if not mask:
+                return 0
+
+        if require_all_tags:
+            for tag, tag_mask in self._required_tag_masks.items():
+                if tag not in agent_tags:
+                    mask &= ~tag_mask
+        else:
+            tags_ok = self._no_required_tags
+            for tag in agent_tags:
+                tags_ok |= self._required_tag_masks.get(tag, 0)
+            mask &= tags_ok
+
+        for tag in agent_tags:
+            excluded = self._excluded_tag_masks.get(tag)
+            if excluded:
+                mask &= ~excluded
+
+        return mask & ~self.ids_mask(exclude_ids)
+
+    def iter_members(self, mask: int) -> Iterator[Tuple[int, Any]]:
+        """Yield (bit, template) for each template in a mask, in list order"""
+        while mask:
+            bit = mask & -mask
+            yield bit, self.templates[bit.bit_length() - 1]
+            mask ^= bit
+
+    def table(self, mask: int) -> AliasTable:
+        """Weighted alias table over a mask, built once per distinct mask"""
+        table = self._tables.get(mask)
+        if table is None:
+            if len(self._tables) >= self.cache_size:
+                self._tables.clear()
+            members = []
+            weights = []
+            for bit, template in self.iter_members(mask):
+                members.append(template)
+                weights.append(self.weights[bit.bit_length() - 1])
+            table = AliasTable(members, weights)
+            self._tables[mask] = table
+        return table
@@ -0,0 +1,201 @@
+"""
+Turn Profiler for Years of Lead
+
+Records wall time, call counts and (optionally) allocation deltas for each
+phase of GameState.advance_turn and for any subsystem hook wrapped with
+TurnProfiler.instrument. Phases nest, so every sample is stored under its
+full path (e.g. "turn;resolution;social_clusters"), which is what
+flamegraph tools expect in their folded-stack input.
+
+The profiler is disabled by default; while disabled, phase() returns a
+shared no-op context manager so the instrumentation costs almost nothing.
+"""
+
+import functools
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Deque, Dict, List, Optional, TextIO
+
+_NULL_CONTEXT = nullcontext()
+
+
+class PhaseStats:
+    """Accumulated timings for one phase path"""
+
+    __slots__ = ("calls", "total_time", "max_time", "alloc_bytes")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.alloc_bytes = 0
+
+    def add(self, elapsed: float, alloc_bytes: int):
+        self.calls += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self.alloc_bytes += alloc_bytes
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "total_time": self.total_time,
+            "mean_time": self.total_time / self.calls if self.calls else 0.0,
+            "max_time": self.max_time,
+            "alloc_bytes": self.alloc_bytes,
+        }
+
+
+class TurnProfiler:
+    """Per-phase timing of game turns"""
+
+    def __init__(self, enabled: bool = False, history: int = 100):
+        self.enabled = enabled
+        self.track_allocations = False
+        self.stats: Dict[str, PhaseStats] = {}
+        # One {path: elapsed} dict per profiled turn, most recent last
+        self.turns: Deque[Dict[str, Any]] = deque(maxlen=history)
+
+        self._stack: List[str] = []
+        self._current_turn: Optional[Dict[str, Any]] = None
+
+    def enable(self, track_allocations: bool = False):
+        """Start recording; allocation tracking uses tracemalloc and is slow"""
+        self.enabled = True
+        self.track_allocations = track_allocations
+        if track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def disable(self):
+        """Stop recording, keeping what was collected"""
+        self.enabled = False
+        if self.track_allocations and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.track_allocations = False
+
+    def reset(self):
+        """Drop all collected statistics"""
+        self.stats = {}
+        self.turns.clear()
+
+    def phase(self, name: str):
+        """Context manager timing a (possibly nested) phase"""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._record(name)
+
+    def turn(self, turn_number: int):
+        """Context manager timing a whole turn and collecting its phases"""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._record_turn(turn_number)
+
+    @contextmanager
+    def _record_turn(self, turn_number: int):
+        self._current_turn = {"turn": turn_number, "phases": {}}
+        try:
+            with self._record("turn"):
+                yield
+        finally:
+            self.turns.append(self._current_turn)
+            self._current_turn = None
+
+    @contextmanager
+    def _record(self, name: str):
+        self._stack.append(name)
+        path = ";".join(self._stack)
+        alloc_start = (
+            tracemalloc.get_traced_memory()[0] if self.track_allocations else 0
+        )
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            alloc = (
+                tracemalloc.get_traced_memory()[0] - alloc_start
+                if self.track_allocations
+                else 0
+            )
+            self._stack.pop()
+
+            stats = self.stats.get(path)
+            if stats is None:
+                stats = self.stats[path] = PhaseStats()
+            stats.add(elapsed, alloc)
+            if self._current_turn is not None:
+                phases = self._current_turn["phases"]
+                phases[path] = phases.get(path, 0.0) + elapsed
+
+    def instrument(self, name: Optional[str] = None) -> Callable:
+        """Decorator timing every call of a function as a phase"""
+
+        def decorator(func):
+            phase_name = name or func.__name__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self._record(phase_name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Accumulated statistics for every phase path"""
+        return {path: stats.as_dict() for path, stats in self.stats.items()}
+
+    def last_turn(self) -> Optional[Dict[str, Any]]:
+        """Phase timings of the most recently profiled turn"""
+        return self.turns[-1] if self.turns else None
+
+    def recent_turn_times(self, turns: int = 10) -> List[float]:
+        """Total wall time of the most recent profiled turns"""
+        recent = list(self.turns)[-turns:]
+        return [turn["phases"].get("turn", 0.0) for turn in recent]
+
+    def summary(self) -> Dict[str, Any]:
+        """Compact overview for status displays"""
+        if not self.turns:
+            return {"enabled": self.enabled, "turns_profiled": 0}
+        times = self.recent_turn_times()
+        last = self.turns[-1]
+        return {
+            "enabled": self.enabled,
+            "turns_profiled": len(self.turns),
+            "mean_turn_time": sum(times) / len(times),
+            "last_turn": last["turn"],
+            "last_turn_phases": {
+                path.split(";", 1)[1]: elapsed
+                for path, elapsed in last["phases"].items()
+                if path.count(";") == 1
+            },
+        }
+
+    def dump_folded(self, out: TextIO, turn: Optional[int] = None):
+        """Write folded stacks ("a;b;c <microseconds>") for flamegraph tools
+
+        Each line carries the self time of its stack, i.e. the time not spent
+        in a nested phase. With ``turn`` only that turn is written, otherwise
+        the accumulated totals are.
+        """
+        if turn is None:
+            totals = {path: stats.total_time for path, stats in self.stats.items()}
+        else:
+            totals = next(
+                (dict(t["phases"]) for t in self.turns if t["turn"] == turn), {}
+            )
+
+        for path in sorted(totals):
+            self_time = totals[path] - sum(
+                elapsed
+                for child, elapsed in totals.items()
+                if child.startswith(path + ";")
+                and child.count(";") == path.count(";") + 1
+            )
+            out.write(f"{path} {max(0, int(self_time * 1_000_000))}\n")
@@ -5,10 +5,12 @@ This module provides a comprehensive random events system that generates
 dynamic encounters and events affecting players, factions, and the environment.
 """
 
-import random
+import heapq
 from enum import Enum
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
+from .rng import get_rng
+from .sampling import AliasTable
 
 
 class EventType(Enum):
@@ -70,7 +72,7 @@ class RandomEvent:
 
     def get_random_outcome(self) -> EventOutcome:
         """Get a random outcome based on probabilities"""
-        roll = random.random()
+        roll = get_rng("random_events").random()
         cumulative_prob = 0.0
 
         for outcome in self.outcomes:
@@ -97,6 +99,114 @@ class Encounter:
     consequences: Dict[str, Any] = field(default_factory=dict)
 
 
+SEVERITY_WEIGHTS = {
+    EventSeverity.MINOR: 1,
+    EventSeverity.MODERATE: 2,
+    EventSeverity.MAJOR: 3,
+    EventSeverity.CRITICAL: 4,
+}
+
+
+class EventConditionIndex:
+    """Bitset index of events by their trigger conditions
+
+    Each event is a bit. For every condition key the index holds the events
+    that do not constrain that key and, per allowed value, the events that
+    accept it, so the events whose conditions a game state meets come out of
+    one dict lookup per condition key instead of a check per event. Events
+    with unhashable condition values are kept aside and checked directly.
+    """
+
+    def __init__(self, events: List[RandomEvent], cache_size: int = 256):
+        self.events = list(events)
+        self.cache_size = cache_size
+        self.all_mask = (1 << len(self.events)) - 1
+        self.positions: Dict[str, int] = {}
+        self.base_weights: List[int] = []
+        self.unindexed_mask = 0
+        # condition key -> (events constraining it, {value: accepting events})
+        self._conditions: Dict[str, Tuple[int, Dict[Any, int]]] = {}
+        self._tables: Dict[Tuple[int, int], AliasTable] = {}
+
+        for position, event in enumerate(self.events):
+            bit = 1 << position
+            self.positions[event.id] = position
+            self.base_weights.append(SEVERITY_WEIGHTS.get(event.severity, 1))
+            try:
+                accepted = self._accepted_values(event)
+            except TypeError:
+                self.unindexed_mask |= bit
+                continue
+            for key, values in accepted.items():
+                constrained, by_value = self._conditions.get(key, (0, {}))
+                for value in values:
+                    by_value[value] = by_value.get(value, 0) | bit
+                self._conditions[key] = (constrained | bit, by_value)
+
+    @staticmethod
+    def _accepted_values(event: RandomEvent) -> Dict[str, List[Any]]:
+        """Values each condition key accepts; raises TypeError if unhashable"""
+        accepted = {}
+        for condition, value in event.trigger_conditions.items():
+            if condition == "turn_number" and value == "any":
+                continue
+            values = value if isinstance(value, list) else [value]
+            for item in values:
+                hash(item)
+            accepted[condition] = values
+        return accepted
+
+    def match(self, game_state: Dict[str, Any]) -> int:
+        """Mask of indexed events whose conditions the state meets, plus
+        the unindexed events, which still need checking"""
+        mask = self.all_mask
+        for key, (constrained, by_value) in self._conditions.items():
+            if key in game_state:
+                try:
+                    accepted = by_value.get(game_state[key], 0)
+                except TypeError:
+                    # Unhashable state values never equal a hashable condition
+                    accepted = 0
+            else:
+                accepted = 0
+            mask &= ~constrained | accepted | self.unindexed_mask
+            if not mask:
+                break
+        return mask
+
+    def ids_mask(self, event_ids) -> int:
+        """Mask of the events with the given ids"""
+        mask = 0
+        for event_id in event_ids:
+            position = self.positions.get(event_id)
+            if position is not None:
+                mask |= 1 << position
+        return mask
+
+    def iter_members(self, mask: int):
+        """Yield (bit, event) for each event in a mask"""
+        while mask:
+            bit = mask & -mask
+            yield bit, self.events[bit.bit_length() - 1]
+            mask ^= bit
+
+    def table(self, mask: int, bonus: int) -> AliasTable:
+        """Alias table over a mask with ``bonus`` added to every weight"""
+        key = (mask, bonus)
+        table = self._tables.get(key)
+        if table is None:
+            if len(self._tables) >= self.cache_size:
+                self._tables.clear()
+            members = []
+            weights = []
+            for bit, event in self.iter_members(mask):
+                members.append(event)
+                weights.append(self.base_weights[bit.bit_length() - 1] + bonus)
+            table = AliasTable(members, weights)
+            self._tables[key] = table
+        return table
+
+
 class EventGenerator:
     """Main class for generating random events and encounters"""
 
@@ -104,7 +214,70 @@ class EventGenerator:
         self.events = self._create_events()
         self.encounters = self._create_encounters()
         self.active_events = {}
-        self.event_cooldowns = {}
+
+        # Cooldowns expire on a turn clock advanced by update_cooldowns:
+        # event id -> expiry turn, plus a heap of (expiry turn, event id)
+        self.cooldown_turn = 0
+        self._cooldown_expiry: Dict[str, int] = {}
+        self._cooldown_heap: List[Tuple[int, str]] = []
+
+        self._event_index: Optional[EventConditionIndex] = None
+        self._event_index_key = None
+        self._encounter_index: Optional[Dict[str, List[Encounter]]] = None
+        self._encounter_index_key = None
+
+    @property
+    def event_cooldowns(self) -> Dict[str, int]:
+        """Remaining cooldown turns for each event on cooldown"""
+        return {
+            event_id: expiry - self.cooldown_turn
+            for event_id, expiry in self._cooldown_expiry.items()
+        }
+
+    def add_events(self, events: List[RandomEvent]):
+        """Register additional events, e.g. from a modded event pack"""
+        for event in events:
+            self.events[event.id] = event
+        self._event_index = None
+
+    def add_encounters(self, encounters: List[Encounter]):
+        """Register additional encounters"""
+        for encounter in encounters:
+            self.encounters[encounter.id] = encounter
+        self._encounter_index = None
+
+    def _get_event_index(self) -> EventConditionIndex:
+        """Condition index over self.events, rebuilt when the dict changes"""
+        key = (id(self.events), len(self.events))
+        if self._event_index is None or self._event_index_key != key:
+            self._event_index = EventConditionIndex(list(self.events.values()))
+            self._event_index_key = key
+        return self._event_index
+
+    def _get_encounter_index(self) -> Dict[str, List[Encounter]]:
+        """Encounters by allowed location; the None key holds unrestricted ones"""
+        key = (id(self.encounters), len(self.encounters))
+        if self._encounter_index is None or self._encounter_index_key != key:
+            index: Dict[Any, List[Encounter]] = {None: []}
+            for encounter in self.encounters.values():
+                if not encounter.location_restrictions:
+                    index[None].append(encounter)
+                for location in encounter.location_restrictions:
+                    bucket = index.setdefault(location, [])
+                    if not bucket or bucket[-1] is not encounter:
+                        bucket.append(encounter)
+            self._encounter_index = index
+            self._encounter_index_key = key
+        return self._encounter_index
+
+    def _expire_cooldowns(self):
+        """Drop cooldowns whose expiry turn has been reached"""
+        heap = self._cooldown_heap
+        while heap and heap[0][0] <= self.cooldown_turn:
+            expiry, event_id = heapq.heappop(heap)
+            # Entries are superseded when an event's cooldown is reset
+            if self._cooldown_expiry.get(event_id) == expiry:
+                del self._cooldown_expiry[event_id]
 
     def _create_events(self) -> Dict[str, RandomEvent]:
         """Create all available random events"""
@@ -734,54 +907,52 @@ class EventGenerator:
         self, game_state: Dict[str, Any]
     ) -> Optional[RandomEvent]:
         """Generate a random event based on current game state"""
-        available_events = []
+        index = self._get_event_index()
+        self._expire_cooldowns()
 
-        for event_id, event in self.events.items():
-            # Check if event is on cooldown
-            if event_id in self.event_cooldowns:
-                if self.event_cooldowns[event_id] > 0:
-                    continue
+        candidates = index.match(game_state)
+        if self._cooldown_expiry:
+            candidates &= ~index.ids_mask(self._cooldown_expiry)
 
-            # Check trigger conditions
-            if self._check_event_conditions(event, game_state):
-                available_events.append(event)
+        # Events the index could not fully vet still get the direct check
+        unchecked = candidates & index.unindexed_mask
+        for bit, event in index.iter_members(unchecked):
+            if not self._check_event_conditions(event, game_state):
+                candidates &= ~bit
 
-        if not available_events:
+        if not candidates:
             return None
 
         # Weight events by severity and current game state
-        weighted_events = []
-        for event in available_events:
-            weight = self._calculate_event_weight(event, game_state)
-            weighted_events.extend([event] * weight)
-
-        if not weighted_events:
+        table = index.table(candidates, self._state_weight_bonus(game_state))
+        if not table:
             return None
 
-        return random.choice(weighted_events)
+        return table.sample(get_rng("random_events"))
 
     def generate_random_encounter(
         self, character: Any, location: str
     ) -> Optional[Encounter]:
         """Generate a random encounter for a character"""
-        available_encounters = []
-
-        for encounter_id, encounter in self.encounters.items():
-            # Check location restrictions
-            if (
-                encounter.location_restrictions
-                and location not in encounter.location_restrictions
-            ):
-                continue
-
-            # Check skill requirements
-            if self._check_encounter_requirements(encounter, character):
-                available_encounters.append(encounter)
+        index = self._get_encounter_index()
+        candidates = index[None]
+        try:
+            restricted = index.get(location, [])
+        except TypeError:
+            restricted = []
+        if restricted:
+            candidates = candidates + restricted
+
+        available_encounters = [
+            encounter
+            for encounter in candidates
+            if self._check_encounter_requirements(encounter, character)
+        ]
 
         if not available_encounters:
             return None
 
-        return random.choice(available_encounters)
+        return get_rng("random_events").choice(available_encounters)
 
     def _check_event_conditions(
         self, event: RandomEvent, game_state: Dict[str, Any]
@@ -808,23 +979,19 @@ class EventGenerator:
         self, event: RandomEvent, game_state: Dict[str, Any]
     ) -> int:
         """Calculate event weight based on severity and game state"""
-        base_weight = {
-            EventSeverity.MINOR: 1,
-            EventSeverity.MODERATE: 2,
-            EventSeverity.MAJOR: 3,
-            EventSeverity.CRITICAL: 4,
-        }
-
-        weight = base_weight.get(event.severity, 1)
+        weight = SEVERITY_WEIGHTS.get(event.severity, 1)
+        return weight + self._state_weight_bonus(game_state)
 
-        # Adjust weight based on game state
+    def _state_weight_bonus(self, game_state: Dict[str, Any]) -> int:
+        """Weight added to every event by the current game state"""
+        bonus = 0
         if "unrest" in game_state and game_state["unrest"] > 5:
-            weight += 1
+            bonus += 1
 
         if "heat_level" in game_state and game_state["heat_level"] > 5:
-            weight += 1
+            bonus += 1
 
-        return weight
+        return bonus
 
     def _check_encounter_requirements(
         self, encounter: Encounter, character: Any
@@ -855,17 +1022,19 @@ class EventGenerator:
                     game_state[effect] = value
 
         # Set cooldown
-        self.event_cooldowns[event.id] = event.cooldown
+        if event.cooldown > 0:
+            expiry = self.cooldown_turn + event.cooldown
+            self._cooldown_expiry[event.id] = expiry
+            heapq.heappush(self._cooldown_heap, (expiry, event.id))
+        else:
+            self._cooldown_expiry.pop(event.id, None)
 
         return outcome
 
     def update_cooldowns(self):
         """Update event cooldowns"""
-        for event_id in list(self.event_cooldowns.keys()):
-            if self.event_cooldowns[event_id] > 0:
-                self.event_cooldowns[event_id] -= 1
-            else:
-                del self.event_cooldowns[event_id]
+        self.cooldown_turn += 1
+        self._expire_cooldowns()
 
 
 def create_event_generator() -> EventGenerator:
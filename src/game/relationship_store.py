@@ -0,0 +1,504 @@
+"""
+Compact Relationship Storage for Years of Lead
+
+This module provides an array-backed alternative to the dict-of-dicts storage
+used by SocialNetwork. Relationship values live in NumPy arrays indexed by
+interned agent ids, adjacency is kept in a CSR-style layout that is rebuilt
+lazily, and Relationship objects are only created as lightweight views when
+callers ask for them.
+"""
+
+from collections.abc import Mapping
+from typing import Dict, List, Iterator, Optional, Tuple
+
+import numpy as np
+
+from .relationships import BondType, EventType, EVENT_EFFECTS, Relationship
+
+# Bond types are stored as small integer codes
+BOND_TYPES: List[BondType] = list(BondType)
+BOND_CODES: Dict[BondType, int] = {bond: i for i, bond in enumerate(BOND_TYPES)}
+
+
+class RelationshipView(Relationship):
+    """A Relationship whose values are read from and written to a compact store"""
+
+    __slots__ = ("_store", "_edge")
+
+    def __init__(self, store: "CompactRelationshipStore", edge: int):
+        # Deliberately skip the dataclass __init__/__post_init__: the values
+        # already live in the store and must not be re-randomized.
+        self._store = store
+        self._edge = edge
+
+    @property
+    def agent_id(self) -> str:
+        return self._store.agent_ids[self._store.dst[self._edge]]
+
+    @property
+    def bond_type(self) -> BondType:
+        return BOND_TYPES[self._store.bond[self._edge]]
+
+    @bond_type.setter
+    def bond_type(self, value: BondType):
+        self._store.bond[self._edge] = BOND_CODES[value]
+
+    @property
+    def affinity(self) -> float:
+        return float(self._store.affinity[self._edge])
+
+    @affinity.setter
+    def affinity(self, value: float):
+        self._store.affinity[self._edge] = value
+
+    @property
+    def trust(self) -> float:
+        return float(self._store.trust[self._edge])
+
+    @trust.setter
+    def trust(self, value: float):
+        self._store.trust[self._edge] = value
+
+    @property
+    def loyalty(self) -> float:
+        return float(self._store.loyalty[self._edge])
+
+    @loyalty.setter
+    def loyalty(self, value: float):
+        self._store.loyalty[self._edge] = value
+
+    @property
+    def decay_rate(self) -> float:
+        return float(self._store.decay_rate[self._edge])
+
+    @decay_rate.setter
+    def decay_rate(self, value: float):
+        self._store.decay_rate[self._edge] = value
+
+    @property
+    def strength(self) -> float:
+        return float(self._store.strength[self._edge])
+
+    @strength.setter
+    def strength(self, value: float):
+        self._store.strength[self._edge] = value
+
+    @property
+    def emotional_history(self) -> List[str]:
+        return self._store.histories.setdefault(self._edge, [])
+
+    @emotional_history.setter
+    def emotional_history(self, value: List[str]):
+        self._store.histories[self._edge] = value
+
+    @property
+    def last_event(self) -> Optional[str]:
+        return self._store.last_events.get(self._edge)
+
+    @last_event.setter
+    def last_event(self, value: Optional[str]):
+        self._store.last_events[self._edge] = value
+
+
+class CompactRelationshipStore:
+    """Structure-of-arrays storage for directed relationship edges"""
+
+    ARRAY_FIELDS = (
+        "src",
+        "dst",
+        "bond",
+        "affinity",
+        "trust",
+        "loyalty",
+        "decay_rate",
+        "strength",
+    )
+
+    def __init__(self, initial_capacity: int = 64):
+        self.agent_index: Dict[str, int] = {}  # agent_id -> interned row id
+        self.agent_ids: List[str] = []  # interned row id -> agent_id
+        self.edge_index: Dict[int, int] = {}  # packed (src, dst) -> edge id
+        self.histories: Dict[int, List[str]] = {}  # edge id -> emotional history
+        self.last_events: Dict[int, Optional[str]] = {}  # edge id -> last event
+
+        self.size = 0
+        self.capacity = max(1, initial_capacity)
+        self.src = np.zeros(self.capacity, dtype=np.int32)
+        self.dst = np.zeros(self.capacity, dtype=np.int32)
+        self.bond = np.zeros(self.capacity, dtype=np.int8)
+        self.affinity = np.zeros(self.capacity, dtype=np.float64)
+        self.trust = np.zeros(self.capacity, dtype=np.float64)
+        self.loyalty = np.zeros(self.capacity, dtype=np.float64)
+        self.decay_rate = np.zeros(self.capacity, dtype=np.float64)
+        self.strength = np.zeros(self.capacity, dtype=np.float64)
+
+        # CSR adjacency (row pointers and edge ids ordered by source row)
+        self._indptr: Optional[np.ndarray] = None
+        self._order: Optional[np.ndarray] = None
+
+    @staticmethod
+    def _pack(src: int, dst: int) -> int:
+        return (src << 32) | dst
+
+    def intern(self, agent_id: str) -> int:
+        """Return the row id for an agent, registering it if needed"""
+        row = self.agent_index.get(agent_id)
+        if row is None:
+            row = len(self.agent_ids)
+            self.agent_index[agent_id] = row
+            self.agent_ids.append(agent_id)
+            self._indptr = None
+        return row
+
+    def find_edge(self, agent_a: str, agent_b: str) -> Optional[int]:
+        """Return the edge id for agent_a -> agent_b, if it exists"""
+        src = self.agent_index.get(agent_a)
+        dst = self.agent_index.get(agent_b)
+        if src is None or dst is None:
+            return None
+        return self.edge_index.get(self._pack(src, dst))
+
+    def set_edge(
+        self,
+        agent_a: str,
+        agent_b: str,
+        relationship: Relationship,
+        copy_history: bool = True,
+    ) -> int:
+        """Store the values of a relationship on the edge agent_a -> agent_b"""
+        src = self.intern(agent_a)
+        dst = self.intern(agent_b)
+        key = self._pack(src, dst)
+
+        edge = self.edge_index.get(key)
+        if edge is None:
+            if self.size == self.capacity:
+                self._grow()
+            edge = self.size
+            self.size += 1
+            self.edge_index[key] = edge
+            self.src[edge] = src
+            self.dst[edge] = dst
+            self._indptr = None
+
+        self.bond[edge] = BOND_CODES[relationship.bond_type]
+        self.affinity[edge] = relationship.affinity
+        self.trust[edge] = relationship.trust
+        self.loyalty[edge] = relationship.loyalty
+        self.decay_rate[edge] = relationship.decay_rate
+        self.strength[edge] = relationship.strength
+
+        self.histories.pop(edge, None)
+        self.last_events.pop(edge, None)
+        if copy_history:
+            if relationship.emotional_history:
+                self.histories[edge] = list(relationship.emotional_history)
+            if relationship.last_event is not None:
+                self.last_events[edge] = relationship.last_event
+
+        return edge
+
+    def _grow(self):
+        """Double the capacity of every edge array"""
+        self.capacity *= 2
+        for name in self.ARRAY_FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(self.capacity, dtype=old.dtype)
+            new[: self.size] = old[: self.size]
+            setattr(self, name, new)
+
+    def _build_csr(self):
+        """Rebuild the CSR row pointers after edges or agents were added"""
+        src = self.src[: self.size]
+        self._order = np.argsort(src, kind="stable").astype(np.int64)
+        counts = np.bincount(src, minlength=len(self.agent_ids))
+        self._indptr = np.zeros(len(self.agent_ids) + 1, dtype=np.int64)
+        np.cumsum(counts, out=self._indptr[1:])
+
+    def row_edges(self, agent_id: str) -> np.ndarray:
+        """Return the edge ids leaving an agent, in insertion order"""
+        row = self.agent_index.get(agent_id)
+        if row is None:
+            return np.empty(0, dtype=np.int64)
+        if self._indptr is None:
+            self._build_csr()
+        return self._order[self._indptr[row] : self._indptr[row + 1]]
+
+    def strengths(self, edges: Optional[np.ndarray] = None) -> np.ndarray:
+        """Vectorized equivalent of Relationship.get_strength"""
+        if edges is None:
+            edges = slice(0, self.size)
+        normalized_affinity = (self.affinity[edges] + 100) / 200
+        strength = (
+            normalized_affinity * 0.3
+            + self.trust[edges] * 0.3
+            + self.loyalty[edges] * 0.4
+        ) * self.strength[edges]
+        return np.clip(strength, 0.0, 1.0)
+
+    def apply_events(
+        self,
+        edges: List[int],
+        event_types: List[EventType],
+        magnitudes: List[float],
+    ):
+        """Vectorized equivalent of Relationship.update_from_event for many edges
+
+        Deltas for an edge that receives several events are summed before
+        clamping, so the result does not depend on the order of the events.
+        """
+        if not edges:
+            return
+
+        edge_ids = np.asarray(edges, dtype=np.int64)
+        scale = np.asarray(magnitudes, dtype=np.float64)
+        touched = np.unique(edge_ids)
+        for name, low, high in (
+            ("affinity", -100.0, 100.0),
+            ("trust", 0.0, 1.0),
+            ("loyalty", 0.0, 1.0),
+        ):
+            deltas = np.array(
+                [EVENT_EFFECTS.get(event, {}).get(name, 0.0) for event in event_types]
+            )
+            values = getattr(self, name)[: self.size]
+            np.add.at(values, edge_ids, deltas * scale)
+            values[touched] = np.clip(values[touched], low, high)
+
+        for edge, event_type, magnitude in zip(edges, event_types, magnitudes):
+            history = self.histories.setdefault(edge, [])
+            history.append(f"{event_type.value}: {magnitude:.2f}")
+            if len(history) > 10:
+                del history[:-10]
+            self.last_events[edge] = event_type.value
+
+    def apply_deltas(
+        self,
+        edges: List[int],
+        reverse_edges: List[Optional[int]],
+        delta_affinity: List[float],
+        delta_trust: List[float],
+    ):
+        """Vectorized equivalent of update_relationship for many edges
+
+        Deltas are added to each forward edge and clamped, then the resulting
+        values are copied onto the reverse edge where one exists.
+        """
+        if not edges:
+            return
+
+        edge_ids = np.asarray(edges, dtype=np.int64)
+        touched = np.unique(edge_ids)
+        for name, deltas, low, high in (
+            ("affinity", delta_affinity, -100.0, 100.0),
+            ("trust", delta_trust, 0.0, 1.0),
+        ):
+            values = getattr(self, name)[: self.size]
+            np.add.at(values, edge_ids, np.asarray(deltas, dtype=np.float64))
+            values[touched] = np.clip(values[touched], low, high)
+
+        self.copy_to_reverse(edges, reverse_edges)
+
+    def copy_to_reverse(self, edges: List[int], reverse_edges: List[Optional[int]]):
+        """Copy affinity, trust and loyalty of each edge onto its reverse edge
+
+        Edges whose reverse is None are skipped.
+        """
+        pairs = [
+            (edge, reverse)
+            for edge, reverse in zip(edges, reverse_edges)
+            if reverse is not None
+        ]
+        if pairs:
+            forward = np.array([pair[0] for pair in pairs], dtype=np.int64)
+            reverse = np.array([pair[1] for pair in pairs], dtype=np.int64)
+            for name in ("affinity", "trust", "loyalty"):
+                values = getattr(self, name)
+                values[reverse] = values[forward]
+
+    def apply_decay(self):
+        """Vectorized equivalent of Relationship.apply_decay for every edge"""
+        decay_factor = 1.0 - self.decay_rate[: self.size]
+        affinity = self.affinity[: self.size]
+        affinity *= np.where(affinity > 0, decay_factor, 2.0 - decay_factor)
+
+        trust = self.trust[: self.size]
+        np.maximum(trust * decay_factor, 0.1, out=trust)
+        loyalty = self.loyalty[: self.size]
+        np.maximum(loyalty * decay_factor, 0.1, out=loyalty)
+
+    def positive_mask(self) -> np.ndarray:
+        """Vectorized equivalent of Relationship.is_positive for every edge"""
+        return (self.affinity[: self.size] > 0) & (self.trust[: self.size] > 0.5)
+
+    def edge_pairs(self, edges: np.ndarray) -> List[Tuple[str, str]]:
+        """Return (source, target) agent ids for the given edge ids"""
+        return [
+            (self.agent_ids[self.src[edge]], self.agent_ids[self.dst[edge]])
+            for edge in edges
+        ]
+
+    def positivity_flips(
+        self, before: np.ndarray
+    ) -> Tuple[bool, List[Tuple[str, str]]]:
+        """Compare is_positive against an earlier mask
+
+        Returns whether any edge stopped being positive and the pairs of the
+        edges that became positive.
+        """
+        after = self.positive_mask()
+        lost = bool(np.any(before & ~after))
+        gained = np.flatnonzero(after & ~before)
+        return lost, self.edge_pairs(gained)
+
+    def faction_strength_totals(
+        self, agent_faction: Dict[str, str]
+    ) -> Tuple[Dict[str, float], Dict[str, int]]:
+        """Sum positive strengths and counts of intra-faction edges per faction"""
+        factions = sorted(set(agent_faction.values()))
+        codes = {faction_id: i for i, faction_id in enumerate(factions)}
+        row_faction = np.array(
+            [codes.get(agent_faction.get(agent_id), -1) for agent_id in self.agent_ids],
+            dtype=np.int64,
+        )
+        if self.size == 0 or not factions:
+            return {}, {}
+
+        src_faction = row_faction[self.src[: self.size]]
+        dst_faction = row_faction[self.dst[: self.size]]
+        mask = (
+            (src_faction >= 0)
+            & (src_faction == dst_faction)
+            & (self.src[: self.size] != self.dst[: self.size])
+            & self.positive_mask()
+        )
+        edges = np.flatnonzero(mask)
+        sums = np.bincount(
+            src_faction[edges], weights=self.strengths(edges), minlength=len(factions)
+        )
+        counts = np.bincount(src_faction[edges], minlength=len(factions))
+        return (
+            {f: float(sums[i]) for i, f in enumerate(factions) if counts[i]},
+            {f: int(counts[i]) for i, f in enumerate(factions) if counts[i]},
+        )
+
+    def positive_edge_weights(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Source rows, target rows and strengths of all positive edges"""
+        edges = np.flatnonzero(self.positive_mask())
+        return self.src[edges], self.dst[edges], self.strengths(edges)
+
+    def social_circle(
+        self,
+        agent_id: str,
+        bond_filter: Optional[BondType] = None,
+        min_affinity: Optional[float] = None,
+    ) -> List[Tuple[str, RelationshipView]]:
+        """Filtered neighbours of an agent sorted by relationship strength"""
+        edges = self.row_edges(agent_id)
+        if bond_filter:
+            edges = edges[self.bond[edges] == BOND_CODES[bond_filter]]
+        if min_affinity is not None:
+            edges = edges[self.affinity[edges] >= min_affinity]
+
+        order = np.argsort(-self.strengths(edges), kind="stable")
+        return [(self.neighbour_id(edge), self.view(edge)) for edge in edges[order]]
+
+    def view(self, edge: int) -> RelationshipView:
+        """Create a lightweight Relationship view of an edge"""
+        return RelationshipView(self, edge)
+
+    def neighbour_id(self, edge: int) -> str:
+        return self.agent_ids[self.dst[edge]]
+
+    def nbytes(self) -> int:
+        """Approximate memory held by the edge arrays"""
+        return sum(getattr(self, name).nbytes for name in self.ARRAY_FIELDS)
+
+
+class _CompactRow(Mapping):
+    """Read-only mapping of other_id -> RelationshipView for one agent"""
+
+    def __init__(self, store: CompactRelationshipStore, agent_id: str):
+        self._store = store
+        self._agent_id = agent_id
+
+    def __getitem__(self, other_id: str) -> RelationshipView:
+        edge = self._store.find_edge(self._agent_id, other_id)
+        if edge is None:
+            raise KeyError(other_id)
+        return self._store.view(edge)
+
+    def __contains__(self, other_id: object) -> bool:
+        return self._store.find_edge(self._agent_id, other_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for edge in self._store.row_edges(self._agent_id):
+            yield self._store.neighbour_id(edge)
+
+    def __len__(self) -> int:
+        return len(self._store.row_edges(self._agent_id))
+
+    def items(self) -> Iterator[Tuple[str, RelationshipView]]:
+        for edge in self._store.row_edges(self._agent_id):
+            yield self._store.neighbour_id(edge), self._store.view(edge)
+
+
+class CompactAdjacency(Mapping):
+    """Read-only dict-of-dicts facade over a CompactRelationshipStore"""
+
+    def __init__(self, store: CompactRelationshipStore):
+        self._store = store
+
+    def __getitem__(self, agent_id: str) -> _CompactRow:
+        if agent_id not in self._store.agent_index:
+            raise KeyError(agent_id)
+        return _CompactRow(self._store, agent_id)
+
+    def __contains__(self, agent_id: object) -> bool:
+        return agent_id in self._store.agent_index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._store.agent_ids))
+
+    def __len__(self) -> int:
+        return len(self._store.agent_ids)
+
+
+def weighted_pagerank(
+    n: int,
+    src: np.ndarray,
+    dst: np.ndarray,
+    weights: np.ndarray,
+    start: Optional[np.ndarray] = None,
+    damping: float = 0.85,
+    tol: float = 1e-10,
+    max_iter: int = 100,
+) -> Tuple[np.ndarray, int]:
+    """Power iteration for PageRank over a weighted edge list
+
+    Each step is a sparse matrix-vector product done with bincount over the
+    edge arrays. Nodes without outgoing weight spread their rank uniformly.
+    Returns the rank vector (summing to 1) and the number of iterations used.
+    """
+    if n == 0:
+        return np.zeros(0), 0
+
+    out_weight = np.bincount(src, weights=weights, minlength=n)
+    share = np.zeros_like(weights)
+    np.divide(weights, out_weight[src], out=share, where=out_weight[src] > 0)
+    dangling = out_weight == 0
+
+    if start is None or start.size != n or start.sum() <= 0:
+        rank = np.full(n, 1.0 / n)
+    else:
+        rank = start / start.sum()
+
+    iterations = 0
+    for iterations in range(1, max_iter + 1):
+        flow = np.bincount(dst, weights=rank[src] * share, minlength=n)
+        new_rank = (1.0 - damping) / n + damping * (flow + rank[dangling].sum() / n)
+        delta = np.abs(new_rank - rank).sum()
+        rank = new_rank
+        if delta < tol:
+            break
+    return rank, iterations
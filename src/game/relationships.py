@@ -9,15 +9,32 @@ and interpersonal dynamics that transform gameplay strategy.
 """
 
 from enum import Enum
-from typing import Dict, List, Any, Optional, Set, Tuple, TYPE_CHECKING
+from typing import Dict, List, Any, Iterable, Optional, Set, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
-import random
+import logging
 from collections import deque
 
+try:
+    import numpy  # noqa: F401
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Import Agent for type hints only to avoid circular imports
 if TYPE_CHECKING:
     from .entities import Agent  # noqa: F401
 
+from .rng import get_rng
+from .social_index import (
+    ClusterIndex,
+    FactionCohesionIndex,
+    InfluenceEngine,
+    NeighbourhoodIndex,
+)
+
+logger = logging.getLogger(__name__)
+
 
 class BondType(Enum):
     """Types of relationships between agents"""
@@ -50,6 +67,21 @@ class EventType(Enum):
     LOYALTY_TEST = "loyalty_test"
 
 
+# Affinity/trust/loyalty deltas applied by each relationship event
+EVENT_EFFECTS: Dict[EventType, Dict[str, float]] = {
+    EventType.SHARED_RISK: {"affinity": 10, "trust": 0.05, "loyalty": 0.03},
+    EventType.ABANDONMENT: {"affinity": -30, "trust": -0.15, "loyalty": -0.2},
+    EventType.BETRAYAL: {"affinity": -50, "trust": -0.4, "loyalty": -0.5},
+    EventType.RESCUE: {"affinity": 25, "trust": 0.1, "loyalty": 0.15},
+    EventType.MENTORSHIP: {"affinity": 15, "trust": 0.08, "loyalty": 0.05},
+    EventType.CONFLICT: {"affinity": -20, "trust": -0.1, "loyalty": -0.08},
+    EventType.SACRIFICE: {"affinity": 40, "trust": 0.2, "loyalty": 0.25},
+    EventType.COOPERATION: {"affinity": 8, "trust": 0.04, "loyalty": 0.03},
+    EventType.COMPETITION: {"affinity": -15, "trust": -0.05, "loyalty": -0.03},
+    EventType.LOYALTY_TEST: {"affinity": 5, "trust": 0.02, "loyalty": 0.03},
+}
+
+
 @dataclass
 class Relationship:
     """Represents a relationship between two agents"""
@@ -66,59 +98,59 @@ class Relationship:
 
     def __post_init__(self):
         """Initialize relationship with bond-type specific defaults"""
+        rng = get_rng("relationships")
         if self.bond_type == BondType.ALLY:
-            self.affinity = random.uniform(20, 60)
-            self.trust = random.uniform(0.6, 0.9)
-            self.loyalty = random.uniform(0.7, 0.95)
+            self.affinity = rng.uniform(20, 60)
+            self.trust = rng.uniform(0.6, 0.9)
+            self.loyalty = rng.uniform(0.7, 0.95)
         elif self.bond_type == BondType.RIVAL:
-            self.affinity = random.uniform(-60, -20)
-            self.trust = random.uniform(0.1, 0.4)
-            self.loyalty = random.uniform(0.1, 0.3)
+            self.affinity = rng.uniform(-60, -20)
+            self.trust = rng.uniform(0.1, 0.4)
+            self.loyalty = rng.uniform(0.1, 0.3)
         elif self.bond_type == BondType.MENTOR:
-            self.affinity = random.uniform(30, 70)
-            self.trust = random.uniform(0.7, 0.95)
-            self.loyalty = random.uniform(0.8, 0.98)
+            self.affinity = rng.uniform(30, 70)
+            self.trust = rng.uniform(0.7, 0.95)
+            self.loyalty = rng.uniform(0.8, 0.98)
         elif self.bond_type == BondType.ENEMY:
-            self.affinity = random.uniform(-80, -40)
-            self.trust = random.uniform(0.0, 0.2)
-            self.loyalty = random.uniform(0.0, 0.1)
+            self.affinity = rng.uniform(-80, -40)
+            self.trust = rng.uniform(0.0, 0.2)
+            self.loyalty = rng.uniform(0.0, 0.1)
         elif self.bond_type == BondType.FAMILY:
-            self.affinity = random.uniform(40, 80)
-            self.trust = random.uniform(0.8, 0.98)
-            self.loyalty = random.uniform(0.9, 0.99)
+            self.affinity = rng.uniform(40, 80)
+            self.trust = rng.uniform(0.8, 0.98)
+            self.loyalty = rng.uniform(0.9, 0.99)
 
     def update_from_event(self, event_type: EventType, magnitude: float = 1.0):
         """Update relationship based on an event"""
-        event_effects = {
-            EventType.SHARED_RISK: {"affinity": 10, "trust": 0.05, "loyalty": 0.03},
-            EventType.ABANDONMENT: {"affinity": -30, "trust": -0.15, "loyalty": -0.2},
-            EventType.BETRAYAL: {"affinity": -50, "trust": -0.4, "loyalty": -0.5},
-            EventType.RESCUE: {"affinity": 25, "trust": 0.1, "loyalty": 0.15},
-            EventType.MENTORSHIP: {"affinity": 15, "trust": 0.08, "loyalty": 0.05},
-            EventType.CONFLICT: {"affinity": -20, "trust": -0.1, "loyalty": -0.08},
-            EventType.SACRIFICE: {"affinity": 40, "trust": 0.2, "loyalty": 0.25},
-            EventType.COOPERATION: {"affinity": 8, "trust": 0.04, "loyalty": 0.03},
-            EventType.COMPETITION: {"affinity": -15, "trust": -0.05, "loyalty": -0.03},
-            EventType.LOYALTY_TEST: {"affinity": 5, "trust": 0.02, "loyalty": 0.03},
-        }
-
-        effects = event_effects.get(event_type, {})
+        self.apply_events([(event_type, magnitude)])
+
+    def apply_events(self, events: List[Tuple[EventType, float]]):
+        """Update relationship from several events at once
+
+        Deltas are summed before clamping, so the result does not depend on
+        the order of the events (the rule the compact backend also uses).
+        """
+        d_affinity = d_trust = d_loyalty = 0.0
+        touched = set()
+        for event_type, magnitude in events:
+            effects = EVENT_EFFECTS.get(event_type, {})
+            touched.update(effects)
+            d_affinity += effects.get("affinity", 0.0) * magnitude
+            d_trust += effects.get("trust", 0.0) * magnitude
+            d_loyalty += effects.get("loyalty", 0.0) * magnitude
 
         # Apply effects with magnitude scaling
-        if "affinity" in effects:
-            self.affinity = max(
-                -100, min(100, self.affinity + effects["affinity"] * magnitude)
-            )
-        if "trust" in effects:
-            self.trust = max(0.0, min(1.0, self.trust + effects["trust"] * magnitude))
-        if "loyalty" in effects:
-            self.loyalty = max(
-                0.0, min(1.0, self.loyalty + effects["loyalty"] * magnitude)
-            )
-
-        # Record the event
-        self.last_event = event_type.value
-        self.emotional_history.append(f"{event_type.value}: {magnitude:.2f}")
+        if "affinity" in touched:
+            self.affinity = max(-100, min(100, self.affinity + d_affinity))
+        if "trust" in touched:
+            self.trust = max(0.0, min(1.0, self.trust + d_trust))
+        if "loyalty" in touched:
+            self.loyalty = max(0.0, min(1.0, self.loyalty + d_loyalty))
+
+        # Record the events
+        for event_type, magnitude in events:
+            self.last_event = event_type.value
+            self.emotional_history.append(f"{event_type.value}: {magnitude:.2f}")
 
         # Keep only recent history
         if len(self.emotional_history) > 10:
@@ -237,17 +269,75 @@ class TeamDynamics:
 
 
 class SocialNetwork:
-    """Manages the social network graph of agent relationships"""
-
-    def __init__(self):
+    """Manages the social network graph of agent relationships
+
+    Two storage backends are available. The default "dict" backend keeps a
+    dict-of-dicts of Relationship objects. The "compact" backend stores edge
+    values in NumPy arrays (see relationship_store) and hands out Relationship
+    views on demand, which keeps memory flat for networks with thousands of
+    agents. Relationships passed to add_relationship are copied into the
+    compact store rather than kept by reference.
+    """
+
+    BACKENDS = ("dict", "compact")
+
+    def __init__(self, backend: str = "dict"):
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown social network backend: {backend}")
+        if backend == "compact" and not NUMPY_AVAILABLE:
+            logger.warning("NumPy not available, using dict relationship storage")
+            backend = "dict"
+
+        self.backend = backend
+        self._store = None
         self.relationships: Dict[
             str, Dict[str, Relationship]
         ] = {}  # agent_id -> {other_id -> relationship}
+        if backend == "compact":
+            from .relationship_store import CompactRelationshipStore, CompactAdjacency
+
+            self._store = CompactRelationshipStore()
+            self.relationships = CompactAdjacency(self._store)
+
         self.social_clusters: Dict[str, Set[str]] = {}  # cluster_id -> set of agent_ids
         self.influence_cache: Dict[str, float] = {}  # agent_id -> influence_score
+        self.influence_engine = InfluenceEngine()
+        self.neighbourhood_index = NeighbourhoodIndex()
+
+        # Union-find index of positive-relationship clusters
+        self.cluster_index = ClusterIndex()
+
+        # Running intra-faction strength sums for cohesion queries
+        self.cohesion_index = FactionCohesionIndex()
+
+        # Relationship events queued for the next batched turn update
+        self.pending_events: List[Tuple[str, str, EventType, float]] = []
+        self.last_decay_turn: Optional[int] = None
 
     def add_relationship(self, agent_a: str, agent_b: str, relationship: Relationship):
         """Add or update a relationship between two agents"""
+        before = self._edge_contribution(agent_a, agent_b)
+        reverse_before = self._edge_contribution(agent_b, agent_a)
+        if (
+            self.get_relationship(agent_a, agent_b) is None
+            or self.get_relationship(agent_b, agent_a) is None
+        ):
+            self.neighbourhood_index.topology_changed()
+
+        if self._store is not None:
+            self._store.set_edge(agent_a, agent_b, relationship)
+            self._store.set_edge(agent_b, agent_a, relationship, copy_history=False)
+        else:
+            self._add_relationship_objects(agent_a, agent_b, relationship)
+
+        self._edge_changed(agent_a, agent_b, before)
+        self._edge_changed(agent_b, agent_a, reverse_before)
+        self._invalidate_influence(agent_a, agent_b)
+
+    def _add_relationship_objects(
+        self, agent_a: str, agent_b: str, relationship: Relationship
+    ):
+        """Store a relationship and its reverse copy in the dict backend"""
         # Ensure both agents exist in the network
         if agent_a not in self.relationships:
             self.relationships[agent_a] = {}
@@ -269,11 +359,12 @@ class SocialNetwork:
         )
         self.relationships[agent_b][agent_a] = reverse_relationship
 
-        # Clear influence cache
-        self.influence_cache.clear()
-
     def get_relationship(self, agent_a: str, agent_b: str) -> Optional[Relationship]:
         """Get the relationship between two agents"""
+        if self._store is not None:
+            edge = self._store.find_edge(agent_a, agent_b)
+            return self._store.view(edge) if edge is not None else None
+
         if agent_a in self.relationships and agent_b in self.relationships[agent_a]:
             return self.relationships[agent_a][agent_b]
         return None
@@ -290,6 +381,9 @@ class SocialNetwork:
         """Update an existing relationship"""
         relationship = self.get_relationship(agent_a, agent_b)
         if relationship:
+            before = self._edge_contribution(agent_a, agent_b)
+            reverse_before = self._edge_contribution(agent_b, agent_a)
+
             relationship.affinity = max(
                 -100, min(100, relationship.affinity + delta_affinity)
             )
@@ -310,8 +404,48 @@ class SocialNetwork:
                 if event_type:
                     reverse_rel.update_from_event(event_type)
 
-            # Clear influence cache
-            self.influence_cache.clear()
+            self._edge_changed(agent_a, agent_b, before)
+            self._edge_changed(agent_b, agent_a, reverse_before)
+            self._invalidate_influence(agent_a, agent_b)
+
+    def _edge_contribution(self, agent_a: str, agent_b: str) -> Optional[float]:
+        """Strength of the edge agent_a -> agent_b if it exists and is positive"""
+        relationship = self.get_relationship(agent_a, agent_b)
+        if relationship is None or not relationship.is_positive():
+            return None
+        return relationship.get_strength()
+
+    def _edge_changed(self, agent_a: str, agent_b: str, before: Optional[float]):
+        """Keep the incremental indexes current after an edge was mutated
+
+        ``before`` is the edge's contribution from _edge_contribution prior to
+        the mutation.
+        """
+        after = self._edge_contribution(agent_a, agent_b)
+        self.cluster_index.edge_changed(
+            agent_a, agent_b, before is not None, after is not None
+        )
+        self.cohesion_index.edge_changed(agent_a, agent_b, before, after)
+
+    def _record_positivity_flips(self, before):
+        """Feed edges whose is_positive() changed in a bulk update to the indexes"""
+        self.cohesion_index.mark_dirty()
+        lost, gained = self._store.positivity_flips(before)
+        if lost:
+            self.cluster_index.mark_dirty()
+        for agent_a, agent_b in gained:
+            self.cluster_index.edge_changed(agent_a, agent_b, False, True)
+
+    def _positive_edges(self):
+        """Iterate over (agent_a, agent_b) for every positive relationship"""
+        if self._store is not None:
+            return self._store.edge_pairs(self._store.positive_mask().nonzero()[0])
+        return [
+            (agent_id, other_id)
+            for agent_id, relationships in self.relationships.items()
+            for other_id, relationship in relationships.items()
+            if relationship.is_positive()
+        ]
 
     def get_social_circle(
         self,
@@ -320,6 +454,9 @@ class SocialNetwork:
         min_affinity: Optional[float] = None,
     ) -> List[Tuple[str, Relationship]]:
         """Get agents in an agent's social circle"""
+        if self._store is not None:
+            return self._store.social_circle(agent_id, bond_filter, min_affinity)
+
         if agent_id not in self.relationships:
             return []
 
@@ -338,46 +475,59 @@ class SocialNetwork:
         return circle
 
     def get_most_influential(
-        self, agent_id: str, radius: int = 2
+        self, agent_id: str, radius: int = 2, method: str = "heuristic"
     ) -> List[Tuple[str, float]]:
-        """Find the most influential agents within a certain radius"""
-        if agent_id not in self.influence_cache:
-            self._calculate_influence(agent_id)
+        """Find the most influential agents within a certain radius
 
-        # Get all agents within radius
-        visited = set()
-        queue = deque([(agent_id, 0)])  # (agent_id, distance)
-        influential = []
+        ``method`` selects the score: "heuristic" uses the cached per-agent
+        influence, "centrality" uses get_influence_centrality().
+        """
+        if method == "centrality":
+            scores = self.get_influence_centrality()
+        else:
+            self._calculate_influence()
+            scores = self.influence_cache
 
-        while queue:
-            current_id, distance = queue.popleft()
+        influential = [
+            (other_id, scores.get(other_id, 0.0))
+            for other_id, _ in self.get_neighbourhood(agent_id, radius)
+        ]
 
-            if current_id in visited or distance > radius:
-                continue
+        # Sort by influence
+        influential.sort(key=lambda x: x[1], reverse=True)
+        return influential
 
-            visited.add(current_id)
+    def get_neighbourhood(self, agent_id: str, radius: int) -> List[Tuple[str, int]]:
+        """Agents within ``radius`` hops of an agent as (agent_id, distance)
 
-            if current_id != agent_id:
-                influence = self.influence_cache.get(current_id, 0.0)
-                influential.append((current_id, influence))
+        Results are cached until the set of relationships changes and should
+        be treated as read-only.
+        """
+        return self.neighbourhood_index.neighbourhood(
+            agent_id, radius, self._neighbour_ids
+        )
 
-            # Add neighbors
-            if current_id in self.relationships:
-                for neighbor_id in self.relationships[current_id]:
-                    if neighbor_id not in visited:
-                        queue.append((neighbor_id, distance + 1))
+    def _neighbour_ids(self, agent_id: str) -> Iterable[str]:
+        return self.relationships.get(agent_id, ())
 
-        # Sort by influence
-        influential.sort(key=lambda x: x[1], reverse=True)
-        return influential
+    def _invalidate_influence(self, *agent_ids: str):
+        """Drop cached influence for the given agents, or for everyone"""
+        if not agent_ids:
+            self.influence_cache.clear()
+            self.influence_engine.invalidate_all()
+            return
+        for agent_id in agent_ids:
+            self.influence_cache.pop(agent_id, None)
+        self.influence_engine.invalidate(*agent_ids)
+
+    def _calculate_influence(self, agent_id: Optional[str] = None):
+        """Recalculate influence scores for agents whose relationships changed"""
+        full_refresh, stale = self.influence_engine.take_stale(self.relationships)
+        if full_refresh:
+            self.influence_cache.clear()
 
-    def _calculate_influence(self, agent_id: str):
-        """Calculate influence scores for all agents"""
         # Simple influence calculation based on relationship strength and network position
-        for agent in self.relationships:
-            if agent in self.influence_cache:
-                continue
-
+        for agent in stale:
             influence = 0.0
             if agent in self.relationships:
                 # Base influence from number of connections
@@ -392,6 +542,90 @@ class SocialNetwork:
 
             self.influence_cache[agent] = max(0.0, influence)
 
+    def get_strength_edges(self):
+        """Every directed relationship as (agent_ids, src, dst, strength)
+
+        ``src`` and ``dst`` are NumPy index arrays into ``agent_ids`` and
+        ``strength`` holds get_strength() of each edge. Requires NumPy.
+        """
+        import numpy as np
+
+        if self._store is not None:
+            size = self._store.size
+            return (
+                list(self._store.agent_ids),
+                self._store.src[:size].astype(np.int64),
+                self._store.dst[:size].astype(np.int64),
+                self._store.strengths(),
+            )
+
+        agent_ids = list(self.relationships)
+        index = {agent_id: i for i, agent_id in enumerate(agent_ids)}
+        src, dst, strength = [], [], []
+        for agent_a, relationships in self.relationships.items():
+            for agent_b, relationship in relationships.items():
+                if agent_b not in index:
+                    index[agent_b] = len(agent_ids)
+                    agent_ids.append(agent_b)
+                src.append(index[agent_a])
+                dst.append(index[agent_b])
+                strength.append(relationship.get_strength())
+        return (
+            agent_ids,
+            np.array(src, dtype=np.int64),
+            np.array(dst, dtype=np.int64),
+            np.array(strength, dtype=np.float64),
+        )
+
+    def get_influence_centrality(self, damping: float = 0.85) -> Dict[str, float]:
+        """Weighted PageRank over positive relationships (scores sum to 1)
+
+        The result is cached until a relationship changes and is recomputed
+        warm-started from the previous vector. Without NumPy the heuristic
+        influence scores are returned instead.
+        """
+        engine = self.influence_engine
+        if engine.centrality_is_current():
+            return engine.centrality
+
+        if not NUMPY_AVAILABLE:
+            logger.warning("NumPy not available, using heuristic influence scores")
+            self._calculate_influence()
+            return self.influence_cache
+
+        import numpy as np
+        from .relationship_store import weighted_pagerank
+
+        if self._store is not None:
+            agent_ids = self._store.agent_ids
+            src, dst, weights = self._store.positive_edge_weights()
+        else:
+            agent_ids = list(self.relationships)
+            index = {agent_id: i for i, agent_id in enumerate(agent_ids)}
+            edges = [
+                (index[agent_a], index[agent_b], relationship.get_strength())
+                for agent_a, relationships in self.relationships.items()
+                for agent_b, relationship in relationships.items()
+                if agent_b in index and relationship.is_positive()
+            ]
+            src = np.array([edge[0] for edge in edges], dtype=np.int64)
+            dst = np.array([edge[1] for edge in edges], dtype=np.int64)
+            weights = np.array([edge[2] for edge in edges], dtype=np.float64)
+
+        start = None
+        if engine.centrality:
+            start = np.array(
+                [engine.centrality.get(agent_id, 0.0) for agent_id in agent_ids]
+            )
+        rank, iterations = weighted_pagerank(
+            len(agent_ids), src, dst, weights, start=start, damping=damping
+        )
+        engine.store_centrality(
+            {agent_id: float(rank[i]) for i, agent_id in enumerate(agent_ids)},
+            iterations,
+        )
+        return engine.centrality
+
     def propagate_morale_effect(
         self,
         source_agent: str,
@@ -399,16 +633,24 @@ class SocialNetwork:
         max_propagation: int = 3,
         falloff_rate: float = 0.5,
     ):
-        """Propagate morale effects through the social network"""
+        """Propagate morale effects through the social network
+
+        The cascade is walked first and the accumulated deltas are committed
+        in one batched update. Each relationship is touched at most once per
+        cascade and positivity is always read before it is updated, so the
+        result matches applying every step immediately.
+        """
         visited = set()
+        queued = {source_agent}
         queue = deque(
             [(source_agent, morale_change, 0)]
         )  # (agent_id, effect, distance)
+        updates = []  # (agent_a, agent_b, delta_affinity, delta_trust)
 
         while queue:
             current_id, effect, distance = queue.popleft()
 
-            if current_id in visited or distance >= max_propagation:
+            if distance >= max_propagation:
                 continue
 
             visited.add(current_id)
@@ -422,60 +664,204 @@ class SocialNetwork:
                         # Propagate effect through positive relationships
                         if relationship.is_positive():
                             propagated_effect = effect * (falloff_rate**distance)
-                            self.update_relationship(
-                                current_id,
-                                other_id,
-                                delta_affinity=propagated_effect * 0.5,
-                                delta_trust=propagated_effect * 0.01,
+                            updates.append(
+                                (
+                                    current_id,
+                                    other_id,
+                                    propagated_effect * 0.5,
+                                    propagated_effect * 0.01,
+                                )
                             )
-                            queue.append((other_id, propagated_effect, distance + 1))
-
-    def decay_all_relationships(self):
-        """Apply decay to all relationships"""
-        for agent_id, relationships in self.relationships.items():
-            for other_id, relationship in relationships.items():
-                relationship.apply_decay()
-
-        # Clear influence cache since relationships changed
-        self.influence_cache.clear()
-
-    def get_social_clusters(self) -> Dict[str, Set[str]]:
-        """Identify social clusters in the network"""
-        clusters = {}
-        visited = set()
-        cluster_id = 0
-
-        for agent_id in self.relationships:
-            if agent_id in visited:
-                continue
-
-            # Start new cluster
-            cluster = set()
-            queue = deque([agent_id])
+                            if other_id not in queued:
+                                queued.add(other_id)
+                                queue.append(
+                                    (other_id, propagated_effect, distance + 1)
+                                )
+
+        self._apply_relationship_deltas(updates)
+        return len(updates)
+
+    def _apply_relationship_deltas(self, updates: List[Tuple[str, str, float, float]]):
+        """Batched update_relationship for (agent_a, agent_b, d_affinity, d_trust)"""
+        if not updates:
+            return
+
+        if self._store is not None:
+            before = self._store.positive_mask()
+            edges, reverse_edges, delta_affinity, delta_trust = [], [], [], []
+            for agent_a, agent_b, d_affinity, d_trust in updates:
+                edge = self._store.find_edge(agent_a, agent_b)
+                if edge is not None:
+                    edges.append(edge)
+                    reverse_edges.append(self._store.find_edge(agent_b, agent_a))
+                    delta_affinity.append(d_affinity)
+                    delta_trust.append(d_trust)
+            self._store.apply_deltas(edges, reverse_edges, delta_affinity, delta_trust)
+            self._record_positivity_flips(before)
+        else:
+            for agent_a, agent_b, d_affinity, d_trust in updates:
+                relationship = self.get_relationship(agent_a, agent_b)
+                if relationship is None:
+                    continue
+                before = self._edge_contribution(agent_a, agent_b)
+                reverse_before = self._edge_contribution(agent_b, agent_a)
 
-            while queue:
-                current_id = queue.popleft()
+                relationship.affinity = max(
+                    -100, min(100, relationship.affinity + d_affinity)
+                )
+                relationship.trust = max(0.0, min(1.0, relationship.trust + d_trust))
+                reverse_rel = self.get_relationship(agent_b, agent_a)
+                if reverse_rel:
+                    reverse_rel.affinity = relationship.affinity
+                    reverse_rel.trust = relationship.trust
+                    reverse_rel.loyalty = relationship.loyalty
+
+                self._edge_changed(agent_a, agent_b, before)
+                self._edge_changed(agent_b, agent_a, reverse_before)
+
+        self._invalidate_influence(
+            *{agent_id for update in updates for agent_id in update[:2]}
+        )
 
-                if current_id in visited:
+    def queue_event(
+        self,
+        agent_a: str,
+        agent_b: str,
+        event_type: EventType,
+        magnitude: float = 1.0,
+    ):
+        """Queue a relationship event to be applied in the next batched update"""
+        self.pending_events.append((agent_a, agent_b, event_type, magnitude))
+
+    def flush_events(self) -> int:
+        """Apply all queued events the way update_relationship applies one
+
+        Events queued for either direction of a pair are merged under the
+        direction queued first. The forward edge takes the summed deltas and
+        is clamped once, its values are copied onto the reverse edge, and
+        the reverse edge then takes the same deltas. A single event per pair
+        gives exactly the result of update_relationship(event_type=...).
+        """
+        events, self.pending_events = self.pending_events, []
+        if not events:
+            return 0
+
+        by_pair: Dict[Tuple[str, str], List[Tuple[EventType, float]]] = {}
+        for agent_a, agent_b, event_type, magnitude in events:
+            pair = (agent_b, agent_a)
+            if pair not in by_pair:
+                pair = (agent_a, agent_b)
+            by_pair.setdefault(pair, []).append((event_type, magnitude))
+
+        if self._store is not None:
+            before = self._store.positive_mask()
+            edges, event_types, magnitudes = [], [], []
+            reverse_edges, reverse_types, reverse_magnitudes = [], [], []
+            copied_edges, copy_targets = [], []
+            for (agent_a, agent_b), pair_events in by_pair.items():
+                edge = self._store.find_edge(agent_a, agent_b)
+                if edge is None:
+                    continue
+                reverse = self._store.find_edge(agent_b, agent_a)
+                copied_edges.append(edge)
+                copy_targets.append(reverse)
+                for event_type, magnitude in pair_events:
+                    edges.append(edge)
+                    event_types.append(event_type)
+                    magnitudes.append(magnitude)
+                    if reverse is not None:
+                        reverse_edges.append(reverse)
+                        reverse_types.append(event_type)
+                        reverse_magnitudes.append(magnitude)
+            self._store.apply_events(edges, event_types, magnitudes)
+            self._store.copy_to_reverse(copied_edges, copy_targets)
+            self._store.apply_events(reverse_edges, reverse_types, reverse_magnitudes)
+            self._record_positivity_flips(before)
+        else:
+            for (agent_a, agent_b), pair_events in by_pair.items():
+                relationship = self.get_relationship(agent_a, agent_b)
+                if relationship is None:
                     continue
+                before = self._edge_contribution(agent_a, agent_b)
+                reverse_before = self._edge_contribution(agent_b, agent_a)
+
+                relationship.apply_events(pair_events)
+                reverse_rel = self.get_relationship(agent_b, agent_a)
+                if reverse_rel:
+                    reverse_rel.affinity = relationship.affinity
+                    reverse_rel.trust = relationship.trust
+                    reverse_rel.loyalty = relationship.loyalty
+                    reverse_rel.apply_events(pair_events)
+
+                self._edge_changed(agent_a, agent_b, before)
+                self._edge_changed(agent_b, agent_a, reverse_before)
+
+        for agent_a, agent_b in by_pair:
+            self._invalidate_influence(agent_a, agent_b)
+        return len(events)
+
+    def decay_all_relationships(self, turn_number: Optional[int] = None) -> bool:
+        """Apply decay to all relationships
+
+        When a turn number is given, decay is applied at most once for that
+        turn and repeated calls are ignored. Returns True if decay was applied.
+        """
+        if turn_number is not None and turn_number == self.last_decay_turn:
+            return False
+
+        if self._store is not None:
+            before = self._store.positive_mask()
+            self._store.apply_decay()
+            self._record_positivity_flips(before)
+        else:
+            self.cohesion_index.mark_dirty()
+            for agent_id, relationships in self.relationships.items():
+                for other_id, relationship in relationships.items():
+                    was_positive = relationship.is_positive()
+                    relationship.apply_decay()
+                    if was_positive and not relationship.is_positive():
+                        self.cluster_index.mark_dirty()
 
-                visited.add(current_id)
-                cluster.add(current_id)
+        self.last_decay_turn = turn_number
 
-                # Add connected agents with positive relationships
-                if current_id in self.relationships:
-                    for other_id, relationship in self.relationships[
-                        current_id
-                    ].items():
-                        if other_id not in visited and relationship.is_positive():
-                            queue.append(other_id)
+        # Every edge changed, so every influence score is stale
+        self._invalidate_influence()
+        return True
 
-            if len(cluster) > 1:  # Only store non-singleton clusters
-                clusters[f"cluster_{cluster_id}"] = cluster
-                cluster_id += 1
+    def apply_turn_updates(self, turn_number: int) -> bool:
+        """Apply queued events and the turn's decay in a single batched pass"""
+        self.flush_events()
+        return self.decay_all_relationships(turn_number)
 
-        self.social_clusters = clusters
-        return clusters
+    def get_social_clusters(self) -> Dict[str, Set[str]]:
+        """Identify social clusters in the network
+
+        Clusters are connected components over positive relationships,
+        maintained incrementally by the cluster index. The returned mapping is
+        shared with the index and should be treated as read-only.
+        """
+        self._ensure_cluster_index()
+        self.social_clusters = self.cluster_index.clusters()
+        return self.social_clusters
+
+    def get_agent_cluster(self, agent_id: str) -> Optional[str]:
+        """Get the id of the social cluster an agent belongs to, if any"""
+        self._ensure_cluster_index()
+        return self.cluster_index.cluster_of(agent_id)
+
+    def in_same_cluster(self, agent_a: str, agent_b: str) -> bool:
+        """Check whether two agents are linked through positive relationships"""
+        self._ensure_cluster_index()
+        return self.cluster_index.same_cluster(agent_a, agent_b)
+
+    def invalidate_clusters(self):
+        """Force a cluster rebuild after relationships were mutated directly"""
+        self.cluster_index.mark_dirty()
+
+    def _ensure_cluster_index(self):
+        """Rebuild the cluster index if an edge stopped being positive"""
+        if self.cluster_index.dirty:
+            self.cluster_index.rebuild(self.relationships, self._positive_edges())
 
     def get_faction_cohesion_index(self, faction_agents: List[str]) -> float:
         """Calculate faction cohesion based on internal relationships"""
@@ -501,6 +887,47 @@ class SocialNetwork:
 
         return total_strength / relationship_count
 
+    def set_agent_faction(self, agent_id: str, faction_id: Optional[str]):
+        """Register an agent's faction for the cached cohesion index"""
+        self.cohesion_index.set_faction(agent_id, faction_id)
+
+    def set_agent_factions(self, agent_factions: Dict[str, str]):
+        """Replace all faction registrations for the cached cohesion index"""
+        self.cohesion_index.set_factions(agent_factions)
+
+    def get_faction_cohesion(self, faction_id: str) -> float:
+        """Cached cohesion of a registered faction
+
+        Equivalent to get_faction_cohesion_index() over the agents registered
+        with set_agent_faction(), but answered from running sums.
+        """
+        if self.cohesion_index.dirty:
+            self._rebuild_cohesion_index()
+        return self.cohesion_index.cohesion(faction_id)
+
+    def _rebuild_cohesion_index(self):
+        """Recompute the per-faction strength sums from the whole network"""
+        agent_faction = self.cohesion_index.agent_faction
+        if self._store is not None:
+            totals, counts = self._store.faction_strength_totals(agent_faction)
+        else:
+            totals, counts = {}, {}
+            for agent_a, relationships in self.relationships.items():
+                faction_id = agent_faction.get(agent_a)
+                if faction_id is None:
+                    continue
+                for agent_b, relationship in relationships.items():
+                    if (
+                        agent_a != agent_b
+                        and agent_faction.get(agent_b) == faction_id
+                        and relationship.is_positive()
+                    ):
+                        totals[faction_id] = (
+                            totals.get(faction_id, 0.0) + relationship.get_strength()
+                        )
+                        counts[faction_id] = counts.get(faction_id, 0) + 1
+        self.cohesion_index.rebuild(totals, counts)
+
     def serialize(self) -> Dict[str, Any]:
         """Serialize the social network"""
         serialized_relationships = {}
@@ -510,18 +937,29 @@ class SocialNetwork:
             }
 
         return {
+            "backend": self.backend,
             "relationships": serialized_relationships,
             "social_clusters": {k: list(v) for k, v in self.social_clusters.items()},
             "influence_cache": self.influence_cache.copy(),
         }
 
     @classmethod
-    def deserialize(cls, data: Dict[str, Any]) -> "SocialNetwork":
+    def deserialize(
+        cls, data: Dict[str, Any], backend: Optional[str] = None
+    ) -> "SocialNetwork":
         """Deserialize the social network"""
-        network = cls()
+        network = cls(backend=backend or data.get("backend", "dict"))
 
         # Restore relationships
         for agent_id, relationships in data.get("relationships", {}).items():
+            if network._store is not None:
+                network._store.intern(agent_id)
+                for other_id, rel_data in relationships.items():
+                    network._store.set_edge(
+                        agent_id, other_id, Relationship.from_dict(rel_data)
+                    )
+                continue
+
             network.relationships[agent_id] = {}
             for other_id, rel_data in relationships.items():
                 network.relationships[agent_id][other_id] = Relationship.from_dict(
@@ -539,7 +977,7 @@ class SocialNetwork:
 
 
 # Phase 2: Team Compatibility System
-def evaluate_team_dynamics(agents: List[Agent]) -> TeamDynamics:
+def evaluate_team_dynamics(agents: List["Agent"]) -> TeamDynamics:
     """Calculate how well agents work together"""
 
     total_synergy = 0.0
@@ -586,7 +1024,7 @@ def calculate_pair_synergy(trust: float, affinity: float) -> float:
     return 0.0
 
 
-def calculate_refusal_risk(agents: List[Agent]) -> List[str]:
+def calculate_refusal_risk(agents: List["Agent"]) -> List[str]:
     """Check if any agent might refuse to work with teammates"""
     refusals = []
 
@@ -759,7 +1197,7 @@ class RelationshipEvent:
 
         elif outcome == "unrequited":
             # Randomly decide who has unrequited feelings
-            if random.random() < 0.5:
+            if get_rng("relationships").random() < 0.5:
                 lover, target = agent_a, agent_b
                 rel_lover, rel_target = rel_a, rel_b
             else:
@@ -847,7 +1285,7 @@ class RelationshipEvent:
                 "event": f"betrayal_by_{betrayer.id}",
                 "severity": severity,
                 "turns_ago": 0,
-                "forgiveness_threshold": random.uniform(
+                "forgiveness_threshold": get_rng("relationships").uniform(
                     0.3, 0.7
                 ),  # Random forgiveness threshold
             }
@@ -0,0 +1,111 @@
+"""
+Seeded Random Number Streams for Years of Lead
+
+Each subsystem (and, where it matters, each agent) draws from its own
+random.Random stream. A stream's seed is derived by hashing the campaign
+seed together with the stream's key, so the numbers a subsystem sees do not
+depend on how many numbers other subsystems drew before it, or in which
+order streams were first used. That keeps seeded campaigns reproducible
+even when subsystems are reordered or run in parallel.
+
+Subsystems call get_rng("name") (or get_rng("agent", agent_id)). When no
+RNGService is active the global random module is returned, so unseeded
+games and tests that patch random behave exactly as before.
+
+A seeded game installs its service when it is created, and every game makes
+its own service (or none) the active one while it initializes and plays a
+turn, so games created side by side do not draw from each other's streams.
+"""
+
+import hashlib
+import random
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+_active_service: Optional["RNGService"] = None
+
+
+class RNGService:
+    """Keyed random streams derived from a single campaign seed"""
+
+    def __init__(self, seed: Optional[int] = None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        self.seed = seed
+        self.streams: Dict[str, random.Random] = {}
+
+    @staticmethod
+    def stream_key(name: str, *keys: Any) -> str:
+        return "/".join([name, *(str(key) for key in keys)])
+
+    def derive_seed(self, key: str) -> int:
+        """Seed for a stream, a pure function of the campaign seed and key"""
+        digest = hashlib.blake2b(
+            f"{self.seed}:{key}".encode("utf-8"), digest_size=16
+        ).digest()
+        return int.from_bytes(digest, "big")
+
+    def stream(self, name: str, *keys: Any) -> random.Random:
+        """Return the stream for a subsystem name and optional sub-keys"""
+        key = self.stream_key(name, *keys)
+        stream = self.streams.get(key)
+        if stream is None:
+            stream = random.Random(self.derive_seed(key))
+            self.streams[key] = stream
+        return stream
+
+    def get_state(self) -> Dict[str, Any]:
+        """JSON-serializable state of the seed and every stream used so far"""
+        streams = {}
+        for key, stream in self.streams.items():
+            version, internal, gauss_next = stream.getstate()
+            streams[key] = [version, list(internal), gauss_next]
+        return {"seed": self.seed, "streams": streams}
+
+    def set_state(self, state: Dict[str, Any]):
+        """Restore the state produced by get_state"""
+        self.seed = state["seed"]
+        self.streams = {}
+        for key, (version, internal, gauss_next) in state.get("streams", {}).items():
+            stream = random.Random()
+            stream.setstate((version, tuple(internal), gauss_next))
+            self.streams[key] = stream
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "RNGService":
+        service = cls(state["seed"])
+        service.set_state(state)
+        return service
+
+
+def get_rng_service() -> Optional[RNGService]:
+    """The active RNG service, if a seeded game installed one"""
+    return _active_service
+
+
+def set_rng_service(service: Optional[RNGService]):
+    """Install (or with None, remove) the active RNG service"""
+    global _active_service
+    _active_service = service
+
+
+@contextmanager
+def use_rng_service(service: Optional[RNGService]) -> Iterator[Optional[RNGService]]:
+    """Make ``service`` (or, with None, no service) active for a block
+
+    Whatever was active before is put back afterwards.
+    """
+    global _active_service
+    previous = _active_service
+    _active_service = service
+    try:
+        yield service
+    finally:
+        _active_service = previous
+
+
+def get_rng(name: str, *keys: Any):
+    """Random stream for a subsystem, or the global random module if unseeded"""
+    if _active_service is None:
+        return random
+    return _active_service.stream(name, *keys)
@@ -0,0 +1,70 @@
+"""
+Weighted Sampling Helpers for Years of Lead
+
+Template and event selection used to replicate every candidate ``weight``
+times into a list and call random.choice on it. AliasTable does the same
+weighted draw in constant time from a table built once per candidate set
+(Vose's alias method).
+"""
+
+import random
+from typing import Generic, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class AliasTable(Generic[T]):
+    """Constant-time weighted choice over a fixed list of items
+
+    Items with a weight of zero or less are never drawn. Building the table
+    is linear in the number of items.
+    """
+
+    def __init__(self, items: Sequence[T], weights: Sequence[float]):
+        if len(items) != len(weights):
+            raise ValueError("items and weights must have the same length")
+
+        self.items: List[T] = [item for item, w in zip(items, weights) if w > 0]
+        weights = [w for w in weights if w > 0]
+        self.total_weight = sum(weights)
+
+        count = len(self.items)
+        self._probability = [1.0] * count
+        self._alias = list(range(count))
+        if count == 0:
+            return
+
+        scaled = [w * count / self.total_weight for w in weights]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self._probability[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # Whatever is left is 1.0 up to rounding error
+        for i in small + large:
+            self._probability[i] = 1.0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __bool__(self) -> bool:
+        return bool(self.items)
+
+    def sample(self, rng=random) -> T:
+        """Draw one item; ``rng`` is anything with a random() method"""
+        if not self.items:
+            raise IndexError("Cannot sample from an empty alias table")
+        column = rng.random() * len(self.items)
+        index = int(column)
+        if index >= len(self.items):  # random() is < 1.0, but guard rounding
+            index = len(self.items) - 1
+        if column - index < self._probability[index]:
+            return self.items[index]
+        return self.items[self._alias[index]]
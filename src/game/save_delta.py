@@ -0,0 +1,153 @@
+"""
+Delta saves for SaveManager.
+
+A delta save is a full binary base snapshot plus a journal of per-turn
+patches appended next to it. Each patch only holds what changed since the
+previous record: changed agents, changed relationship edges, lines appended
+to the narrative log and so on. Loading replays the journal onto the base,
+optionally stopping at an earlier turn.
+
+Journal records are appended as:
+
+    metadata length (uint32) + metadata JSON (turn, save metadata)
+    payload length (uint64) + zlib-compressed patch JSON
+
+so the latest metadata can be found by skipping over the payloads.
+"""
+
+import json
+import struct
+import zlib
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+JOURNAL_EXTENSION = ".yoldelta"
+
+_META_LENGTH = struct.Struct(">I")
+_PAYLOAD_LENGTH = struct.Struct(">Q")
+
+# Patch operations. Containers are diffed recursively; anything else that
+# changed is replaced outright.
+_REPLACE = "~r"
+_DICT = "~d"
+_LIST = "~l"
+
+
+def diff_state(old: Any, new: Any) -> Optional[Dict[str, Any]]:
+    """Return a patch turning ``old`` into ``new``, or None if they are equal"""
+    if old == new:
+        return None
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        changes: Dict[str, Any] = {}
+        for key, value in new.items():
+            if key not in old:
+                changes.setdefault("set", {})[key] = value
+                continue
+            patch = diff_state(old[key], value)
+            if patch is not None:
+                changes.setdefault("sub", {})[key] = patch
+        removed = [key for key in old if key not in new]
+        if removed:
+            changes["del"] = removed
+        return {_DICT: changes}
+
+    if isinstance(old, list) and isinstance(new, list) and len(new) >= len(old):
+        changes = {}
+        for i, (old_item, new_item) in enumerate(zip(old, new)):
+            patch = diff_state(old_item, new_item)
+            if patch is not None:
+                changes.setdefault("sub", {})[str(i)] = patch
+        if len(new) > len(old):
+            changes["append"] = new[len(old) :]
+        return {_LIST: changes}
+
+    return {_REPLACE: new}
+
+
+def apply_patch(value: Any, patch: Optional[Dict[str, Any]]) -> Any:
+    """Apply a patch from diff_state, mutating containers in place"""
+    if patch is None:
+        return value
+    if _REPLACE in patch:
+        return patch[_REPLACE]
+
+    if _DICT in patch:
+        changes = patch[_DICT]
+        for key in changes.get("del", []):
+            value.pop(key, None)
+        for key, sub_patch in changes.get("sub", {}).items():
+            value[key] = apply_patch(value[key], sub_patch)
+        value.update(changes.get("set", {}))
+        return value
+
+    changes = patch[_LIST]
+    for index, sub_patch in changes.get("sub", {}).items():
+        i = int(index)
+        value[i] = apply_patch(value[i], sub_patch)
+    value.extend(changes.get("append", []))
+    return value
+
+
+def append_record(f, turn: Any, metadata: Dict[str, Any], patch: Any) -> int:
+    """Append one journal record, returning the number of bytes written"""
+    meta = json.dumps(
+        {"turn": turn, "metadata": metadata}, separators=(",", ":")
+    ).encode("utf-8")
+    payload = zlib.compress(json.dumps(patch, separators=(",", ":")).encode("utf-8"))
+    f.write(_META_LENGTH.pack(len(meta)))
+    f.write(meta)
+    f.write(_PAYLOAD_LENGTH.pack(len(payload)))
+    f.write(payload)
+    return _META_LENGTH.size + len(meta) + _PAYLOAD_LENGTH.size + len(payload)
+
+
+def iter_records(f, with_patches: bool = True) -> Iterator[Tuple[Dict[str, Any], Any]]:
+    """Yield (record metadata, patch) for each complete journal record
+
+    A record cut short by a crash mid-append is ignored. With
+    ``with_patches=False`` payloads are skipped and the patch is None.
+    """
+    position = f.tell()
+    size = f.seek(0, 2)
+    f.seek(position)
+
+    while True:
+        raw = f.read(_META_LENGTH.size)
+        if len(raw) < _META_LENGTH.size:
+            return
+        (meta_length,) = _META_LENGTH.unpack(raw)
+        meta_raw = f.read(meta_length)
+        raw = f.read(_PAYLOAD_LENGTH.size)
+        if len(meta_raw) < meta_length or len(raw) < _PAYLOAD_LENGTH.size:
+            return
+        (payload_length,) = _PAYLOAD_LENGTH.unpack(raw)
+
+        if with_patches:
+            payload = f.read(payload_length)
+            if len(payload) < payload_length:
+                return
+            patch = json.loads(zlib.decompress(payload).decode("utf-8"))
+        else:
+            if f.tell() + payload_length > size:
+                return
+            f.seek(payload_length, 1)
+            patch = None
+        yield json.loads(meta_raw.decode("utf-8")), patch
+
+
+def replay(
+    game_state: Dict[str, Any], f, turn: Optional[Any] = None
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Replay journal records onto a base state
+
+    Records for turns after ``turn`` are not applied. Returns the resulting
+    state and the metadata of the records that were applied.
+    """
+    applied = []
+    for record, patch in iter_records(f):
+        if turn is not None and record.get("turn") is not None:
+            if record["turn"] > turn:
+                break
+        game_state = apply_patch(game_state, patch)
+        applied.append(record)
+    return game_state, applied
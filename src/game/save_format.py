@@ -0,0 +1,215 @@
+"""
+Binary save format for SaveManager.
+
+A save file is a small uncompressed header followed by independently
+compressed sections, so the metadata can be read without touching the body
+and each section can be written and read as a stream:
+
+    MAGIC (8 bytes)
+    header length (uint32, big endian) + header JSON (metadata, version)
+    repeated sections:
+        name length (uint16) + name (utf-8)
+        codec (1 byte) + payload length (uint64)
+        payload (compressed compact JSON)
+
+Sections are compressed with zstd when the zstandard package is available
+and with zlib otherwise. The codec is recorded per section, so files written
+with either codec can be read wherever that codec is installed.
+"""
+
+import io
+import json
+import logging
+import struct
+import zlib
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"YOLSAVE\x01"
+FORMAT_VERSION = 1
+EXTENSION = ".yolsave"
+
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+
+# Top-level game state keys stored in their own sections; everything else
+# goes into the "core" section.
+SECTION_KEYS = ("agents", "factions", "social_network", "narrative")
+CORE_SECTION = "core"
+
+CHUNK_SIZE = 64 * 1024
+
+_HEADER_LENGTH = struct.Struct(">I")
+_NAME_LENGTH = struct.Struct(">H")
+_SECTION_INFO = struct.Struct(">BQ")
+
+
+class SaveFormatError(ValueError):
+    """Raised when a file is not a valid binary save"""
+
+
+def default_codec() -> int:
+    """Best codec available in this environment"""
+    return CODEC_ZSTD if ZSTD_AVAILABLE else CODEC_ZLIB
+
+
+def is_binary_save(path: str) -> bool:
+    """Check whether a file starts with the binary save magic"""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def split_sections(game_state: Dict[str, Any]) -> Iterator[Tuple[str, Any]]:
+    """Split a game state dict into (section name, payload) pairs"""
+    core = {key: value for key, value in game_state.items() if key not in SECTION_KEYS}
+    yield CORE_SECTION, core
+    for key in SECTION_KEYS:
+        if key in game_state:
+            yield key, game_state[key]
+
+
+def join_sections(sections: Iterable[Tuple[str, Any]]) -> Dict[str, Any]:
+    """Inverse of split_sections"""
+    game_state: Dict[str, Any] = {}
+    for name, payload in sections:
+        if name == CORE_SECTION:
+            game_state.update(payload)
+        else:
+            game_state[name] = payload
+    return game_state
+
+
+def _compressor(codec: int):
+    if codec == CODEC_ZSTD:
+        return zstandard.ZstdCompressor().compressobj()
+    return zlib.compressobj(6)
+
+
+def _decompressor(codec: int):
+    if codec == CODEC_ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise SaveFormatError(
+                "Save section uses zstd but zstandard is not installed"
+            )
+        return zstandard.ZstdDecompressor().decompressobj()
+    if codec == CODEC_ZLIB:
+        return zlib.decompressobj()
+    raise SaveFormatError(f"Unknown save section codec {codec}")
+
+
+def write_header(f, metadata: Dict[str, Any]):
+    """Write the magic and the metadata header"""
+    header = json.dumps(
+        {"version": FORMAT_VERSION, "metadata": metadata}, separators=(",", ":")
+    ).encode("utf-8")
+    f.write(MAGIC)
+    f.write(_HEADER_LENGTH.pack(len(header)))
+    f.write(header)
+
+
+def write_section(f, name: str, payload: Any, codec: Optional[int] = None):
+    """Stream one section to a seekable file
+
+    The payload is JSON-encoded and compressed chunk by chunk, so the
+    uncompressed text is never held in memory as a whole.
+    """
+    codec = codec or default_codec()
+    encoded_name = name.encode("utf-8")
+    f.write(_NAME_LENGTH.pack(len(encoded_name)))
+    f.write(encoded_name)
+
+    info_offset = f.tell()
+    f.write(_SECTION_INFO.pack(codec, 0))  # Length is patched in below
+    start = f.tell()
+
+    compressor = _compressor(codec)
+    buffer = io.StringIO()
+    for chunk in json.JSONEncoder(separators=(",", ":")).iterencode(payload):
+        buffer.write(chunk)
+        if buffer.tell() >= CHUNK_SIZE:
+            f.write(compressor.compress(buffer.getvalue().encode("utf-8")))
+            buffer = io.StringIO()
+    f.write(compressor.compress(buffer.getvalue().encode("utf-8")))
+    f.write(compressor.flush())
+
+    end = f.tell()
+    f.seek(info_offset)
+    f.write(_SECTION_INFO.pack(codec, end - start))
+    f.seek(end)
+
+
+def write_save(f, metadata: Dict[str, Any], game_state: Dict[str, Any]):
+    """Write a complete binary save"""
+    write_header(f, metadata)
+    for name, payload in split_sections(game_state):
+        write_section(f, name, payload)
+
+
+def read_header(f) -> Dict[str, Any]:
+    """Read the header; leaves the file positioned at the first section"""
+    if f.read(len(MAGIC)) != MAGIC:
+        raise SaveFormatError("Not a binary save file")
+    (length,) = _HEADER_LENGTH.unpack(_read_exact(f, _HEADER_LENGTH.size))
+    header = json.loads(_read_exact(f, length).decode("utf-8"))
+    if header.get("version", 0) > FORMAT_VERSION:
+        raise SaveFormatError(f"Unsupported save format version {header['version']}")
+    return header
+
+
+def read_sections(
+    f, names: Optional[Iterable[str]] = None
+) -> Iterator[Tuple[str, Any]]:
+    """Yield (name, payload) for each section, skipping those not in ``names``
+
+    The file must be positioned just after the header. Skipped sections are
+    seeked over without being read.
+    """
+    wanted = set(names) if names is not None else None
+    while True:
+        raw = f.read(_NAME_LENGTH.size)
+        if not raw:
+            return
+        (name_length,) = _NAME_LENGTH.unpack(raw)
+        name = _read_exact(f, name_length).decode("utf-8")
+        codec, length = _SECTION_INFO.unpack(_read_exact(f, _SECTION_INFO.size))
+
+        if wanted is not None and name not in wanted:
+            f.seek(length, io.SEEK_CUR)
+            continue
+
+        decompressor = _decompressor(codec)
+        parts = []
+        remaining = length
+        while remaining > 0:
+            chunk = _read_exact(f, min(CHUNK_SIZE, remaining))
+            remaining -= len(chunk)
+            parts.append(decompressor.decompress(chunk))
+        if hasattr(decompressor, "flush"):
+            parts.append(decompressor.flush())
+        yield name, json.loads(b"".join(parts).decode("utf-8"))
+
+
+def read_save(
+    f, names: Optional[Iterable[str]] = None
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Read a binary save, returning (metadata, game_state)"""
+    header = read_header(f)
+    return header.get("metadata", {}), join_sections(read_sections(f, names))
+
+
+def _read_exact(f, size: int) -> bytes:
+    data = f.read(size)
+    if len(data) != size:
+        raise SaveFormatError("Truncated save file")
+    return data
@@ -1,16 +1,83 @@
 """
 SaveManager module for handling game saves and loads.
+
+Saves are written either as pretty-printed JSON or in the compressed,
+sectioned binary format from save_format. Autosaves use the binary format by
+default because they are written every turn, and can optionally be written
+on a background thread or as per-turn deltas against a base snapshot.
 """
+
+import atexit
 import os
 import json
+import queue
+import tempfile
+import threading
 from datetime import datetime
 
+from . import save_delta
+from . import save_format as binary_format
+
+SAVE_FORMATS = {"json": ".json", "binary": binary_format.EXTENSION}
+
+# Maps each save filename to its metadata plus the size and mtime the entry
+# was recorded for, so the browser never has to open the save bodies.
+SAVE_INDEX_FILENAME = ".save_index"
+
+
+def snapshot_state(value):
+    """Copy the containers of a serialized game state, sharing immutable leaves
+
+    The copy is detached from the live game, so the game can keep changing
+    while the snapshot is written on another thread. Strings and numbers are
+    immutable and are shared rather than copied.
+    """
+    if isinstance(value, dict):
+        return {key: snapshot_state(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [snapshot_state(item) for item in value]
+    return value
+
 
 class SaveManager:
     """Handles saving and loading game states"""
 
-    def __init__(self):
-        """Initialize the save manager"""
+    def __init__(
+        self,
+        save_format="json",
+        autosave_format="binary",
+        async_autosave=False,
+        delta_autosave=False,
+        delta_compact_every=20,
+    ):
+        """Initialize the save manager
+
+        Args:
+            save_format: Format for manual and special saves ("json" or "binary")
+            autosave_format: Format for autosaves ("json" or "binary")
+            async_autosave: Write autosaves on a background thread
+            delta_autosave: Write autosaves as deltas against a base snapshot
+            delta_compact_every: Delta records written before a new base
+        """
+        for fmt in (save_format, autosave_format):
+            if fmt not in SAVE_FORMATS:
+                raise ValueError(f"Unknown save format: {fmt}")
+        self.save_format = save_format
+        self.autosave_format = autosave_format
+        self.async_autosave = async_autosave
+        self.delta_autosave = delta_autosave
+        self.delta_compact_every = delta_compact_every
+
+        # Delta save chains: base filename -> last saved state and record count
+        self._delta_chains = {}
+
+        # Background autosave state; the queue holds at most one snapshot so a
+        # new autosave waits only while the writer is two saves behind.
+        self._index_lock = threading.Lock()
+        self._autosave_queue = queue.Queue(maxsize=1)
+        self._autosave_thread = None
+        self.last_autosave_error = None
+
         # Create saves directory if it doesn't exist
         self.save_directory = os.path.join(
             os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "saves"
@@ -18,27 +85,62 @@ class SaveManager:
         if not os.path.exists(self.save_directory):
             os.makedirs(self.save_directory)
 
-    def save_game(self, game, filename, save_type="manual"):
+    def save_game(self, game, filename, save_type="manual", save_format=None):
         """Save the game state to a file
 
         Args:
             game: The game object to save
             filename: The name of the save file (without extension)
             save_type: The type of save (manual, autosave, victory, defeat)
+            save_format: "json" or "binary"; defaults to the manager's format
 
         Returns:
             The full filename of the saved game
         """
-        # Create a unique filename if one is not provided
-        if not filename.endswith(".json"):
-            filename = f"{filename}.json"
+        save_format = save_format or self.save_format
+        filename = self._resolve_filename(filename, save_format)
 
         # Get the full path to the save file
         save_path = os.path.join(self.save_directory, filename)
 
         # Extract metadata from game state
+        game_state = self._game_state_dict(game)
+        metadata = self._build_metadata(game_state, save_type)
+
+        if save_format == "binary":
+            self._write_binary(save_path, metadata, game_state)
+        else:
+            # Prepare the save data
+            save_data = {"metadata": metadata, "game_state": game_state}
+
+            # Save the data to the file
+            with open(save_path, "w") as f:
+                json.dump(save_data, f, indent=2)
+
+        self._update_index(filename, metadata)
+        return filename
+
+    def _game_state_dict(self, game):
+        """Serialize a game, including its random stream state if seeded"""
         game_state = game.to_dict() if hasattr(game, "to_dict") else {}
-        metadata = {
+        rng_state = game.get_rng_state() if hasattr(game, "get_rng_state") else None
+        if isinstance(rng_state, dict):
+            game_state = dict(game_state, rng_state=rng_state)
+        return game_state
+
+    def _resolve_filename(self, filename, save_format):
+        """Give a save name the extension of its format"""
+        extension = SAVE_FORMATS[save_format]
+        for known_extension in SAVE_FORMATS.values():
+            if known_extension != extension and filename.endswith(known_extension):
+                filename = filename[: -len(known_extension)]
+        if not filename.endswith(extension):
+            filename = f"{filename}{extension}"
+        return filename
+
+    def _build_metadata(self, game_state, save_type):
+        """Summarize a game state for the save browser"""
+        return {
             "turn": game_state.get("turn", 0),
             "date": game_state.get("date", "1975-01-01"),
             "agent_count": len(game_state.get("agents", [])),
@@ -52,14 +154,29 @@ class SaveManager:
             "timestamp": datetime.now().isoformat(),
         }
 
-        # Prepare the save data
-        save_data = {"metadata": metadata, "game_state": game_state}
+    def _write_binary(self, save_path, metadata, game_state):
+        """Stream a binary save to a temporary file and move it into place"""
+        temp_path = f"{save_path}.tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                binary_format.write_save(f, metadata, game_state)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, save_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _read_save_data(self, save_path):
+        """Read a save file in either format as {"metadata", "game_state"}"""
+        if binary_format.is_binary_save(save_path):
+            filename = os.path.basename(save_path)
+            game_state = self.load_delta_state(filename)
+            metadata = self.get_save_metadata(filename)
+            return {"metadata": metadata, "game_state": game_state}
 
-        # Save the data to the file
-        with open(save_path, "w") as f:
-            json.dump(save_data, f, indent=2)
-
-        return filename
+        with open(save_path, "r") as f:
+            return json.load(f)
 
     def load_game(self, cli, filename):
         """Load a game state from a file
@@ -81,8 +198,7 @@ class SaveManager:
 
         # Load the data from the file
         try:
-            with open(save_path, "r") as f:
-                save_data = json.load(f)
+            save_data = self._read_save_data(save_path)
 
             # Extract the game state
             game_state = save_data.get("game_state", {})
@@ -90,6 +206,8 @@ class SaveManager:
             # Load the game state
             if hasattr(cli.game, "from_dict"):
                 cli.game.from_dict(game_state)
+            if "rng_state" in game_state and hasattr(cli.game, "set_rng_state"):
+                cli.game.set_rng_state(game_state["rng_state"])
 
             return True
         except Exception as e:
@@ -108,11 +226,163 @@ class SaveManager:
         # Get the current turn
         turn = game.turn if hasattr(game, "turn") else 0
 
-        # Create a filename with the turn number and current date
-        filename = f"autosave_turn{turn}_{datetime.now().strftime('%Y%m%d')}"
+        # Create a filename with the turn number and current date; delta
+        # autosaves extend a single chain instead
+        if self.delta_autosave:
+            filename = "autosave_delta"
+        else:
+            filename = f"autosave_turn{turn}_{datetime.now().strftime('%Y%m%d')}"
+
+        # Hand the save to the background writer if enabled
+        if self.async_autosave:
+            return self._queue_autosave(game, filename)
+
+        if self.delta_autosave:
+            return self.save_delta(game, filename, save_type="autosave")
 
         # Save the game
-        return self.save_game(game, filename, save_type="autosave")
+        return self.save_game(
+            game, filename, save_type="autosave", save_format=self.autosave_format
+        )
+
+    def _queue_autosave(self, game, filename):
+        """Snapshot the game on this thread and write it on the worker thread
+
+        Only the snapshot is taken synchronously. If the previous autosave is
+        still being written and another one is already waiting, this blocks
+        until the writer catches up.
+        """
+        save_format = "binary" if self.delta_autosave else self.autosave_format
+        filename = self._resolve_filename(filename, save_format)
+        game_state = snapshot_state(self._game_state_dict(game))
+        metadata = self._build_metadata(game_state, "autosave")
+
+        self._ensure_autosave_thread()
+        self._autosave_queue.put((filename, metadata, game_state))
+        return filename
+
+    def _ensure_autosave_thread(self):
+        if self._autosave_thread is None:
+            # Let pending autosaves finish before the interpreter exits
+            atexit.register(self.wait_for_autosave)
+        if self._autosave_thread is None or not self._autosave_thread.is_alive():
+            self._autosave_thread = threading.Thread(
+                target=self._autosave_worker, name="autosave", daemon=True
+            )
+            self._autosave_thread.start()
+
+    def _autosave_worker(self):
+        """Write queued autosave snapshots until the process exits"""
+        while True:
+            filename, metadata, game_state = self._autosave_queue.get()
+            try:
+                save_path = os.path.join(self.save_directory, filename)
+                if self.delta_autosave:
+                    self._write_delta(filename, metadata, game_state)
+                elif self.autosave_format == "binary":
+                    self._write_binary(save_path, metadata, game_state)
+                    self._update_index(filename, metadata)
+                else:
+                    self._write_json_atomic(save_path, metadata, game_state)
+                    self._update_index(filename, metadata)
+                self.last_autosave_error = None
+            except Exception as e:
+                self.last_autosave_error = e
+                print(f"Error writing autosave {filename}: {e}")
+            finally:
+                self._autosave_queue.task_done()
+
+    def _write_json_atomic(self, save_path, metadata, game_state):
+        """Write a JSON save to a temporary file and move it into place"""
+        temp_path = f"{save_path}.tmp"
+        try:
+            with open(temp_path, "w") as f:
+                json.dump({"metadata": metadata, "game_state": game_state}, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, save_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def save_delta(self, game, filename, save_type="manual"):
+        """Save the game as a delta against the chain's previous save
+
+        The first save of a chain, and every delta_compact_every records
+        after that, writes a full binary base snapshot. Other saves append
+        only what changed since the previous save to the chain's journal.
+
+        Args:
+            game: The game object to save
+            filename: The name of the chain's base save (without extension)
+            save_type: The type of save (manual, autosave, victory, defeat)
+
+        Returns:
+            The filename of the chain's base save
+        """
+        filename = self._resolve_filename(filename, "binary")
+        game_state = snapshot_state(self._game_state_dict(game))
+        metadata = self._build_metadata(game_state, save_type)
+        self._write_delta(filename, metadata, game_state)
+        return filename
+
+    def _journal_path(self, filename):
+        stem = os.path.splitext(filename)[0]
+        return os.path.join(self.save_directory, stem + save_delta.JOURNAL_EXTENSION)
+
+    def _write_delta(self, filename, metadata, game_state):
+        """Append a delta record, or compact the chain into a new base"""
+        save_path = os.path.join(self.save_directory, filename)
+        journal_path = self._journal_path(filename)
+        chain = self._delta_chains.get(filename)
+
+        if (
+            chain is None
+            or chain["records"] >= self.delta_compact_every
+            or not os.path.exists(save_path)
+        ):
+            # Compact: drop the journal, then write a fresh base. In this
+            # order a crash in between leaves the previous base on its own
+            # instead of an old journal that would be replayed onto the new one
+            if os.path.exists(journal_path):
+                os.remove(journal_path)
+            self._write_binary(save_path, metadata, game_state)
+            self._delta_chains[filename] = {"state": game_state, "records": 0}
+        else:
+            patch = save_delta.diff_state(chain["state"], game_state)
+            with open(journal_path, "ab") as f:
+                save_delta.append_record(f, metadata.get("turn"), metadata, patch)
+                f.flush()
+                os.fsync(f.fileno())
+            chain["state"] = game_state
+            chain["records"] += 1
+
+        self._update_index(filename, metadata)
+
+    def load_delta_state(self, filename, turn=None):
+        """Rebuild the game state of a delta save chain
+
+        Args:
+            filename: The name of the chain's base save
+            turn: Stop replaying after this turn (defaults to the latest)
+
+        Returns:
+            The game state dictionary
+        """
+        save_path = os.path.join(self.save_directory, filename)
+        with open(save_path, "rb") as f:
+            _, game_state = binary_format.read_save(f)
+
+        journal_path = self._journal_path(filename)
+        if os.path.exists(journal_path):
+            with open(journal_path, "rb") as f:
+                game_state, _ = save_delta.replay(game_state, f, turn)
+        return game_state
+
+    def wait_for_autosave(self):
+        """Block until every queued autosave has been written"""
+        if self._autosave_thread is not None and self._autosave_thread.is_alive():
+            self._autosave_queue.join()
 
     def victory_save(self, game, victory_type):
         """Create a victory save
@@ -155,8 +425,9 @@ class SaveManager:
         # Get all files in the save directory
         files = os.listdir(self.save_directory)
 
-        # Filter for JSON files
-        save_files = [f for f in files if f.endswith(".json")]
+        # Filter for save files in any supported format
+        extensions = tuple(SAVE_FORMATS.values())
+        save_files = [f for f in files if f.endswith(extensions)]
 
         return save_files
 
@@ -176,6 +447,23 @@ class SaveManager:
         if not os.path.exists(save_path):
             return None
 
+        # Binary saves keep the metadata in a header ahead of the body
+        if binary_format.is_binary_save(save_path):
+            try:
+                with open(save_path, "rb") as f:
+                    metadata = binary_format.read_header(f).get("metadata", {})
+
+                # Delta chains report the metadata of their latest record
+                journal_path = self._journal_path(filename)
+                if os.path.exists(journal_path):
+                    with open(journal_path, "rb") as f:
+                        for record, _ in save_delta.iter_records(f, with_patches=False):
+                            metadata = record.get("metadata", metadata)
+                return metadata
+            except Exception as e:
+                print(f"Error reading save metadata: {e}")
+                return None
+
         # Load the data from the file
         try:
             with open(save_path, "r") as f:
@@ -187,6 +475,125 @@ class SaveManager:
             print(f"Error reading save metadata: {e}")
             return None
 
+    def _index_path(self):
+        return os.path.join(self.save_directory, SAVE_INDEX_FILENAME)
+
+    def _load_index(self):
+        """Read the save index, returning an empty index if it is missing"""
+        try:
+            with open(self._index_path(), "r") as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _write_index(self, index):
+        """Atomically replace the save index"""
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.save_directory, prefix=SAVE_INDEX_FILENAME, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(json.dumps(index))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self._index_path())
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _index_entry(self, filename, metadata):
+        """Build an index entry, or None if the save file cannot be stat'ed"""
+        try:
+            stat = os.stat(os.path.join(self.save_directory, filename))
+        except OSError:
+            return None
+        return {"metadata": metadata, "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+    def _update_index(self, filename, metadata):
+        """Record a freshly written save in the index"""
+        entry = self._index_entry(filename, metadata)
+        if entry is None:
+            return
+        with self._index_lock:
+            index = self._load_index()
+            index[filename] = entry
+            try:
+                self._write_index(index)
+            except OSError as e:
+                print(f"Error updating save index: {e}")
+
+    def get_all_save_metadata(self, save_files=None):
+        """Get metadata for many saves from the save index
+
+        Entries that are missing or no longer match the file on disk are read
+        from the save itself and written back to the index; entries for
+        deleted saves are dropped.
+
+        Args:
+            save_files: Save filenames to look up (defaults to list_saves())
+
+        Returns:
+            A dictionary of filename -> metadata (None if unreadable)
+        """
+        if save_files is None:
+            save_files = self.list_saves()
+
+        with self._index_lock:
+            return self._lookup_index(save_files)
+
+    def _lookup_index(self, save_files):
+        """get_all_save_metadata body; the caller holds the index lock"""
+        index = self._load_index()
+        changed = False
+        result = {}
+        for filename in save_files:
+            entry = index.get(filename)
+            current = self._index_entry(filename, None)
+            if (
+                entry is not None
+                and current is not None
+                and entry.get("size") == current["size"]
+                and entry.get("mtime") == current["mtime"]
+            ):
+                result[filename] = entry.get("metadata")
+                continue
+
+            metadata = self.get_save_metadata(filename)
+            result[filename] = metadata
+            if current is not None and metadata is not None:
+                current["metadata"] = metadata
+                index[filename] = current
+                changed = True
+
+        for filename in list(index):
+            if not os.path.exists(os.path.join(self.save_directory, filename)):
+                del index[filename]
+                changed = True
+
+        if changed:
+            try:
+                self._write_index(index)
+            except OSError as e:
+                print(f"Error updating save index: {e}")
+        return result
+
+    def rebuild_save_index(self):
+        """Rebuild the save index from the save files
+
+        Returns:
+            The number of saves indexed
+        """
+        index = {}
+        for filename in self.list_saves():
+            metadata = self.get_save_metadata(filename)
+            entry = self._index_entry(filename, metadata)
+            if entry is not None and metadata is not None:
+                index[filename] = entry
+        with self._index_lock:
+            self._write_index(index)
+        return len(index)
+
     def display_save_browser(self):
         """Display a browser for save files
 
@@ -201,11 +608,14 @@ class SaveManager:
             print("No save files found!")
             return []
 
+        # Look up metadata for all saves in the index
+        all_metadata = self.get_all_save_metadata(save_files)
+
         # Display the save files
         print("=== Save Browser ===")
         for i, filename in enumerate(save_files, 1):
             # Get metadata for the save file
-            metadata = self.get_save_metadata(filename)
+            metadata = all_metadata.get(filename)
 
             if metadata:
                 # Extract metadata fields
@@ -0,0 +1,302 @@
+"""
+Incremental Social Network Indexes for Years of Lead
+
+This module holds derived views of the SocialNetwork that are kept current as
+relationships change instead of being recomputed from the whole graph on
+every query.
+"""
+
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class ClusterIndex:
+    """Union-find index of social clusters (agents linked by positive relationships)
+
+    Edges that become positive are merged immediately. Union-find cannot split
+    a cluster, so an edge that stops being positive only marks the index dirty
+    and the components are rebuilt from the network on the next query.
+    """
+
+    def __init__(self):
+        self.parent: Dict[str, str] = {}
+        self.rank: Dict[str, int] = {}
+        self.dirty = True  # Components must be rebuilt from the network
+        self.version = 0  # Bumped whenever the components may have changed
+
+        # Materialized cluster names, rebuilt lazily when the version changes
+        self._clusters: Dict[str, Set[str]] = {}
+        self._agent_cluster: Dict[str, str] = {}
+        self._materialized_version = -1
+
+    def add_agent(self, agent_id: str):
+        """Register an agent as its own singleton component"""
+        if agent_id not in self.parent:
+            self.parent[agent_id] = agent_id
+            self.rank[agent_id] = 0
+
+    def find(self, agent_id: str) -> str:
+        """Return the root of an agent's component, compressing the path"""
+        self.add_agent(agent_id)
+        root = agent_id
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[agent_id] != root:
+            self.parent[agent_id], agent_id = root, self.parent[agent_id]
+        return root
+
+    def union(self, agent_a: str, agent_b: str):
+        """Merge the components of two agents"""
+        root_a = self.find(agent_a)
+        root_b = self.find(agent_b)
+        if root_a == root_b:
+            return
+
+        if self.rank[root_a] < self.rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self.parent[root_b] = root_a
+        if self.rank[root_a] == self.rank[root_b]:
+            self.rank[root_a] += 1
+        self.version += 1
+
+    def edge_changed(
+        self, agent_a: str, agent_b: str, was_positive: bool, is_positive: bool
+    ):
+        """Record a change in whether the edge agent_a -> agent_b is positive"""
+        if is_positive and not was_positive:
+            if not self.dirty:
+                self.union(agent_a, agent_b)
+        elif was_positive and not is_positive:
+            self.mark_dirty()
+
+    def mark_dirty(self):
+        """Force a rebuild on the next query"""
+        if not self.dirty:
+            self.dirty = True
+            self.version += 1
+
+    def rebuild(
+        self, agent_ids: Iterable[str], positive_edges: Iterable[Tuple[str, str]]
+    ):
+        """Rebuild all components from the agents and their positive edges"""
+        self.parent = {}
+        self.rank = {}
+        for agent_id in agent_ids:
+            self.add_agent(agent_id)
+        for agent_a, agent_b in positive_edges:
+            self.union(agent_a, agent_b)
+        self.dirty = False
+        self.version += 1
+
+    def _materialize(self):
+        """Name non-singleton components in order of their first member"""
+        groups: Dict[str, Set[str]] = {}
+        for agent_id in self.parent:
+            groups.setdefault(self.find(agent_id), set()).add(agent_id)
+
+        self._clusters = {}
+        self._agent_cluster = {}
+        for members in groups.values():
+            if len(members) > 1:  # Only store non-singleton clusters
+                cluster_id = f"cluster_{len(self._clusters)}"
+                self._clusters[cluster_id] = members
+                for agent_id in members:
+                    self._agent_cluster[agent_id] = cluster_id
+        self._materialized_version = self.version
+
+    def clusters(self) -> Dict[str, Set[str]]:
+        """Return cluster_id -> members for all non-singleton clusters"""
+        if self._materialized_version != self.version:
+            self._materialize()
+        return self._clusters
+
+    def cluster_of(self, agent_id: str) -> Optional[str]:
+        """Return the id of the cluster an agent belongs to, if any"""
+        if self._materialized_version != self.version:
+            self._materialize()
+        return self._agent_cluster.get(agent_id)
+
+    def same_cluster(self, agent_a: str, agent_b: str) -> bool:
+        """Check whether two agents are connected by positive relationships"""
+        return agent_a == agent_b or self.find(agent_a) == self.find(agent_b)
+
+
+class FactionCohesionIndex:
+    """Running per-faction sums of positive intra-faction relationship strengths
+
+    Single-edge mutations adjust the sums in place. Bulk updates such as decay
+    touch every edge, so they mark the index dirty and the sums are recomputed
+    once from the network on the next query.
+    """
+
+    def __init__(self):
+        self.agent_faction: Dict[str, str] = {}
+        self.totals: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+        self.dirty = True
+
+    def set_faction(self, agent_id: str, faction_id: Optional[str]):
+        """Assign an agent to a faction"""
+        if self.agent_faction.get(agent_id) == faction_id:
+            return
+        if faction_id is None:
+            self.agent_faction.pop(agent_id, None)
+        else:
+            self.agent_faction[agent_id] = faction_id
+        self.dirty = True
+
+    def set_factions(self, agent_factions: Dict[str, str]):
+        """Replace all faction assignments"""
+        if agent_factions != self.agent_faction:
+            self.agent_faction = dict(agent_factions)
+            self.dirty = True
+
+    def mark_dirty(self):
+        """Force a recompute on the next query"""
+        self.dirty = True
+
+    def same_faction(self, agent_a: str, agent_b: str) -> Optional[str]:
+        """Return the shared faction of two distinct agents, if any"""
+        if agent_a == agent_b:
+            return None
+        faction_id = self.agent_faction.get(agent_a)
+        if faction_id is None or faction_id != self.agent_faction.get(agent_b):
+            return None
+        return faction_id
+
+    def edge_changed(
+        self,
+        agent_a: str,
+        agent_b: str,
+        before: Optional[float],
+        after: Optional[float],
+    ):
+        """Apply the change in an edge's contribution (strength if positive)"""
+        if self.dirty:
+            return
+        faction_id = self.same_faction(agent_a, agent_b)
+        if faction_id is None:
+            return
+
+        if before is not None:
+            self.totals[faction_id] = self.totals.get(faction_id, 0.0) - before
+            self.counts[faction_id] = self.counts.get(faction_id, 0) - 1
+        if after is not None:
+            self.totals[faction_id] = self.totals.get(faction_id, 0.0) + after
+            self.counts[faction_id] = self.counts.get(faction_id, 0) + 1
+
+    def rebuild(self, totals: Dict[str, float], counts: Dict[str, int]):
+        """Replace the running sums with freshly computed ones"""
+        self.totals = dict(totals)
+        self.counts = dict(counts)
+        self.dirty = False
+
+    def cohesion(self, faction_id: str) -> float:
+        """Average strength of positive intra-faction relationships"""
+        count = self.counts.get(faction_id, 0)
+        if count <= 0:
+            return 0.0
+        return self.totals[faction_id] / count
+
+
+class InfluenceEngine:
+    """Dirty tracking for per-agent influence scores and centrality state
+
+    An agent's heuristic influence depends only on its own relationships, so a
+    mutated edge invalidates just its two endpoints. The optional centrality
+    vector is global; it is recomputed when anything changed, warm-started
+    from the previous vector so that small per-turn changes converge quickly.
+    """
+
+    def __init__(self):
+        self.dirty: Set[str] = set()
+        self.all_dirty = True
+        self.version = 0  # Bumped on every invalidation
+
+        self.centrality: Dict[str, float] = {}
+        self.centrality_version = -1
+        self.last_iterations = 0
+
+    def invalidate(self, *agent_ids: str):
+        """Mark the influence of specific agents as stale"""
+        self.dirty.update(agent_ids)
+        self.version += 1
+
+    def invalidate_all(self):
+        """Mark every agent's influence as stale"""
+        self.all_dirty = True
+        self.dirty.clear()
+        self.version += 1
+
+    def take_stale(self, agent_ids: Iterable[str]) -> Tuple[bool, Set[str]]:
+        """Return (full_refresh, stale agents) and reset the dirty state"""
+        full_refresh = self.all_dirty
+        stale = set(agent_ids) if full_refresh else self.dirty
+        self.dirty = set()
+        self.all_dirty = False
+        return full_refresh, stale
+
+    def centrality_is_current(self) -> bool:
+        return self.centrality_version == self.version
+
+    def store_centrality(self, centrality: Dict[str, float], iterations: int):
+        self.centrality = centrality
+        self.centrality_version = self.version
+        self.last_iterations = iterations
+
+
+class NeighbourhoodIndex:
+    """Cached k-hop neighbourhoods keyed on a topology version
+
+    A neighbourhood depends only on which edges exist, not on their values,
+    so cached results stay valid until an edge is added. Adding an edge bumps
+    the version and every cached neighbourhood is dropped on the next query.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self.version = 0
+        self._cache: Dict[Tuple[str, int], List[Tuple[str, int]]] = {}
+        self._cache_version = 0
+
+    def topology_changed(self):
+        """Record that an edge was added or removed"""
+        self.version += 1
+
+    def neighbourhood(
+        self,
+        agent_id: str,
+        radius: int,
+        neighbours: Callable[[str], Iterable[str]],
+    ) -> List[Tuple[str, int]]:
+        """Return (agent_id, distance) for agents within radius, in BFS order
+
+        The source agent itself is not included. ``neighbours`` returns the
+        direct neighbours of an agent and is only called on a cache miss.
+        """
+        if self._cache_version != self.version:
+            self._cache = {}
+            self._cache_version = self.version
+
+        key = (agent_id, radius)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        visited = {agent_id}
+        queue = deque([(agent_id, 0)])
+        result = []
+        while queue:
+            current_id, distance = queue.popleft()
+            if distance >= radius:
+                continue
+            for neighbour_id in neighbours(current_id):
+                if neighbour_id not in visited:
+                    visited.add(neighbour_id)
+                    result.append((neighbour_id, distance + 1))
+                    queue.append((neighbour_id, distance + 1))
+
+        if len(self._cache) >= self.max_entries:
+            self._cache = {}
+        self._cache[key] = result
+        return result
@@ -0,0 +1,390 @@
+"""
+Mission Success Estimation for Years of Lead
+
+Three places compute mission odds from a team: MissionPlan (Character
+participants), MissionExecutionEngine (dict agents, skills and emotions) and
+EnhancedMissionExecutor (dict agents, emotional state). Each formula is a
+function of per-agent terms summed over the team plus the team size, so a
+SuccessModel splits it in two:
+
+    agent_features(agent)   -> tuple of per-agent terms
+    probability(sums, size) -> odds for a team whose features sum to ``sums``
+
+SuccessEstimator memoizes the feature tuples per agent for as long as it
+lives, so trying another team composition costs one vector addition per
+member instead of a full recomputation. Agents are assumed not to change
+while an estimator is in use; callers make a new one per decision.
+best_team() searches teams of a
+fixed size with branch-and-bound pruning; it relies on every model being
+non-decreasing in each feature component at a fixed team size.
+"""
+
+import heapq
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from .mission_execution_engine import (
+    DEFAULT_MISSION_SKILLS,
+    MISSION_SKILLS,
+    MISSION_TYPE_MODIFIERS,
+)
+
+Features = Tuple[float, ...]
+
+EMOTIONAL_DIFFICULTY_MODIFIERS = {
+    "easy": 0.2,
+    "medium": 0.0,
+    "hard": -0.2,
+    "extreme": -0.4,
+}
+
+# EnhancedMissionExecutor._get_relevant_skill
+RELEVANT_SKILLS = {
+    "propaganda": "social",
+    "intelligence": "stealth",
+    "sabotage": "technical",
+    "recruitment": "social",
+    "assassination": "combat",
+    "rescue": "combat",
+}
+
+
+def _clamp(value: float, low: float, high: float) -> float:
+    return max(low, min(high, value))
+
+
+def _skill_level(value: Any) -> float:
+    """Skill level from either a float or a {"level": ...} dict"""
+    if isinstance(value, dict):
+        return value.get("level", 0.0)
+    return float(value)
+
+
+def agent_key(agent: Any) -> Optional[Hashable]:
+    """Stable identity of an agent dict or object, None if it has no id"""
+    if isinstance(agent, dict):
+        return agent.get("id")
+    return getattr(agent, "id", None)
+
+
+class SuccessModel:
+    """A team success formula split into per-agent features and a team step
+
+    ``feature_key`` identifies which agent features the model uses, so models
+    that only differ in team-level inputs (location, planning) share cached
+    features.
+    """
+
+    feature_key: Hashable = None
+    width = 0
+    ceiling = 0.95
+
+    def agent_features(self, agent: Any) -> Features:
+        raise NotImplementedError
+
+    def probability(self, sums: Sequence[float], size: int) -> float:
+        raise NotImplementedError
+
+    def evaluate(self, agents: Sequence[Any]) -> float:
+        """Uncached odds for ``agents``"""
+        sums = [0.0] * self.width
+        for agent in agents:
+            for i, value in enumerate(self.agent_features(agent)):
+                sums[i] += value
+        return self.probability(sums, len(agents))
+
+
+class PlanSuccessModel(SuccessModel):
+    """MissionPlan.calculate_success_probability
+
+    Features are the participants' levels in each skill the mission type
+    requires; the plan's difficulty, location risk and planning details are
+    team-level inputs read once.
+    """
+
+    def __init__(self, plan):
+        self.required_skills: Dict[str, int] = plan._get_required_skills()
+        self.feature_key = ("plan", tuple(self.required_skills))
+        self.width = len(self.required_skills)
+
+        self.difficulty_modifier = (10 - plan.objective.difficulty) * 0.05
+        location_risks = plan.location.get_risk_assessment()
+        self.risk_penalty = (location_risks["overall_risk"] - 5) * 0.05
+
+        planning_bonus = 0
+        if plan.approach_method:
+            planning_bonus += 0.1
+        if plan.escape_plan:
+            planning_bonus += 0.1
+        if len(plan.contingency_plans) > 0:
+            planning_bonus += min(0.2, len(plan.contingency_plans) * 0.05)
+        self.planning_bonus = planning_bonus
+
+    def agent_features(self, agent: Any) -> Features:
+        return tuple(getattr(agent.skills, skill, 1) for skill in self.required_skills)
+
+    def probability(self, sums: Sequence[float], size: int) -> float:
+        probability = 0.5
+        probability += self.difficulty_modifier
+
+        skill_bonus = 0
+        for required_level, team_skill in zip(self.required_skills.values(), sums):
+            if team_skill >= required_level:
+                skill_bonus += 0.1
+            elif team_skill >= required_level * 0.7:
+                skill_bonus += 0.05
+
+        probability += skill_bonus
+        probability -= self.risk_penalty
+        probability += self.planning_bonus
+        return _clamp(probability, 0.1, 0.95)
+
+
+class ExecutionSuccessModel(SuccessModel):
+    """MissionExecutionEngine._calculate_base_success followed by
+    _apply_execution_modifiers
+
+    Features are (competency, emotional modifier, well-equipped flag).
+    """
+
+    width = 3
+
+    def __init__(self, mission: Dict[str, Any], location: Dict[str, Any]):
+        # Per-agent terms default the type; team-size terms do not
+        self.agent_mission_type = mission.get("type", "propaganda")
+        self.mission_type = mission.get("type")
+        self.feature_key = ("execution", self.agent_mission_type)
+        self.relevant_skills = MISSION_SKILLS.get(
+            self.agent_mission_type, DEFAULT_MISSION_SKILLS
+        )
+
+        security_level = location.get("security_level", 5)
+        surveillance_level = location.get("surveillance_level", 5)
+        self.location_difficulty = _clamp(
+            (security_level + surveillance_level) / 20.0, 0.0, 1.0
+        )
+        self.complexity_modifier = 1.0 - abs(mission.get("complexity", 5) - 5) / 5.0
+        self.type_modifier = MISSION_TYPE_MODIFIERS.get(self.agent_mission_type, 0.0)
+
+        self.security_modifier = 0.0
+        if security_level > 7:
+            self.security_modifier = -0.2
+        elif security_level < 3:
+            self.security_modifier = 0.1
+
+    def agent_features(self, agent: Dict[str, Any]) -> Features:
+        skills = agent.get("skills", {})
+        competency = 0
+        for skill in self.relevant_skills:
+            competency += _skill_level(skills.get(skill, 0.0)) / 5.0
+        competency /= len(self.relevant_skills)
+
+        emotional_state = agent.get("emotional_state", {})
+        modifier = -emotional_state.get("trauma_level", 0.0) * 0.15
+        if self.agent_mission_type in ["assassination", "sabotage"]:
+            modifier -= max(0, emotional_state.get("fear", 0)) * 0.1
+            modifier += max(0, emotional_state.get("anger", 0)) * 0.05
+        elif self.agent_mission_type in ["recruitment", "propaganda"]:
+            modifier += max(0, emotional_state.get("trust", 0)) * 0.08
+            modifier += max(0, emotional_state.get("joy", 0)) * 0.06
+
+        equipped = 1.0 if agent.get("equipment", {}).get("quality", 0) > 5 else 0.0
+        return (competency, modifier, equipped)
+
+    def probability(self, sums: Sequence[float], size: int) -> float:
+        competency = sums[0] / size if size else 0.1
+        base_success = (
+            (competency * 0.6)
+            + ((1.0 - self.location_difficulty) * 0.3)
+            + (self.complexity_modifier * 0.1)
+            + self.type_modifier
+        )
+        modified_success = _clamp(base_success, 0.05, 0.95) + sums[1]
+
+        if self.mission_type == "intelligence":
+            modified_success += 0.1 if size <= 2 else -0.05
+        elif self.mission_type == "sabotage":
+            if size <= 2:
+                modified_success += 0.08
+            modified_success += min(sums[2] * 0.05, 0.15)
+        elif self.mission_type == "rescue":
+            modified_success += 0.15 if size >= 3 else -0.2
+
+        modified_success += self.security_modifier
+        return _clamp(modified_success, 0.05, 0.95)
+
+
+class EmotionalSuccessModel(SuccessModel):
+    """EnhancedMissionExecutor._calculate_emotional_success_probability
+
+    Features are (skill bonus, emotional modifier); both are averaged over
+    the team.
+    """
+
+    width = 2
+
+    def __init__(self, mission: Dict[str, Any]):
+        self.mission_type = mission.get("type", "propaganda")
+        self.feature_key = ("emotional", self.mission_type)
+        self.relevant_skill = RELEVANT_SKILLS.get(self.mission_type, "social")
+        self.base_success = 0.6 + EMOTIONAL_DIFFICULTY_MODIFIERS.get(
+            mission.get("difficulty", "medium"), 0.0
+        )
+
+    def agent_features(self, agent: Dict[str, Any]) -> Features:
+        skill_bonus = 0.0
+        relevant_skill = agent.get("skills", {}).get(self.relevant_skill)
+        if relevant_skill:
+            skill_level = (
+                relevant_skill.get("level", 1)
+                if isinstance(relevant_skill, dict)
+                else 1
+            )
+            skill_bonus = (skill_level - 2) * 0.05
+
+        modifier = 0.0
+        emotional_state = agent.get("emotional_state", {})
+        if emotional_state:
+            if self.mission_type in ["assassination", "sabotage", "rescue"]:
+                fear_penalty = emotional_state.get("fear", 0.0) * 0.15
+                anger_bonus = max(0, emotional_state.get("anger", 0.0)) * 0.08
+                modifier += anger_bonus - fear_penalty
+            elif self.mission_type in ["recruitment", "propaganda", "intelligence"]:
+                trust_bonus = max(0, emotional_state.get("trust", 0.0)) * 0.12
+                joy_bonus = max(0, emotional_state.get("joy", 0.0)) * 0.08
+                sadness_penalty = emotional_state.get("sadness", 0.0) * 0.1
+                modifier += trust_bonus + joy_bonus - sadness_penalty
+            modifier -= emotional_state.get("trauma_level", 0.0) * 0.2
+
+        return (skill_bonus, modifier)
+
+    def probability(self, sums: Sequence[float], size: int) -> float:
+        base_success = self.base_success
+        base_success += sums[0] / size if size else 0
+        return _clamp(base_success + sums[1] / (size or 1), 0.05, 0.95)
+
+
+class TeamEvaluation:
+    """Running feature sums for a team that is edited one member at a time"""
+
+    def __init__(self, estimator: "SuccessEstimator", model: SuccessModel):
+        self.estimator = estimator
+        self.model = model
+        self.members: List[Any] = []
+        self.sums: List[float] = [0.0] * model.width
+
+    def add(self, agent: Any) -> float:
+        """Add ``agent`` and return the team's new odds"""
+        for i, value in enumerate(self.estimator.features(self.model, agent)):
+            self.sums[i] += value
+        self.members.append(agent)
+        return self.probability()
+
+    def remove(self, agent: Any) -> float:
+        """Remove ``agent`` and return the team's new odds"""
+        self.members.remove(agent)
+        for i, value in enumerate(self.estimator.features(self.model, agent)):
+            self.sums[i] -= value
+        return self.probability()
+
+    def probability(self) -> float:
+        return self.model.probability(self.sums, len(self.members))
+
+
+class SuccessEstimator:
+    """Caching front end for the success models
+
+    Feature tuples are cached per (model feature key, agent id) for the
+    estimator's lifetime; agents without an id are never cached. The cache
+    is not told about changes to agents, so use a fresh estimator for each
+    team decision rather than keeping one around.
+    """
+
+    def __init__(self):
+        self._features: Dict[Tuple[Hashable, Hashable], Features] = {}
+
+    def features(self, model: SuccessModel, agent: Any) -> Features:
+        """Cached ``model.agent_features(agent)``"""
+        key = agent_key(agent)
+        if key is None:
+            return model.agent_features(agent)
+
+        cache_key = (model.feature_key, key)
+        features = self._features.get(cache_key)
+        if features is None:
+            features = model.agent_features(agent)
+            self._features[cache_key] = features
+        return features
+
+    def evaluate(self, model: SuccessModel, agents: Sequence[Any]) -> float:
+        """Odds for ``agents`` using cached features"""
+        sums = [0.0] * model.width
+        for agent in agents:
+            for i, value in enumerate(self.features(model, agent)):
+                sums[i] += value
+        return model.probability(sums, len(agents))
+
+    def team(self, model: SuccessModel, agents: Sequence[Any] = ()) -> TeamEvaluation:
+        """Start an incremental evaluation, optionally seeded with ``agents``"""
+        evaluation = TeamEvaluation(self, model)
+        for agent in agents:
+            evaluation.add(agent)
+        return evaluation
+
+    def best_team(
+        self, model: SuccessModel, candidates: Sequence[Any], size: int
+    ) -> Tuple[float, List[Any]]:
+        """Highest-odds team of ``size`` drawn from ``candidates``
+
+        Depth-first branch and bound: a partial team is abandoned when even
+        the best remaining value of every feature, taken independently,
+        cannot beat the best complete team found so far. Ties keep the team
+        found first. Returns (probability, team); asking for more members
+        than there are candidates uses all of them.
+        """
+        if size < 0:
+            raise ValueError(f"Team size must be non-negative: {size}")
+        size = min(size, len(candidates))
+
+        features = [self.features(model, agent) for agent in candidates]
+        # Strongest candidates first so good teams are found early
+        order = sorted(
+            range(len(candidates)),
+            key=lambda i: (-model.probability(features[i], size), -sum(features[i])),
+        )
+        ordered = [features[i] for i in order]
+
+        best_probability = -1.0
+        best_members: List[int] = []
+        chosen: List[int] = []
+
+        def optimistic(sums: Tuple[float, ...], start: int, slots: int) -> float:
+            bound = [
+                total + sum(heapq.nlargest(slots, (f[i] for f in ordered[start:])))
+                for i, total in enumerate(sums)
+            ]
+            return model.probability(bound, size)
+
+        def search(start: int, sums: Tuple[float, ...]):
+            nonlocal best_probability, best_members
+            slots = size - len(chosen)
+            if slots == 0:
+                probability = model.probability(sums, size)
+                if probability > best_probability:
+                    best_probability = probability
+                    best_members = list(chosen)
+                return
+            if optimistic(sums, start, slots) <= best_probability:
+                return
+
+            for position in range(start, len(ordered) - slots + 1):
+                chosen.append(position)
+                search(
+                    position + 1,
+                    tuple(a + b for a, b in zip(sums, ordered[position])),
+                )
+                chosen.pop()
+                if best_probability >= model.ceiling:
+                    return
+
+        search(0, (0.0,) * model.width)
+        return best_probability, [candidates[order[p]] for p in best_members]
@@ -0,0 +1,191 @@
+"""
+Bounded Turn History for Years of Lead
+
+EnhancedSimulationIntegration used to keep every SimulationTurn, with all of
+its subsystem result dicts, in a list for the whole run. TurnHistory keeps
+the most recent ``capacity`` turns in memory and streams older ones to a
+JSON Lines log, one turn per line. Indexing, slicing and iteration cover
+both transparently, oldest turn first.
+
+Spilled turns are stored in a JSON-compatible form: dataclasses become
+dicts, enums their values, datetimes ISO strings and any other object its
+str(). Reading one back yields a SimulationTurn built from those values.
+"""
+
+import dataclasses
+import json
+import tempfile
+from array import array
+from collections import deque
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Iterator, Optional
+
+TURN_FIELDS = (
+    "autonomy_results",
+    "mission_results",
+    "intelligence_results",
+    "narrative_results",
+    "trauma_results",
+    "integration_events",
+    "system_synergies",
+)
+
+
+def to_jsonable(value: Any) -> Any:
+    """Reduce ``value`` to JSON-compatible types"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Enum):
+        return to_jsonable(value.value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [to_jsonable(v) for v in value]
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            f.name: to_jsonable(getattr(value, f.name))
+            for f in dataclasses.fields(value)
+        }
+    return str(value)
+
+
+class TurnHistory:
+    """Ring buffer of recent turns backed by an append-only JSON Lines log
+
+    With no ``spill_path`` older turns go to an anonymous temporary file, so
+    the history stays complete either way; a named path is overwritten when
+    the first turn is spilled. ``on_spill(turn)`` may return extra fields to
+    store alongside a turn as it leaves memory.
+    """
+
+    def __init__(
+        self,
+        turn_type: type,
+        capacity: int = 100,
+        spill_path: Optional[str] = None,
+        on_spill: Optional[Callable[[Any], Dict[str, Any]]] = None,
+    ):
+        if capacity < 1:
+            raise ValueError(f"Turn history capacity must be positive: {capacity}")
+        self.turn_type = turn_type
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.on_spill = on_spill
+        self._recent: deque = deque()
+        self._offsets = array("q")
+        self._turn_numbers = array("q")
+        self._file = None
+
+    def __len__(self) -> int:
+        return len(self._offsets) + len(self._recent)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self._offsets)):
+            yield self._read_turn(i)
+        yield from list(self._recent)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("turn history index out of range")
+        spilled = len(self._offsets)
+        if index >= spilled:
+            return self._recent[index - spilled]
+        return self._read_turn(index)
+
+    @property
+    def spilled_count(self) -> int:
+        return len(self._offsets)
+
+    def append(self, turn: Any):
+        self._recent.append(turn)
+        if len(self._recent) > self.capacity:
+            self._spill(self._recent.popleft())
+
+    def find(self, turn_number: int) -> Optional[Any]:
+        """Most recent turn with ``turn_number``, or None"""
+        for turn in reversed(self._recent):
+            if turn.turn_number == turn_number:
+                return turn
+        record = self.find_record(turn_number)
+        return self._turn_from_record(record) if record is not None else None
+
+    def find_record(self, turn_number: int) -> Optional[Dict[str, Any]]:
+        """Stored record of the most recent spilled turn with ``turn_number``"""
+        for i in range(len(self._turn_numbers) - 1, -1, -1):
+            if self._turn_numbers[i] == turn_number:
+                return self._read_record(i)
+        return None
+
+    def turns(
+        self, start: Optional[int] = None, end: Optional[int] = None
+    ) -> Iterator[Any]:
+        """Turns whose turn_number is in [start, end], oldest first"""
+        for i, turn_number in enumerate(self._turn_numbers):
+            if (start is None or turn_number >= start) and (
+                end is None or turn_number <= end
+            ):
+                yield self._read_turn(i)
+        for turn in list(self._recent):
+            if (start is None or turn.turn_number >= start) and (
+                end is None or turn.turn_number <= end
+            ):
+                yield turn
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Raw stored records of every spilled turn, oldest first"""
+        for i in range(len(self._offsets)):
+            yield self._read_record(i)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _spill(self, turn: Any):
+        record = {
+            "turn_number": turn.turn_number,
+            "timestamp": to_jsonable(turn.timestamp),
+        }
+        for name in TURN_FIELDS:
+            record[name] = to_jsonable(getattr(turn, name))
+        if self.on_spill:
+            record.update(to_jsonable(self.on_spill(turn)))
+
+        if self._file is None:
+            if self.spill_path:
+                self._file = open(self.spill_path, "w+b")
+            else:
+                self._file = tempfile.TemporaryFile(mode="w+b")
+        self._file.seek(0, 2)
+        self._offsets.append(self._file.tell())
+        self._turn_numbers.append(int(turn.turn_number))
+        self._file.write(
+            json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+        )
+
+    def _read_record(self, i: int) -> Dict[str, Any]:
+        self._file.seek(self._offsets[i])
+        return json.loads(self._file.readline().decode("utf-8"))
+
+    def _read_turn(self, i: int) -> Any:
+        return self._turn_from_record(self._read_record(i))
+
+    def _turn_from_record(self, record: Dict[str, Any]) -> Any:
+        timestamp = record.get("timestamp")
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+        return self.turn_type(
+            turn_number=record["turn_number"],
+            timestamp=timestamp,
+            **{name: record[name] for name in TURN_FIELDS},
+        )
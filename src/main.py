@@ -256,9 +256,11 @@ class GameCLI:
             # Get current turn for autosave naming
             turn = getattr(self.game_state, "current_turn", 1)
 
-            # Create autosave using SaveManager
-            save_manager = SaveManager()
-            filename = save_manager.autosave(self.game_state)
+            # Create autosave using SaveManager; the file is written on a
+            # background thread so the turn does not wait for disk I/O
+            if getattr(self, "_autosave_manager", None) is None:
+                self._autosave_manager = SaveManager(async_autosave=True)
+            filename = self._autosave_manager.autosave(self.game_state)
 
             print(f"💾 Autosave created: {filename}")
 
@@ -1524,10 +1526,11 @@ Use numbers for selections, letters for actions.
                 return
 
             # Load metadata for each save to display
+            all_metadata = save_manager.get_all_save_metadata(saves)
             save_details = []
             for save_name in saves:
                 try:
-                    metadata = save_manager.get_save_metadata(save_name)
+                    metadata = all_metadata.get(save_name)
 
                     # If no metadata, create basic info
                     if not metadata:
@@ -1597,10 +1600,11 @@ Use numbers for selections, letters for actions.
                 return
 
             # Load metadata for each save to display
+            all_metadata = save_manager.get_all_save_metadata(saves)
             save_details = []
             for save_name in saves:
                 try:
-                    metadata = save_manager.get_save_metadata(save_name)
+                    metadata = all_metadata.get(save_name)
 
                     # If no metadata, create basic info
                     if not metadata:
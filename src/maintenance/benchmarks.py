@@ -0,0 +1,350 @@
+"""
+Benchmark suite for maintenance mode.
+
+This is the game's stopwatch. Each benchmark times one thing the player
+waits on: starting a game, playing a 100-turn campaign with a crowd of
+agents, saving and loading, crunching the social network, and writing
+narrative. Results are compared against stored baselines, so maintenance
+mode can tell when a change made the game slower.
+
+Benchmarks are split in two tiers. The quick tier runs inside every
+maintenance cycle; the full tier adds the 1000 and 10000 agent campaigns
+and the 1000 agent social network benchmark, and is meant to be run by hand:
+
+    python -m src.maintenance.benchmarks                  # quick tier
+    python -m src.maintenance.benchmarks --full           # everything
+    python -m src.maintenance.benchmarks --save-baseline  # record baselines
+"""
+
+import argparse
+import json
+import logging
+import random
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+CAMPAIGN_TURNS = 100
+CAMPAIGN_AGENT_COUNTS = (10, 100, 1000, 10000)
+SOCIAL_NETWORK_AGENTS = 1000
+QUICK_AGENT_LIMIT = 100  # Larger games only run in the full tier
+
+# A benchmark regresses when its median is this much slower than baseline
+DEFAULT_REGRESSION_THRESHOLD = 0.25
+
+
+@dataclass
+class Benchmark:
+    """A timed operation with an untimed setup step"""
+
+    name: str
+    func: Callable[[Any], Any]  # Receives whatever setup returned
+    setup: Optional[Callable[[], Any]] = None
+    repeat: int = 3
+    quick: bool = True  # Part of the quick tier
+
+
+class BenchmarkSuite:
+    """Runs benchmarks and reports timing statistics"""
+
+    def __init__(self, benchmarks: Optional[List[Benchmark]] = None):
+        self.benchmarks: Dict[str, Benchmark] = {}
+        for benchmark in benchmarks or []:
+            self.add(benchmark)
+
+    def add(self, benchmark: Benchmark):
+        self.benchmarks[benchmark.name] = benchmark
+
+    def run(
+        self, names: Optional[List[str]] = None, full: bool = False
+    ) -> Dict[str, Dict[str, float]]:
+        """Run the selected benchmarks
+
+        Without ``names`` the quick tier runs, or every benchmark with
+        ``full``. Returns median, min and max seconds per benchmark.
+        """
+        results = {}
+        for name, benchmark in self.benchmarks.items():
+            if names is not None:
+                if name not in names:
+                    continue
+            elif not (full or benchmark.quick):
+                continue
+            results[name] = self._run_one(benchmark)
+        return results
+
+    def _run_one(self, benchmark: Benchmark) -> Dict[str, float]:
+        from src.game.rng import get_rng_service, set_rng_service
+
+        times = []
+        for _ in range(max(1, benchmark.repeat)):
+            # Benchmark games install their own random streams; whatever was
+            # active before (a live game's streams, say) is put back
+            active_service = get_rng_service()
+            try:
+                context = benchmark.setup() if benchmark.setup else None
+                start = time.perf_counter()
+                benchmark.func(context)
+                times.append(time.perf_counter() - start)
+            finally:
+                set_rng_service(active_service)
+        return {
+            "median": statistics.median(times),
+            "min": min(times),
+            "max": max(times),
+            "repeat": len(times),
+        }
+
+
+def build_game(agent_count: int, seed: int = 0, links_per_agent: int = 3):
+    """Initialized game padded out to ``agent_count`` agents
+
+    Extra agents are spread over the default factions and locations and
+    each gets a few random relationships, so turns do realistic work.
+    """
+    from src.game.core import GameState
+    from src.game.entities import Agent
+    from src.game.relationships import BondType, Relationship
+
+    game = GameState(seed=seed)
+    game.initialize_game()
+
+    factions = list(game.factions)
+    locations = list(game.locations)
+    for i in range(agent_count - len(game.agents)):
+        agent_id = f"bench_agent_{i}"
+        game.agents[agent_id] = Agent(
+            id=agent_id,
+            name=f"Operative {i}",
+            faction_id=factions[i % len(factions)],
+            location_id=locations[i % len(locations)],
+        )
+
+    rng = random.Random(seed)
+    agent_ids = list(game.agents)
+    for agent_id in agent_ids:
+        for other_id in rng.sample(agent_ids, min(links_per_agent, len(agent_ids))):
+            if other_id == agent_id:
+                continue
+            game.social_network.add_relationship(
+                agent_id,
+                other_id,
+                Relationship(
+                    agent_id=other_id,
+                    bond_type=BondType.ALLY,
+                    affinity=rng.randint(-20, 60),
+                    trust=rng.uniform(0.3, 0.9),
+                ),
+            )
+    return game
+
+
+def initialize_game(_=None):
+    """Fresh game with the default factions, locations and agents"""
+    from src.game.core import GameState
+
+    game = GameState(seed=0)
+    game.initialize_game()
+    return game
+
+
+def play_campaign(game, turns: int = CAMPAIGN_TURNS):
+    """Advance a game through headless turns"""
+    for _ in range(turns):
+        game.advance_turn(interactive=False)
+
+
+def _save_load_setup(save_format: str):
+    def setup():
+        from src.game.core import GameState
+        from src.game.save_manager import SaveManager
+
+        manager = SaveManager(save_format=save_format)
+        directory = tempfile.TemporaryDirectory()
+        manager.save_directory = directory.name
+        return manager, directory, build_game(100), GameState()
+
+    return setup
+
+
+def _save_load_round_trip(context):
+    manager, directory, game, loaded_game = context
+    try:
+        filename = manager.save_game(game, "benchmark")
+        if not manager.load_game(SimpleNamespace(game=loaded_game), filename):
+            raise RuntimeError(f"Benchmark save {filename} failed to load")
+    finally:
+        directory.cleanup()
+
+
+def _social_network_ops(game):
+    network = game.social_network
+    network.get_social_clusters()
+    network.get_influence_centrality()
+    for agent_id in list(game.agents)[:50]:
+        network.propagate_morale_effect(agent_id, 10)
+
+
+def _narrative_setup():
+    from src.game.narrative_engine import NarrativeEngine
+
+    game = build_game(100)
+    pairs = [
+        (game.agents[agent_id], game.agents[other_id])
+        for agent_id, relationships in game.social_network.relationships.items()
+        for other_id in relationships
+    ]
+    return NarrativeEngine(game), pairs[:500]
+
+
+def _narrative_generation(context):
+    engine, pairs = context
+    for agent_a, agent_b in pairs:
+        engine.apply_relationship_effects(agent_a, agent_b, {"type": "cooperation"})
+
+
+def default_suite() -> BenchmarkSuite:
+    """The standard benchmarks"""
+    suite = BenchmarkSuite()
+    suite.add(
+        Benchmark(
+            "game_initialization",
+            func=initialize_game,
+            repeat=5,
+        )
+    )
+    for agent_count in CAMPAIGN_AGENT_COUNTS:
+        suite.add(
+            Benchmark(
+                f"campaign_{agent_count}_agents",
+                func=play_campaign,
+                setup=lambda agent_count=agent_count: build_game(agent_count),
+                repeat=3 if agent_count <= QUICK_AGENT_LIMIT else 1,
+                quick=agent_count <= QUICK_AGENT_LIMIT,
+            )
+        )
+    for save_format in ("json", "binary"):
+        suite.add(
+            Benchmark(
+                f"save_load_{save_format}",
+                func=_save_load_round_trip,
+                setup=_save_load_setup(save_format),
+            )
+        )
+    suite.add(
+        Benchmark(
+            "social_network_ops",
+            func=_social_network_ops,
+            setup=lambda: build_game(SOCIAL_NETWORK_AGENTS),
+            quick=SOCIAL_NETWORK_AGENTS <= QUICK_AGENT_LIMIT,
+        )
+    )
+    suite.add(
+        Benchmark(
+            "narrative_generation",
+            func=_narrative_generation,
+            setup=_narrative_setup,
+        )
+    )
+    return suite
+
+
+def load_baselines(path: Path) -> Dict[str, Dict[str, float]]:
+    """Stored baseline results, or an empty dict if there are none"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path) as f:
+        return json.load(f).get("benchmarks", {})
+
+
+def save_baselines(path: Path, results: Dict[str, Dict[str, float]]):
+    """Store results as baselines, keeping baselines of benchmarks not run"""
+    path = Path(path)
+    baselines = load_baselines(path)
+    baselines.update(results)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(
+            {"recorded": time.strftime("%Y-%m-%dT%H:%M:%S"), "benchmarks": baselines},
+            f,
+            indent=2,
+        )
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, float]],
+    baselines: Dict[str, Dict[str, float]],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> Dict[str, float]:
+    """Benchmarks slower than baseline by more than ``threshold``
+
+    Returns a mapping of benchmark name to slowdown ratio (current median
+    over baseline median).
+    """
+    regressions = {}
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if not baseline or baseline["median"] <= 0:
+            continue
+        ratio = result["median"] / baseline["median"]
+        if ratio > 1 + threshold:
+            regressions[name] = ratio
+    return regressions
+
+
+def performance_score(
+    results: Dict[str, Dict[str, float]], baselines: Dict[str, Dict[str, float]]
+) -> float:
+    """Score from 0 to 1: 1 when every benchmark is at or under baseline"""
+    ratios = [
+        min(1.0, baselines[name]["median"] / result["median"])
+        for name, result in results.items()
+        if name in baselines and result["median"] > 0
+    ]
+    if not ratios:
+        return 1.0
+    return statistics.mean(ratios)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point; exits with 1 when something regressed"""
+    parser = argparse.ArgumentParser(description="Years of Lead benchmarks")
+    parser.add_argument("--full", action="store_true", help="Include large campaigns")
+    parser.add_argument("--only", nargs="+", help="Run only these benchmarks")
+    parser.add_argument(
+        "--baseline",
+        default="maintenance_logs/benchmark_baselines.json",
+        help="Baseline file to compare against",
+    )
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.INFO)
+    results = default_suite().run(args.only, full=args.full)
+    baselines = load_baselines(args.baseline)
+    regressions = find_regressions(results, baselines, args.threshold)
+
+    for name, result in results.items():
+        line = f"{name:28s} {result['median'] * 1000:10.1f} ms"
+        if name in baselines:
+            line += f"  (baseline {baselines[name]['median'] * 1000:.1f} ms)"
+        if name in regressions:
+            line += f"  REGRESSED x{regressions[name]:.2f}"
+        print(line)
+
+    if args.save_baseline:
+        save_baselines(args.baseline, results)
+        print(f"Baselines saved to {args.baseline}")
+        return 0
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -18,6 +18,8 @@ from dataclasses import dataclass
 from enum import Enum
 import shutil
 
+from . import benchmarks
+
 
 class ImprovementType(Enum):
     """Categories of improvements, ordered by priority"""
@@ -52,11 +54,17 @@ class MaintenanceMode:
         self.improvements_log = []
         self.baseline_metrics = {}
 
+        # Benchmark results of the last health check; regressions map
+        # benchmark name to slowdown over the stored baseline
+        self.last_benchmark_results = {}
+        self.benchmark_regressions = {}
+
         # Create necessary directories
         self.logs_dir = project_root / "maintenance_logs"
         self.backup_dir = self.logs_dir / "backups"
         self.logs_dir.mkdir(exist_ok=True)
         self.backup_dir.mkdir(exist_ok=True)
+        self.benchmark_baseline_path = self.logs_dir / "benchmark_baselines.json"
 
         # Load configuration
         self.config = self._load_config()
@@ -78,6 +86,7 @@ class MaintenanceMode:
                     "emotional_consistency": 0.8,
                     "performance_baseline": 1.0,
                 },
+                "benchmark_regression_threshold": benchmarks.DEFAULT_REGRESSION_THRESHOLD,
             }
 
     def run_maintenance_cycle(self, iterations: int = 1):
@@ -154,6 +163,7 @@ class MaintenanceMode:
             metrics["test_coverage"] = 0.0
 
         metrics["performance"] = self._run_performance_benchmark()
+        metrics["benchmark_regressions"] = sorted(self.benchmark_regressions)
         metrics["narrative_quality"] = self._assess_narrative_quality()
         metrics["emotional_consistency"] = self._assess_emotional_consistency()
 
@@ -472,23 +482,41 @@ class MaintenanceMode:
             >= self.baseline_metrics.get("narrative_quality", 0),
             new_metrics.get("emotional_consistency", 0)
             >= self.baseline_metrics.get("emotional_consistency", 0),
+            not new_metrics.get("benchmark_regressions"),
         ]
 
         return sum(health_checks) >= len(health_checks) * 0.75
 
     def _run_performance_benchmark(self) -> float:
-        """Run a quick performance benchmark"""
-        try:
-            start_time = time.time()
-            import sys
+        """Run the quick benchmark tier and compare it against baselines
 
-            sys.path.append(str(self.project_root / "src"))
+        The first run records baselines. Later runs score each benchmark by
+        baseline time over current time and remember which ones slowed down
+        by more than the configured threshold.
+        """
+        try:
+            # Benchmarks import the game as src.game
+            if str(self.project_root) not in sys.path:
+                sys.path.append(str(self.project_root))
+
+            results = benchmarks.default_suite().run()
+            baselines = benchmarks.load_baselines(self.benchmark_baseline_path)
+            if not baselines:
+                benchmarks.save_baselines(self.benchmark_baseline_path, results)
+                baselines = results
+
+            threshold = self.config.get(
+                "benchmark_regression_threshold",
+                benchmarks.DEFAULT_REGRESSION_THRESHOLD,
+            )
+            self.last_benchmark_results = results
+            self.benchmark_regressions = benchmarks.find_regressions(
+                results, baselines, threshold
+            )
+            for name, ratio in self.benchmark_regressions.items():
+                print(f"    Benchmark {name} regressed: {ratio:.2f}x baseline")
 
-            # game_state = GameState()  # Unused variable removed
-            end_time = time.time()
-            init_time = end_time - start_time
-            performance_score = max(0, min(1, (1.0 - init_time) / 0.9))
-            return performance_score
+            return benchmarks.performance_score(results, baselines)
         except Exception as e:
             print(f"    Performance benchmark failed: {e}")
             return 0.5
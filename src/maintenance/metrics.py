@@ -6,7 +6,6 @@ fitness tracker measures your heart rate and steps, this measures
 the game's narrative quality, performance, and emotional consistency.
 """
 
-import time
 import statistics
 from datetime import datetime
 from typing import Dict
@@ -22,6 +21,7 @@ class GameHealthMetrics:
         self.performance_samples = []
         self.narrative_samples = []
         self.emotional_samples = []
+        self.last_performance_profile = {}
 
     def measure_narrative_coherence(self) -> float:
         """
@@ -122,25 +122,15 @@ class GameHealthMetrics:
         """
         Measures game performance metrics.
 
+        Uses the turn profiler's timings when the game has one: recently
+        profiled turns if there are any, otherwise one headless turn of a
+        stand-in benchmark game. The per-phase breakdown is kept in
+        last_performance_profile.
+
         Returns a score from 0 (very slow) to 1 (optimal performance).
         """
         try:
-            # Measure initialization time
-            start_time = time.time()
-
-            if self.game:
-                # Try to perform a typical game operation
-                test_operation_start = time.time()
-                # Simulate a game step or update
-                if hasattr(self.game, "step"):
-                    self.game.step()
-                elif hasattr(self.game, "update"):
-                    self.game.update()
-                time.time() - test_operation_start
-            else:
-                pass  # Simulate fast operation
-
-            total_time = time.time() - start_time
+            total_time = self._measure_turn_time()
 
             # Normalize performance score
             # Under 0.05s = 1.0, over 0.5s = 0.0
@@ -158,6 +148,45 @@ class GameHealthMetrics:
             print(f"Error measuring performance: {e}")
             return 0.5
 
+    def _measure_turn_time(self) -> float:
+        """Wall time of one game turn in seconds
+
+        Reads the game's profiled turns when there are any. Otherwise one
+        turn of a separate benchmark game of the same size is timed, so
+        collecting metrics never advances the player's campaign.
+        """
+        if not self.game:
+            return 0.0
+
+        profiler = getattr(self.game, "profiler", None)
+        turn_times = []
+        if profiler is not None and hasattr(profiler, "recent_turn_times"):
+            turn_times = profiler.recent_turn_times()
+        if not turn_times:
+            profiler = self._profile_benchmark_turn()
+            turn_times = profiler.recent_turn_times()
+
+        self.last_performance_profile = profiler.summary()
+        if not turn_times:
+            return 0.0
+        return statistics.mean(turn_times)
+
+    def _profile_benchmark_turn(self):
+        """Profiler of one headless turn played by a stand-in game"""
+        from src.game.rng import get_rng_service, set_rng_service
+        from src.maintenance.benchmarks import build_game
+
+        # Building a seeded game installs its random streams; the live
+        # game's are put back afterwards
+        active_service = get_rng_service()
+        try:
+            game = build_game(len(getattr(self.game, "agents", None) or {}))
+            game.profiler.enable()
+            game.advance_turn(interactive=False)
+        finally:
+            set_rng_service(active_service)
+        return game.profiler
+
     def get_performance_trend(self) -> str:
         """Get performance trend over recent samples"""
         if len(self.performance_samples) < 3:
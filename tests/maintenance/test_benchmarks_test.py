@@ -0,0 +1,111 @@
+"""
+Tests for the maintenance benchmark suite and its regression checks.
+"""
+
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.game.rng import RNGService, get_rng_service, set_rng_service
+from src.maintenance import benchmarks
+from src.maintenance.maintenance_mode import MaintenanceMode
+
+
+def _fixed_suite(seconds):
+    """Suite whose single benchmark reports a fixed time"""
+    suite = benchmarks.BenchmarkSuite()
+    suite.add(benchmarks.Benchmark("fixed", func=lambda _: None, repeat=1))
+
+    def run(*args, **kwargs):
+        return {"fixed": {"median": seconds, "min": seconds, "max": seconds}}
+
+    suite.run = run
+    return suite
+
+
+class TestBenchmarkSuite:
+    """Test benchmark running, baselines and regression detection"""
+
+    def test_quick_tier_skips_large_benchmarks(self):
+        """Test that only quick benchmarks run unless asked for"""
+        calls = []
+        suite = benchmarks.BenchmarkSuite(
+            [
+                benchmarks.Benchmark("small", func=lambda _: calls.append("small")),
+                benchmarks.Benchmark(
+                    "large", func=lambda _: calls.append("large"), quick=False
+                ),
+            ]
+        )
+
+        results = suite.run()
+        assert set(results) == {"small"}
+        assert results["small"]["repeat"] == 3
+
+        assert set(suite.run(full=True)) == {"small", "large"}
+
+    def test_regressions_against_saved_baselines(self):
+        """Test that slowdowns past the threshold are reported"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "baselines.json"
+            benchmarks.save_baselines(
+                path, {"a": {"median": 1.0}, "b": {"median": 1.0}}
+            )
+            baselines = benchmarks.load_baselines(path)
+
+        results = {"a": {"median": 1.1}, "b": {"median": 2.0}, "c": {"median": 5.0}}
+        regressions = benchmarks.find_regressions(results, baselines, threshold=0.25)
+
+        assert regressions == {"b": 2.0}
+        assert benchmarks.performance_score(results, baselines) < 1.0
+
+    def test_campaign_benchmark_plays_turns(self):
+        """Test that the campaign helpers build and advance a padded game"""
+        active_service = get_rng_service()
+        game = benchmarks.build_game(20)
+        try:
+            assert len(game.agents) == 20
+            benchmarks.play_campaign(game, turns=2)
+            assert game.turn_number == 3
+        finally:
+            set_rng_service(active_service)
+
+    def test_benchmarks_keep_the_live_games_streams(self):
+        """Test that running benchmarks puts the active random streams back"""
+        live_service = RNGService(7)
+        set_rng_service(live_service)
+        try:
+            results = benchmarks.default_suite().run(["save_load_json"])
+            assert results["save_load_json"]["repeat"] == 3
+            assert get_rng_service() is live_service
+        finally:
+            set_rng_service(None)
+
+    def test_large_games_stay_out_of_the_quick_tier(self):
+        """Test that no quick benchmark builds more agents than the limit"""
+        suite = benchmarks.default_suite()
+        assert not suite.benchmarks["social_network_ops"].quick
+        assert not suite.benchmarks["campaign_1000_agents"].quick
+
+    def test_maintenance_health_check_flags_regressions(self):
+        """Test that the maintenance cycle records baselines, then regressions"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            maintenance = MaintenanceMode(Path(temp_dir))
+
+            with patch.object(benchmarks, "default_suite", lambda: _fixed_suite(1.0)):
+                assert maintenance._run_performance_benchmark() == 1.0
+            assert maintenance.benchmark_baseline_path.exists()
+
+            with patch.object(benchmarks, "default_suite", lambda: _fixed_suite(3.0)):
+                score = maintenance._run_performance_benchmark()
+            assert score < 0.5
+            assert "fixed" in maintenance.benchmark_regressions
+
+            maintenance.baseline_metrics = {"performance": 1.0}
+            assert not maintenance._is_system_healthier(
+                {"performance": score, "benchmark_regressions": ["fixed"]}
+            )
@@ -287,6 +287,90 @@ class TestEnhancedIntelligenceSystem(unittest.TestCase):
         except ImportError:
             self.skipTest("Enhanced intelligence system not available")
 
+    def test_streaming_pattern_deltas(self):
+        """Test that patterns appear as events arrive and expire with freshness"""
+        try:
+            from datetime import datetime, timedelta
+            from game.enhanced_intelligence_system import (
+                EnhancedIntelligenceSystem,
+                IntelligenceSource,
+                RealTimeIntelEvent,
+            )
+
+            intelligence_system = EnhancedIntelligenceSystem(self.game_state)
+            start = datetime(1975, 1, 1)
+            events = [
+                RealTimeIntelEvent(
+                    id=f"intel_{i}",
+                    timestamp=start + timedelta(hours=2 * i),
+                    source=IntelligenceSource.SURVEILLANCE,
+                    type="government_movement",
+                    location=f"location_{i}",
+                    priority="high",
+                    reliability=0.8,
+                    content="Convoy sighted",
+                    decay_rate=0.3,
+                )
+                for i in range(3)
+            ]
+            intelligence_system._generate_continuous_intelligence = lambda: events
+
+            results = intelligence_system.process_real_time_intelligence()
+            self.assertEqual(len(results["pattern_deltas"]["new"]), 1)
+            pattern = results["patterns_detected"][0]
+            self.assertEqual(pattern.pattern_type, "type_clustering")
+            self.assertEqual(intelligence_system.intelligence_patterns, [pattern])
+
+            # Nothing arrives; the events fade out of the analysis window
+            intelligence_system._generate_continuous_intelligence = lambda: []
+            results = intelligence_system.process_real_time_intelligence()
+            self.assertEqual(results["pattern_deltas"]["expired"], [pattern])
+            self.assertEqual(results["patterns_detected"], [])
+
+        except ImportError:
+            self.skipTest("Enhanced intelligence system not available")
+
+    def test_pattern_detection_threshold(self):
+        """Test that no patterns form until enough fresh events are in view"""
+        try:
+            from datetime import datetime
+            from game.enhanced_intelligence_system import (
+                EnhancedIntelligenceSystem,
+                IntelligenceSource,
+                RealTimeIntelEvent,
+            )
+
+            intelligence_system = EnhancedIntelligenceSystem(self.game_state)
+            intelligence_system.pattern_detection_threshold = 4
+            events = [
+                RealTimeIntelEvent(
+                    id=f"intel_{i}",
+                    timestamp=datetime(1975, 1, 1, i),
+                    source=IntelligenceSource.SURVEILLANCE,
+                    type="government_movement" if i < 3 else "police_activity",
+                    location=f"location_{i}",
+                    priority="high",
+                    reliability=0.8,
+                    content="Convoy sighted",
+                    decay_rate=0.0,
+                )
+                for i in range(4)
+            ]
+
+            # Three events of one type would cluster, but the window is short
+            intelligence_system._generate_continuous_intelligence = lambda: events[:3]
+            results = intelligence_system.process_real_time_intelligence()
+            self.assertEqual(results["patterns_detected"], [])
+
+            # A fourth, unrelated event lifts the window over the threshold
+            intelligence_system._generate_continuous_intelligence = lambda: events[3:]
+            results = intelligence_system.process_real_time_intelligence()
+            pattern_types = {p.pattern_type for p in results["patterns_detected"]}
+            self.assertIn("type_clustering", pattern_types)
+
+        except ImportError:
+            self.skipTest("Enhanced intelligence system not available")
+
 
 class TestEnhancedNarrativeSystem(unittest.TestCase):
     """Test Phase 4: Dynamic Narrative Generation"""
@@ -416,42 +500,49 @@ class TestEnhancedSimulationIntegration(unittest.TestCase):
 
     def setUp(self):
         """Set up test environment"""
-        self.game_state = Mock(spec=GameState)
-        self.game_state.agents = {}
-        self.game_state.locations = {"location_1": {"name": "Test Location"}}
-        self.game_state.factions = {"faction_1": {"name": "Test Faction"}}
-        self.game_state.turn_number = 1
+        self.game_state = self._make_game_state()
+        self.agent1 = self.game_state.agents["agent_1"]
 
-        # Create test agents
-        self.agent1 = Mock(spec=Agent)
-        self.agent1.id = "agent_1"
-        self.agent1.name = "Test Agent 1"
-        self.agent1.status = "active"
-        self.agent1.stress = 70
-        self.agent1.loyalty = 80
-        self.agent1.faction_id = "faction_1"
-        self.agent1.location_id = "location_1"
-
-        # Add emotional state
-        self.agent1.emotional_state = Mock(spec=EmotionalState)
-        patch_emotional_state(
-            self.agent1.emotional_state,
-            {"trauma_level": 0.5, "fear": 0.4, "anger": 0.2},
-        )
-        self.agent1.emotional_state.get_dominant_emotion.return_value = ("fear", 0.4)
-        self.agent1.emotional_state.is_psychologically_stable.return_value = True
+    def _make_game_state(self, agent_count=1):
+        """Fresh game state holding ``agent_count`` test agents"""
+        game_state = Mock(spec=GameState)
+        game_state.agents = {}
+        game_state.locations = {"location_1": {"name": "Test Location"}}
+        game_state.factions = {"faction_1": {"name": "Test Faction"}}
+        game_state.turn_number = 1
 
-        # Add skills
-        self.agent1.skills = {
-            "intelligence": Mock(level=3),
-            "social": Mock(level=2),
-            "combat": Mock(level=4),
-        }
+        # Create test agents
+        for i in range(1, agent_count + 1):
+            agent = Mock(spec=Agent)
+            agent.id = f"agent_{i}"
+            agent.name = f"Test Agent {i}"
+            agent.status = "active"
+            agent.stress = 70
+            agent.loyalty = 80
+            agent.faction_id = "faction_1"
+            agent.location_id = "location_1"
+
+            # Add emotional state
+            agent.emotional_state = Mock(spec=EmotionalState)
+            patch_emotional_state(
+                agent.emotional_state,
+                {"trauma_level": 0.5, "fear": 0.4, "anger": 0.2},
+            )
+            agent.emotional_state.get_dominant_emotion.return_value = ("fear", 0.4)
+            agent.emotional_state.is_psychologically_stable.return_value = True
+
+            # Add skills
+            agent.skills = {
+                "intelligence": Mock(level=3),
+                "social": Mock(level=2),
+                "combat": Mock(level=4),
+            }
 
-        # Add relationships
-        self.agent1.relationships = {}
+            # Add relationships
+            agent.relationships = {}
 
-        self.game_state.agents["agent_1"] = self.agent1
+            game_state.agents[agent.id] = agent
+        return game_state
 
     def test_integration_system_initialization(self):
         """Test integration system initialization"""
@@ -540,6 +631,94 @@ class TestEnhancedSimulationIntegration(unittest.TestCase):
         except ImportError:
             self.skipTest("Enhanced simulation integration system not available")
 
+    def test_bounded_turn_history(self):
+        """Test that old turns are spilled to disk and still queryable"""
+        try:
+            from game.enhanced_simulation_integration import (
+                EnhancedSimulationIntegration,
+            )
+
+            integration_system = EnhancedSimulationIntegration(
+                self.game_state, history_capacity=2
+            )
+            integration_system.run_enhanced_simulation(turns=5)
+            history = integration_system.turn_history
+
+            self.assertEqual(len(history), 5)
+            self.assertEqual(history.spilled_count, 3)
+            self.assertEqual([turn.turn_number for turn in history], [1, 2, 3, 4, 5])
+            self.assertEqual(len(integration_system.system_performance), 2)
+            self.assertEqual(len(integration_system.integration_metrics), 2)
+
+            # Spilled turns come back from the log with their metrics
+            first = integration_system.get_turn(1)
+            self.assertEqual(first.turn_number, 1)
+            self.assertIsInstance(first.trauma_results, dict)
+            metrics = integration_system.get_turn_metrics(1)
+            self.assertIn("complexity_score", metrics["integration_metrics"])
+            self.assertEqual(
+                [turn.turn_number for turn in integration_system.iter_turns(2, 4)],
+                [2, 3, 4],
+            )
+            self.assertEqual(
+                integration_system.get_integration_summary()["total_turns_processed"],
+                5,
+            )
+            history.close()
+
+        except ImportError:
+            self.skipTest("Enhanced simulation integration system not available")
+
+    def test_subsystem_stages(self):
+        """Test that every subsystem stage fills its result, reproducibly"""
+        try:
+            from game.enhanced_simulation_integration import (
+                SUBSYSTEM_STAGES,
+                EnhancedSimulationIntegration,
+            )
+            from game.rng import RNGService, set_rng_service
+
+            self.addCleanup(set_rng_service, None)
+            self.assertEqual(
+                [stage.name for stage in SUBSYSTEM_STAGES],
+                ["autonomy", "intelligence", "narrative", "trauma"],
+            )
+
+            def intelligence_summary(results):
+                # Event ids and timestamps are unique per run
+                return (
+                    [
+                        (event.source, event.type, event.location, event.content)
+                        for event in results["new_intelligence"]
+                    ],
+                    len(results["patterns_detected"]),
+                )
+
+            # Seeded runs on identical fresh game states produce the same
+            # results
+            results = []
+            for _ in range(2):
+                set_rng_service(RNGService(7))
+                integration_system = EnhancedSimulationIntegration(
+                    self._make_game_state(agent_count=6)
+                )
+                turn = integration_system.process_enhanced_turn()
+                integration_system.close()
+                for stage in SUBSYSTEM_STAGES:
+                    self.assertIn(stage.log_key, getattr(turn, stage.result_field))
+                results.append(
+                    (
+                        intelligence_summary(turn.intelligence_results),
+                        turn.narrative_results,
+                        turn.trauma_results,
+                    )
+                )
+            self.assertTrue(results[0][0][0])
+            self.assertEqual(results[0], results[1])
+
+        except ImportError:
+            self.skipTest("Enhanced simulation integration system not available")
+
 
 class TestSystemInteroperability(unittest.TestCase):
     """Test interoperability between enhanced systems"""
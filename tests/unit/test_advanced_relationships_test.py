@@ -449,6 +449,51 @@ class TestAdvancedRelationshipManager:
             agent_a.emotion_state["fear"] > 0.2
         )  # Should increase toward agent_b's 0.6
 
+    def test_propagate_emotions_is_order_independent(self, game_state):
+        """Test that emotion propagation is one synchronous step"""
+        import game.advanced_relationships as advanced
+
+        def propagate(order, use_numpy=True):
+            state = GameState()
+            for agent_id in order:
+                agent = game_state.agents[agent_id]
+                state.agents[agent_id] = Agent(
+                    id=agent_id,
+                    name=agent.name,
+                    faction_id=agent.faction_id,
+                    location_id=agent.location_id,
+                )
+            emotions = {
+                "agent_a": {"hope": 0.9, "fear": 0.1},
+                "agent_b": {"hope": 0.2, "fear": 0.7},
+                "agent_c": {"hope": 0.5, "fear": 0.4, "anger": 0.6},
+            }
+            for agent_id, emotion_state in emotions.items():
+                state.agents[agent_id].emotion_state = dict(emotion_state)
+            state.social_network.add_relationship(
+                "agent_a", "agent_b", Relationship(agent_id="agent_b", affinity=60)
+            )
+            state.social_network.add_relationship(
+                "agent_b", "agent_c", Relationship(agent_id="agent_c", affinity=-20)
+            )
+
+            with patch.object(advanced, "NUMPY_AVAILABLE", use_numpy):
+                AdvancedRelationshipManager(state).propagate_emotions()
+            return {
+                agent_id: agent.emotion_state
+                for agent_id, agent in state.agents.items()
+            }
+
+        forward = propagate(["agent_a", "agent_b", "agent_c"])
+        backward = propagate(["agent_c", "agent_b", "agent_a"])
+        assert forward == backward
+        assert forward["agent_c"]["anger"] == 0.6  # Nobody else feels anger
+
+        fallback = propagate(["agent_a", "agent_b", "agent_c"], use_numpy=False)
+        for agent_id, emotion_state in forward.items():
+            for emotion, value in emotion_state.items():
+                assert fallback[agent_id][emotion] == pytest.approx(value)
+
     def test_ideology_drift(self, manager, game_state):
         """Test ideological drift"""
         agent_a = game_state.agents["agent_a"]
@@ -21,6 +21,8 @@ from game.intelligence_system import (
 )
 from game.emotional_state import EmotionalState
 from game.factions import FactionManager
+from game.events import EventSystem, RenderPlan
+from game.random_events import EventGenerator
 
 
 # Character Creation Tests
@@ -343,6 +345,50 @@ def test_intelligence_event_validation():
         assert 0.0 <= event.reliability <= 1.0
 
 
+def test_intelligence_database_indexes():
+    """Test indexed queries and bulk loading of intelligence events"""
+    from datetime import datetime, timedelta
+    from game.intelligence_system import IntelligenceGenerator
+
+    generator = IntelligenceGenerator()
+    database = IntelligenceDatabase()
+
+    events = [
+        generator.generate_event(
+            event_type=IntelligenceType.SECURITY_CHANGES,
+            location="Test Location",
+            priority=IntelligencePriority.CRITICAL,
+        )
+        for _ in range(3)
+    ]
+    events[0].timestamp = datetime.now() - timedelta(hours=48)
+    assert database.add_events(events) == 3
+
+    assert len(database.get_events_by_type(IntelligenceType.SECURITY_CHANGES)) == 3
+    assert len(database.get_critical_events()) == 3
+    assert events[0] not in database.get_recent_events(24)
+    assert database.threat_assessments["overall"]["level"] == "EXTREME"
+    assert database.patterns[0]["event_count"] == 3
+
+    # Overwriting an event moves it between indexes
+    replacement = generator.generate_event(
+        event_type=IntelligenceType.ECONOMIC_DATA,
+        location="Test Location",
+        priority=IntelligencePriority.LOW,
+    )
+    replacement.id = events[1].id
+    database.add_event(replacement)
+    assert len(database.events) == 3
+    assert len(database.get_critical_events()) == 2
+    assert database.get_events_by_type(IntelligenceType.ECONOMIC_DATA) == [replacement]
+    assert len(database.get_recent_events(24)) == 2
+
+    # An invalid event in a bulk load leaves the database untouched
+    with pytest.raises(TypeError):
+        database.add_events([events[2], "not an event"])
+    assert len(database.events) == 3
+
+
 # Emotional State Tests
 def test_emotional_state_transitions():
     state = EmotionalState()
@@ -568,3 +614,72 @@ def test_error_recovery():
         secondary_trait=PersonalityTrait.PRAGMATIC,
     )
     assert character.name == "Recovery Test"
+
+
+def test_event_render_plans():
+    """Test compiled event templates and per-turn name pools"""
+    plan = RenderPlan.compile("{agent_name} meets {contact_name} in {city}.")
+    assert plan.fields == ("agent_name", "contact_name", "city")
+    assert plan.literals == ("", " meets ", " in ", ".")
+    assert RenderPlan.compile("Broken {template").fields is None
+
+    class _Location:
+        def __init__(self, name):
+            self.name = name
+            self.security_level = 1
+
+    class _State:
+        turn_number = 1
+        agents = {}
+        factions = {}
+        locations = {"a": _Location("Old Port")}
+
+    state = _State()
+    events = EventSystem(state)
+    assert all(
+        template["description"] in events.render_plans
+        for templates in events.event_templates.values()
+        for template in templates
+    )
+
+    text = events._substitute_variables(
+        "Meet at {location} near {unknown}, {city}.", {"city": "Milan"}
+    )
+    assert text == "Meet at Old Port near {unknown}, Milan."
+
+    # Pools are reused within a turn and rebuilt on the next one
+    state.locations["b"] = _Location("Rail Yard")
+    assert events._state_pool("locations", events._location_names) == ["Old Port"]
+    state.turn_number = 2
+    assert events._state_pool("locations", events._location_names) == [
+        "Old Port",
+        "Rail Yard",
+    ]
+
+
+def test_event_generator_condition_index():
+    """Test indexed event selection and heap-backed cooldowns"""
+    generator = EventGenerator()
+    game_state = {"weather": "clear", "season": "summer", "heat_level": 7}
+
+    index = generator._get_event_index()
+    matched = {event.id for _, event in index.iter_members(index.match(game_state))}
+    expected = {
+        event.id
+        for event in generator.events.values()
+        if generator._check_event_conditions(event, game_state)
+    }
+    assert matched == expected
+    assert "storm_approaching" in matched
+
+    storm = generator.events["storm_approaching"]
+    storm.cooldown = 2
+    generator.apply_event_outcome(storm, dict(game_state))
+    assert generator.event_cooldowns == {"storm_approaching": 2}
+
+    for _ in range(2):
+        for _ in range(20):
+            assert generator.generate_random_event(game_state) is not storm
+        generator.update_cooldowns()
+    assert generator.event_cooldowns == {}
+    assert any(generator.generate_random_event(game_state) is storm for _ in range(200))
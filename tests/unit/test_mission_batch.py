@@ -0,0 +1,119 @@
+"""
+Tests for batched mission resolution
+"""
+
+import os
+import random
+import sys
+import unittest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.game.core import GameState
+from src.game.equipment_enhanced import EnhancedEquipmentManager
+from src.game.equipment_integration import EquipmentIntegrationManager
+from src.game.mission_execution_engine import (
+    ExecutionOutcome,
+    MissionExecutionEngine,
+)
+from src.game.rng import RNGService, get_rng, use_rng_service
+
+
+def _orders(count, seed=0):
+    rng = random.Random(seed)
+    mission_types = ["propaganda", "sabotage", "intelligence", "rescue", "heist"]
+    orders = []
+    for i in range(count):
+        agents = [
+            {
+                "id": f"agent_{i}_{j}",
+                "name": f"Agent {j}",
+                "skills": {
+                    "stealth": rng.uniform(0, 5),
+                    "social": {"level": rng.uniform(0, 5)},
+                    "combat": rng.uniform(0, 5),
+                },
+                "emotional_state": {"trauma_level": rng.uniform(0, 0.5)},
+            }
+            for j in range(rng.randint(0, 3))
+        ]
+        orders.append(
+            {
+                "mission": {
+                    "type": rng.choice(mission_types),
+                    "complexity": rng.randint(1, 9),
+                },
+                "agents": agents,
+                "location": {"security_level": rng.randint(1, 10)},
+                "equipment_effects": {
+                    "success_modifier": rng.uniform(-0.1, 0.1),
+                    "concealment_rating": rng.random(),
+                    "emotional_effects": {"confidence": rng.uniform(-0.5, 0.5)},
+                },
+            }
+        )
+    return orders
+
+
+class TestMissionBatch(unittest.TestCase):
+    """Test that batched resolution matches the per-mission helpers"""
+
+    def setUp(self):
+        self.game_state = GameState()
+        self.engine = MissionExecutionEngine(
+            self.game_state, EquipmentIntegrationManager(EnhancedEquipmentManager())
+        )
+
+    def test_batch_matches_scalar_math(self):
+        """Test vectorized success, outcome and costs against the helpers"""
+        orders = _orders(200)
+        batch = self.engine.execute_missions_batch(
+            orders, hypothetical=True, rng=random.Random(5)
+        )
+        rolls_rng = random.Random(5)
+        rolls = [rolls_rng.random() for _ in orders]
+        probabilities, codes, columns = self.engine._resolve_batch_scalar(
+            orders, [order["equipment_effects"] for order in orders], rolls
+        )
+
+        self.assertEqual(len(batch), 200)
+        self.assertEqual(list(batch.outcome_codes), codes)
+        for i in range(len(orders)):
+            self.assertAlmostEqual(batch.success_probability[i], probabilities[i])
+            self.assertEqual(batch.money[i], columns["money"][i])
+            self.assertAlmostEqual(
+                batch.network_exposure[i], columns["network_exposure"][i]
+            )
+
+        # Hypothetical batches leave no trace and generate no narrative
+        self.assertEqual(self.engine.execution_history, [])
+        self.assertEqual(batch._narratives, {})
+
+    def test_hypothetical_batch_leaves_mission_stream_alone(self):
+        """Test that planning batches do not draw from the live missions stream"""
+        service = RNGService(3)
+        expected = RNGService(3).stream("missions").random()
+        with use_rng_service(service):
+            self.engine.execute_missions_batch(_orders(20), hypothetical=True)
+            self.assertEqual(get_rng("missions").random(), expected)
+
+    def test_resolved_batch_produces_mission_results(self):
+        """Test that a real batch yields execute_mission-style results"""
+        orders = _orders(5, seed=1)
+        for order in orders:
+            del order["equipment_effects"]
+
+        batch = self.engine.execute_missions_batch(orders)
+        self.assertEqual(len(self.engine.execution_history), 5)
+
+        result = batch.result(0)
+        self.assertIsInstance(result["outcome"], ExecutionOutcome)
+        self.assertEqual(result["consequences"], batch.consequences[0])
+        self.assertIn("network_exposure", result["network_effects"])
+        self.assertTrue(result["narrative"])
+        self.assertIs(batch.narrative(0), result["narrative"])
+
+
+if __name__ == "__main__":
+    unittest.main()
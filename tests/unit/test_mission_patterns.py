@@ -0,0 +1,171 @@
+"""
+Tests for the mission execution pattern log
+"""
+
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.game.core import GameState
+from src.game.equipment_enhanced import EnhancedEquipmentManager
+from src.game.equipment_integration import EquipmentIntegrationManager
+from src.game.mission_execution_engine import ExecutionOutcome, MissionExecutionEngine
+from src.game.mission_patterns import SUCCESSFUL_OUTCOMES, MissionPatternLog
+
+
+def _records(count, seed=0):
+    rng = random.Random(seed)
+    outcomes = [outcome.value for outcome in ExecutionOutcome]
+    return [
+        {
+            "mission_type": rng.choice(["propaganda", "sabotage", "rescue"]),
+            "outcome": rng.choice(outcomes),
+            "turn": i // 4,
+            "consequences_count": 1,
+            "severity_total": rng.randint(0, 9),
+            "location_id": rng.choice(["docks", "university", None]),
+            "agent_count": 2,
+        }
+        for i in range(count)
+    ]
+
+
+class TestMissionPatternLog(unittest.TestCase):
+    """Test running aggregates and spilling"""
+
+    def test_aggregates_match_full_scan(self):
+        """Test per-type aggregates against a rescan of every record"""
+        records = _records(300)
+        log = MissionPatternLog(recent_size=50)
+        for record in records:
+            log.append(record)
+
+        self.assertEqual(len(log), 300)
+        self.assertEqual(list(log.recent), records[-50:])
+        for mission_type in ["propaganda", "sabotage", "rescue"]:
+            rows = [r for r in records if r["mission_type"] == mission_type]
+            aggregate = log.aggregate(mission_type=mission_type)
+            counts = {}
+            for row in rows:
+                counts[row["outcome"]] = counts.get(row["outcome"], 0) + 1
+
+            self.assertEqual(aggregate.count, len(rows))
+            self.assertAlmostEqual(
+                aggregate.success_rate,
+                sum(r["outcome"] in SUCCESSFUL_OUTCOMES for r in rows) / len(rows),
+            )
+            self.assertAlmostEqual(
+                aggregate.average_severity,
+                sum(r["severity_total"] for r in rows) / len(rows),
+            )
+            self.assertEqual(
+                counts[aggregate.most_common_outcome], max(counts.values())
+            )
+            self.assertTrue(0.0 <= aggregate.decayed_success_rate <= 1.0)
+
+    def test_type_and_location_aggregate(self):
+        """Test that a type and a location together narrow the aggregate"""
+        records = _records(200, seed=2)
+        log = MissionPatternLog()
+        for record in records:
+            log.append(record)
+
+        rows = [
+            r
+            for r in records
+            if r["mission_type"] == "sabotage" and r["location_id"] == "docks"
+        ]
+        aggregate = log.aggregate(mission_type="sabotage", location_id="docks")
+        self.assertEqual(aggregate.count, len(rows))
+        self.assertAlmostEqual(
+            aggregate.average_severity,
+            sum(r["severity_total"] for r in rows) / len(rows),
+        )
+        with self.assertRaises(ValueError):
+            log.aggregate(mission_type="sabotage", outcome="perfect_success")
+
+    def test_decayed_rate_follows_recent_turns(self):
+        """Test that old failures fade from the decayed success rate"""
+        log = MissionPatternLog(half_life=2)
+        for turn in range(10):
+            log.append(
+                {"mission_type": "rescue", "outcome": "complete_failure", "turn": turn}
+            )
+        for turn in range(10, 20):
+            log.append(
+                {"mission_type": "rescue", "outcome": "perfect_success", "turn": turn}
+            )
+
+        aggregate = log.aggregate(mission_type="rescue")
+        self.assertAlmostEqual(aggregate.success_rate, 0.5)
+        self.assertGreater(aggregate.decayed_success_rate, 0.9)
+
+    def test_spill_and_reload(self):
+        """Test that spilled records stream back and rebuild aggregates"""
+        records = _records(100, seed=1)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "patterns.jsonl")
+            log = MissionPatternLog(spill_path=path, buffer_size=16)
+            for record in records:
+                log.append(record)
+
+            self.assertLess(len(log._buffer), 16)
+            self.assertEqual(list(log.records()), records)
+
+            log.flush()
+            reloaded = MissionPatternLog.load(path)
+            self.assertEqual(len(reloaded), 100)
+            self.assertEqual(
+                reloaded.aggregate(location_id="docks").summary(),
+                log.aggregate(location_id="docks").summary(),
+            )
+
+    def test_engine_reports_campaign_patterns(self):
+        """Test that the engine keeps whole-campaign patterns"""
+        engine = MissionExecutionEngine(
+            GameState(), EquipmentIntegrationManager(EnhancedEquipmentManager())
+        )
+        outcomes = [ExecutionOutcome.PERFECT_SUCCESS] * 40 + [
+            ExecutionOutcome.COMPLETE_FAILURE
+        ] * 40
+        for outcome in outcomes:
+            engine._track_execution_patterns({"type": "sabotage"}, outcome, [])
+
+        patterns = engine.get_mission_success_patterns("sabotage")
+        self.assertEqual(patterns["total_missions"], 80)
+        self.assertAlmostEqual(patterns["success_rate"], 0.5)
+        self.assertEqual(patterns["most_common_outcome"], "perfect_success")
+        self.assertEqual(len(engine.execution_history), 50)
+        self.assertEqual(
+            engine.get_mission_success_patterns("rescue")["total_missions"], 0
+        )
+
+    def test_engine_spills_patterns(self):
+        """Test that the engine can spill its pattern log to a file"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "patterns.jsonl")
+            engine = MissionExecutionEngine(
+                GameState(),
+                EquipmentIntegrationManager(EnhancedEquipmentManager()),
+                pattern_spill_path=path,
+                pattern_buffer_size=8,
+            )
+            for _ in range(20):
+                engine._track_execution_patterns(
+                    {"type": "sabotage"}, ExecutionOutcome.PERFECT_SUCCESS, []
+                )
+
+            self.assertLess(len(engine.pattern_log._buffer), 8)
+            self.assertTrue(os.path.exists(path))
+            self.assertEqual(
+                engine.get_mission_success_patterns("sabotage")["total_missions"], 20
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Tests for the headless Monte Carlo campaign runner
+"""
+
+import os
+import random
+import sys
+import unittest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.game.monte_carlo import (
+    CampaignConfig,
+    aggregate_results,
+    iter_campaigns,
+    run_batch,
+    run_campaign,
+)
+
+
+class TestMonteCarloRunner(unittest.TestCase):
+    """Test seeded campaign runs and their aggregation"""
+
+    def test_campaign_is_reproducible_from_seed(self):
+        """Test that a seed fully determines a campaign"""
+        config = CampaignConfig(turns=10, stop_on_outcome=False)
+        first = run_campaign(7, config)
+        second = run_campaign(7, config)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first["turns_played"], 10)
+        self.assertEqual(first["records"][0]["turn"], 2)
+        self.assertIn("resistance", first["records"][-1]["resources"])
+
+    def test_campaign_stops_on_outcome(self):
+        """Test that campaigns end at the first victory or defeat"""
+        result = run_campaign(3, CampaignConfig(turns=50, victory_influence=0))
+
+        self.assertEqual(result["outcome"], "victory")
+        self.assertEqual(result["turns_played"], 1)
+        self.assertEqual(result["outcome_turn"], 2)
+
+    def test_parallel_batch_matches_serial(self):
+        """Test that the process pool gives the same results as serial runs"""
+        config = CampaignConfig(turns=8)
+        serial = list(iter_campaigns(range(4), config, workers=1))
+        parallel = sorted(
+            iter_campaigns(range(4), config, workers=2), key=lambda r: r["seed"]
+        )
+        self.assertEqual(serial, parallel)
+
+    def test_records_stream_per_turn(self):
+        """Test that records arrive turn by turn, before each campaign's result"""
+        config = CampaignConfig(turns=4, stop_on_outcome=False)
+        for workers in (1, 2):
+            streamed = []
+            for result in iter_campaigns(
+                range(3),
+                config,
+                workers=workers,
+                on_record=lambda seed, record: streamed.append((seed, record)),
+            ):
+                seen = [record for seed, record in streamed if seed == result["seed"]]
+                self.assertEqual(seen, result["records"])
+            self.assertEqual(len(streamed), 12)
+
+    def test_campaign_leaves_global_random_alone(self):
+        """Test that a campaign does not reseed the global random module"""
+        random.seed(99)
+        expected = random.random()
+        random.seed(99)
+        run_campaign(1, CampaignConfig(turns=2))
+        self.assertEqual(random.random(), expected)
+
+    def test_aggregate_distributions(self):
+        """Test outcome counts and resource distributions"""
+        streamed = []
+        aggregate = run_batch(
+            5,
+            base_seed=10,
+            config=CampaignConfig(turns=5),
+            workers=1,
+            on_result=streamed.append,
+        )
+
+        self.assertEqual(len(streamed), 5)
+        self.assertEqual(aggregate["campaigns"], 5)
+        self.assertEqual(sum(aggregate["outcomes"].values()), 5)
+        money = aggregate["final_resources"]["resistance"]["money"]
+        self.assertEqual(money["count"], 5)
+        self.assertLessEqual(money["min"], money["p50"])
+        self.assertLessEqual(money["p50"], money["max"])
+        self.assertEqual(aggregate_results([])["victory_turn"], {"count": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Tests for the turn-phase profiler
+"""
+
+import io
+import os
+import sys
+import unittest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.game.core import GameState
+from src.game.profiler import TurnProfiler
+from src.game.rng import get_rng_service, set_rng_service
+from src.maintenance.metrics import GameHealthMetrics
+
+
+class TestTurnProfiler(unittest.TestCase):
+    """Test phase recording, folded output and game integration"""
+
+    def tearDown(self):
+        set_rng_service(None)
+
+    def test_disabled_profiler_records_nothing(self):
+        """Test that a disabled profiler leaves no statistics behind"""
+        profiler = TurnProfiler()
+        with profiler.turn(1):
+            with profiler.phase("planning"):
+                pass
+
+        self.assertEqual(profiler.get_stats(), {})
+        self.assertIsNone(profiler.last_turn())
+
+    def test_nested_phases_and_folded_dump(self):
+        """Test that nested phases are recorded under their full path"""
+        profiler = TurnProfiler(enabled=True)
+
+        @profiler.instrument("hook")
+        def hook():
+            return 3
+
+        for turn in (1, 2):
+            with profiler.turn(turn):
+                with profiler.phase("resolution"):
+                    self.assertEqual(hook(), 3)
+
+        stats = profiler.get_stats()
+        self.assertEqual(stats["turn;resolution;hook"]["calls"], 2)
+        self.assertEqual(stats["turn"]["calls"], 2)
+        self.assertEqual(profiler.last_turn()["turn"], 2)
+
+        out = io.StringIO()
+        profiler.dump_folded(out, turn=2)
+        stacks = [line.rsplit(" ", 1)[0] for line in out.getvalue().splitlines()]
+        self.assertEqual(stacks, ["turn", "turn;resolution", "turn;resolution;hook"])
+
+    def test_advance_turn_phases_reach_metrics(self):
+        """Test that game turns are profiled and feed the health metrics"""
+        game = GameState(seed=3)
+        game.initialize_game()
+        game.profiler.enable()
+        game.advance_turn(interactive=False)
+
+        summary = game.get_status_summary()["performance"]
+        self.assertEqual(summary["turns_profiled"], 1)
+        self.assertIn("resolution", summary["last_turn_phases"])
+        self.assertIn("faction_updates", summary["last_turn_phases"])
+
+        metrics = GameHealthMetrics(game)
+        score = metrics.measure_performance()
+        self.assertTrue(0.0 <= score <= 1.0)
+        self.assertEqual(metrics.last_performance_profile["turns_profiled"], 1)
+
+    def test_metrics_do_not_advance_the_live_game(self):
+        """Test that measuring an unprofiled game leaves its turn alone"""
+        game = GameState(seed=4)
+        game.initialize_game()
+        turn_number = game.turn_number
+
+        metrics = GameHealthMetrics(game)
+        score = metrics.measure_performance()
+
+        self.assertTrue(0.0 <= score <= 1.0)
+        self.assertEqual(game.turn_number, turn_number)
+        self.assertEqual(game.profiler.summary()["turns_profiled"], 0)
+        self.assertEqual(metrics.last_performance_profile["turns_profiled"], 1)
+        self.assertIs(get_rng_service(), game.rng_service)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,7 +9,13 @@ import os
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
 
-from game.relationships import Relationship, BondType, EventType, SocialNetwork
+from game.relationships import (
+    Relationship,
+    BondType,
+    EventType,
+    SocialNetwork,
+    NUMPY_AVAILABLE,
+)
 from game.core import Agent, GameState
 from game.narrative_engine import NarrativeEngine, NarrativeTemplate
 
@@ -231,6 +237,47 @@ class TestSocialNetwork(unittest.TestCase):
         for agent_id, influence in influential:
             self.assertIn(agent_id, ["agent_b", "agent_c"])
 
+    def test_influence_invalidated_per_agent(self):
+        """Test that a mutation only invalidates its endpoints' influence"""
+        self.network.add_relationship("agent_a", "agent_b", self.rel1)
+        self.network.add_relationship("agent_c", "agent_d", self.rel1)
+        self.network.get_most_influential("agent_a")
+        cached_c = self.network.influence_cache["agent_c"]
+
+        self.network.update_relationship("agent_a", "agent_b", delta_affinity=10)
+
+        self.assertNotIn("agent_a", self.network.influence_cache)
+        self.assertNotIn("agent_b", self.network.influence_cache)
+        self.assertEqual(self.network.influence_cache["agent_c"], cached_c)
+        self.network.get_most_influential("agent_a")
+        self.assertIn("agent_b", self.network.influence_cache)
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "NumPy not available")
+    def test_influence_centrality(self):
+        """Test PageRank centrality and its warm-started recompute"""
+        for source, target in [
+            ("agent_a", "agent_b"),
+            ("agent_c", "agent_b"),
+            ("agent_d", "agent_b"),
+            ("agent_b", "agent_a"),
+        ]:
+            self.network.add_relationship(
+                source,
+                target,
+                Relationship(
+                    agent_id=target, bond_type=BondType.NEUTRAL, affinity=50, trust=0.8
+                ),
+            )
+
+        centrality = self.network.get_influence_centrality()
+        self.assertAlmostEqual(sum(centrality.values()), 1.0, places=6)
+        self.assertEqual(max(centrality, key=centrality.get), "agent_b")
+        cold_iterations = self.network.influence_engine.last_iterations
+
+        self.network.update_relationship("agent_c", "agent_b", delta_affinity=1)
+        self.network.get_influence_centrality()
+        self.assertLess(self.network.influence_engine.last_iterations, cold_iterations)
+
     def test_propagate_morale_effect(self):
         """Test morale effect propagation through network"""
         # Create a chain of positive relationships
@@ -254,6 +301,57 @@ class TestSocialNetwork(unittest.TestCase):
         self.assertGreater(rel_ab.affinity, initial_affinity_ab)
         self.assertGreater(rel_bc.affinity, initial_affinity_bc)
 
+    def test_neighbourhood_index_invalidated_on_new_edge(self):
+        """Test that cached neighbourhoods follow topology changes"""
+        self.network.add_relationship("agent_a", "agent_b", self.rel1)
+        self.network.add_relationship("agent_b", "agent_c", self.rel1)
+        self.assertEqual(
+            self.network.get_neighbourhood("agent_a", 2),
+            [("agent_b", 1), ("agent_c", 2)],
+        )
+
+        # Value-only updates keep the cached neighbourhood
+        version = self.network.neighbourhood_index.version
+        self.network.update_relationship("agent_a", "agent_b", delta_affinity=5)
+        self.assertEqual(self.network.neighbourhood_index.version, version)
+
+        self.network.add_relationship("agent_a", "agent_d", self.rel1)
+        self.assertEqual(
+            self.network.get_neighbourhood("agent_a", 1),
+            [("agent_b", 1), ("agent_d", 1)],
+        )
+
+    def test_morale_cascade_touches_each_relationship_once(self):
+        """Test the batched morale cascade over a triangle"""
+        for agent_a, agent_b in [
+            ("agent_a", "agent_b"),
+            ("agent_a", "agent_c"),
+            ("agent_b", "agent_c"),
+        ]:
+            self.network.add_relationship(
+                agent_a,
+                agent_b,
+                Relationship(
+                    agent_id=agent_b, bond_type=BondType.NEUTRAL, affinity=50, trust=0.8
+                ),
+            )
+
+        updated = self.network.propagate_morale_effect("agent_a", 10.0)
+
+        self.assertEqual(updated, 3)
+        expected = {
+            ("agent_a", "agent_b"): 55.0,
+            ("agent_a", "agent_c"): 55.0,
+            ("agent_b", "agent_c"): 52.5,
+        }
+        for (agent_a, agent_b), affinity in expected.items():
+            self.assertAlmostEqual(
+                self.network.get_relationship(agent_a, agent_b).affinity, affinity
+            )
+            self.assertAlmostEqual(
+                self.network.get_relationship(agent_b, agent_a).affinity, affinity
+            )
+
     def test_decay_all_relationships(self):
         """Test relationship decay across the network"""
         self.network.add_relationship("agent_a", "agent_b", self.rel1)
@@ -269,6 +367,85 @@ class TestSocialNetwork(unittest.TestCase):
         self.assertLess(rel.affinity, initial_affinity)
         self.assertLess(rel.trust, initial_trust)
 
+    def test_decay_applied_once_per_turn(self):
+        """Test that decay for a given turn is only applied once"""
+        self.network.add_relationship("agent_a", "agent_b", self.rel1)
+
+        self.assertTrue(self.network.decay_all_relationships(turn_number=2))
+        affinity_after_decay = self.network.get_relationship(
+            "agent_a", "agent_b"
+        ).affinity
+
+        # A second decay for the same turn is ignored
+        self.assertFalse(self.network.decay_all_relationships(turn_number=2))
+        rel = self.network.get_relationship("agent_a", "agent_b")
+        self.assertAlmostEqual(rel.affinity, affinity_after_decay, places=5)
+
+        # The next turn decays again
+        self.assertTrue(self.network.apply_turn_updates(3))
+        rel = self.network.get_relationship("agent_a", "agent_b")
+        self.assertLess(rel.affinity, affinity_after_decay)
+
+    def test_queued_events_applied_on_flush(self):
+        """Test that queued events are applied to both directions on flush"""
+        self.network.add_relationship("agent_a", "agent_b", self.rel1)
+        forward = min(
+            self.network.get_relationship("agent_a", "agent_b").affinity + 16, 100
+        )
+
+        self.network.queue_event("agent_a", "agent_b", EventType.COOPERATION)
+        self.network.queue_event("agent_b", "agent_a", EventType.COOPERATION)
+
+        # Nothing changes until the batch is flushed
+        rel = self.network.get_relationship("agent_a", "agent_b")
+        self.assertAlmostEqual(rel.affinity, forward - 16, places=5)
+
+        self.assertEqual(self.network.flush_events(), 2)
+        self.assertEqual(self.network.pending_events, [])
+
+        # Both events land on the forward edge; the reverse edge starts from
+        # its values and takes the same events
+        expected = {
+            ("agent_a", "agent_b"): forward,
+            ("agent_b", "agent_a"): min(forward + 16, 100),
+        }
+        for pair, affinity in expected.items():
+            rel = self.network.get_relationship(*pair)
+            self.assertAlmostEqual(rel.affinity, affinity, places=5)
+            self.assertEqual(rel.last_event, "cooperation")
+            self.assertEqual(len(rel.emotional_history), 2)
+
+    def test_flushed_event_matches_update_relationship(self):
+        """Test that a flushed event has the effect of update_relationship"""
+        immediate = SocialNetwork()
+        for network in (self.network, immediate):
+            network.add_relationship(
+                "agent_a",
+                "agent_b",
+                Relationship(agent_id="agent_b", affinity=50, trust=0.8),
+            )
+            # An asymmetric pair: the reverse edge differs from the forward one
+            reverse = network.get_relationship("agent_b", "agent_a")
+            reverse.affinity = -20
+            reverse.trust = 0.3
+
+        self.network.queue_event("agent_a", "agent_b", EventType.COOPERATION)
+        self.network.flush_events()
+        immediate.update_relationship(
+            "agent_a", "agent_b", event_type=EventType.COOPERATION
+        )
+
+        for pair in (("agent_a", "agent_b"), ("agent_b", "agent_a")):
+            flushed = self.network.get_relationship(*pair)
+            expected = immediate.get_relationship(*pair)
+            self.assertAlmostEqual(flushed.affinity, expected.affinity, places=5)
+            self.assertAlmostEqual(flushed.trust, expected.trust, places=5)
+            self.assertAlmostEqual(flushed.loyalty, expected.loyalty, places=5)
+
+        # The asymmetric pair is brought back in line by the event
+        reverse = self.network.get_relationship("agent_b", "agent_a")
+        self.assertAlmostEqual(reverse.affinity, 66, places=5)
+
     def test_get_social_clusters(self):
         """Test social cluster identification"""
         # Create two separate clusters
@@ -288,6 +465,33 @@ class TestSocialNetwork(unittest.TestCase):
         for cluster_id, cluster in clusters.items():
             self.assertGreater(len(cluster), 1)  # No singleton clusters
 
+    def test_cluster_index_tracks_updates(self):
+        """Test that clusters follow relationship changes without a full rescan"""
+        friend = Relationship(agent_id="agent_b", affinity=50, trust=0.8)
+        self.network.add_relationship("agent_a", "agent_b", friend)
+        self.network.add_relationship("agent_b", "agent_c", friend)
+
+        cluster_id = self.network.get_agent_cluster("agent_a")
+        self.assertIsNotNone(cluster_id)
+        self.assertEqual(self.network.get_agent_cluster("agent_c"), cluster_id)
+        self.assertTrue(self.network.in_same_cluster("agent_a", "agent_c"))
+
+        # A new positive edge merges a new agent into the cluster
+        self.network.add_relationship("agent_c", "agent_d", friend)
+        self.assertEqual(self.network.get_agent_cluster("agent_d"), cluster_id)
+
+        # Turning the b-c relationship hostile splits the cluster
+        self.network.update_relationship(
+            "agent_b", "agent_c", delta_affinity=-100, delta_trust=-1.0
+        )
+        self.assertFalse(self.network.in_same_cluster("agent_a", "agent_c"))
+        clusters = self.network.get_social_clusters()
+        self.assertEqual(len(clusters), 2)
+        self.assertEqual(
+            sorted(sorted(members) for members in clusters.values()),
+            [["agent_a", "agent_b"], ["agent_c", "agent_d"]],
+        )
+
     def test_get_faction_cohesion_index(self):
         """Test faction cohesion calculation"""
         # Create faction with strong internal relationships
@@ -305,6 +509,32 @@ class TestSocialNetwork(unittest.TestCase):
         empty_cohesion = self.network.get_faction_cohesion_index([])
         self.assertEqual(empty_cohesion, 0.0)
 
+    def test_cached_faction_cohesion_matches_scan(self):
+        """Test that the cached cohesion index tracks relationship mutations"""
+        self.network.set_agent_factions(
+            {"agent_a": "cell", "agent_b": "cell", "agent_c": "cell"}
+        )
+        self.network.add_relationship("agent_a", "agent_b", self.rel1)
+        self.network.add_relationship("agent_b", "agent_c", self.rel1)
+        members = ["agent_a", "agent_b", "agent_c"]
+
+        self.assertAlmostEqual(
+            self.network.get_faction_cohesion("cell"),
+            self.network.get_faction_cohesion_index(members),
+            places=9,
+        )
+
+        # Incremental updates, batched decay and faction moves stay in sync
+        self.network.update_relationship("agent_a", "agent_b", delta_trust=-0.2)
+        self.network.apply_turn_updates(2)
+        self.network.set_agent_faction("agent_c", "splinter")
+        self.assertAlmostEqual(
+            self.network.get_faction_cohesion("cell"),
+            self.network.get_faction_cohesion_index(["agent_a", "agent_b"]),
+            places=9,
+        )
+        self.assertEqual(self.network.get_faction_cohesion("splinter"), 0.0)
+
     def test_serialization(self):
         """Test social network serialization and deserialization"""
         # Add some relationships
@@ -327,6 +557,91 @@ class TestSocialNetwork(unittest.TestCase):
         self.assertEqual(rel.agent_id, "agent_b")
 
 
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy is required for the compact backend")
+class TestCompactSocialNetwork(TestSocialNetwork):
+    """Run the SocialNetwork tests against the array-backed storage"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        super().setUp()
+        self.network = SocialNetwork(backend="compact")
+
+    def test_views_write_through(self):
+        """Test that relationship views write back into the store"""
+        self.network.add_relationship("agent_a", "agent_b", self.rel1)
+
+        rel = self.network.get_relationship("agent_a", "agent_b")
+        rel.update_from_event(EventType.RESCUE)
+
+        stored = self.network.get_relationship("agent_a", "agent_b")
+        self.assertAlmostEqual(stored.affinity, rel.affinity, places=5)
+        self.assertEqual(stored.last_event, "rescue")
+        self.assertIsInstance(stored, Relationship)
+
+        # Reverse edge is independent and starts without history
+        reverse = self.network.get_relationship("agent_b", "agent_a")
+        self.assertEqual(reverse.agent_id, "agent_a")
+        self.assertEqual(reverse.emotional_history, [])
+
+    def test_batched_updates_match_dict_backend(self):
+        """Test that vectorized events and decay match the per-object path"""
+        # Neutral bonds so that the reverse edges are not re-randomized
+        friend = Relationship(agent_id="agent_b", affinity=50, trust=0.8)
+        rival = Relationship(agent_id="agent_c", affinity=-30, trust=0.3)
+
+        dict_network = SocialNetwork()
+        for network in (self.network, dict_network):
+            network.add_relationship("agent_a", "agent_b", friend)
+            network.add_relationship("agent_a", "agent_c", rival)
+            network.queue_event("agent_a", "agent_b", EventType.RESCUE)
+            network.queue_event("agent_a", "agent_c", EventType.BETRAYAL, 0.5)
+            network.apply_turn_updates(2)
+
+        for source, target in (("agent_a", "agent_b"), ("agent_c", "agent_a")):
+            compact_rel = self.network.get_relationship(source, target)
+            dict_rel = dict_network.get_relationship(source, target)
+            self.assertAlmostEqual(compact_rel.affinity, dict_rel.affinity, places=5)
+            self.assertAlmostEqual(compact_rel.trust, dict_rel.trust, places=5)
+            self.assertAlmostEqual(compact_rel.loyalty, dict_rel.loyalty, places=5)
+            self.assertEqual(compact_rel.emotional_history, dict_rel.emotional_history)
+
+    def test_flushed_events_clamp_identically(self):
+        """Test that both backends sum queued deltas before clamping"""
+        friend = Relationship(agent_id="agent_b", affinity=50, trust=0.8)
+
+        dict_network = SocialNetwork()
+        for network in (self.network, dict_network):
+            network.add_relationship("agent_a", "agent_b", friend)
+            network.queue_event("agent_a", "agent_b", EventType.SACRIFICE)
+            network.queue_event("agent_a", "agent_b", EventType.SACRIFICE)
+            network.queue_event("agent_b", "agent_a", EventType.BETRAYAL)
+            network.flush_events()
+
+        for source, target in (("agent_a", "agent_b"), ("agent_b", "agent_a")):
+            compact_rel = self.network.get_relationship(source, target)
+            dict_rel = dict_network.get_relationship(source, target)
+            self.assertAlmostEqual(compact_rel.affinity, dict_rel.affinity, places=5)
+            self.assertAlmostEqual(compact_rel.trust, dict_rel.trust, places=5)
+            self.assertAlmostEqual(compact_rel.loyalty, dict_rel.loyalty, places=5)
+
+        # +40 +40 -50 from 50 is 80; clamping after each event would give 50
+        self.assertAlmostEqual(
+            dict_network.get_relationship("agent_a", "agent_b").affinity, 80
+        )
+
+    def test_serialization_keeps_backend(self):
+        """Test that a compact network round-trips as a compact network"""
+        self.network.add_relationship("agent_a", "agent_b", self.rel1)
+
+        restored = SocialNetwork.deserialize(self.network.serialize())
+        self.assertEqual(restored.backend, "compact")
+        self.assertIn("agent_b", restored.relationships["agent_a"])
+
+        as_dict = SocialNetwork.deserialize(self.network.serialize(), backend="dict")
+        self.assertEqual(as_dict.backend, "dict")
+        self.assertIn("agent_a", as_dict.relationships["agent_b"])
+
+
 class TestAgentRelationships(unittest.TestCase):
     """Test Agent class relationship functionality"""
 
@@ -499,6 +814,33 @@ class TestGameStateRelationships(unittest.TestCase):
         self.assertGreaterEqual(cohesion, 0.0)
         self.assertLessEqual(cohesion, 1.0)
 
+    def test_faction_members_index(self):
+        """Test the faction membership index and cached cohesion"""
+        members = self.game_state.get_faction_members("resistance")
+        expected = {
+            a.id
+            for a in self.game_state.agents.values()
+            if a.faction_id == "resistance"
+        }
+        self.assertEqual(members, expected)
+
+        agent = self.game_state.agents["agent_luis"]
+        self.game_state.set_agent_faction(agent, "underground")
+        self.assertNotIn(
+            "agent_luis", self.game_state.get_faction_members("resistance")
+        )
+        self.assertIn("agent_luis", self.game_state.get_faction_members("underground"))
+
+        for faction_id in self.game_state.factions:
+            faction_agents = list(self.game_state.get_faction_members(faction_id))
+            self.assertAlmostEqual(
+                self.game_state.get_faction_cohesion(faction_id),
+                self.game_state.social_network.get_faction_cohesion_index(
+                    faction_agents
+                ),
+                places=9,
+            )
+
     def test_relationship_events_during_turn(self):
         """Test relationship events are processed during game turns"""
         initial_narrative_length = len(self.game_state.recent_narrative)
@@ -618,6 +960,70 @@ class TestNarrativeEngine(unittest.TestCase):
         self.assertEqual(len(templates), 1)
         self.assertEqual(templates[0].id, "custom_test")
 
+    def test_template_index_matches_constraints(self):
+        """Test that the template index only offers templates that fit"""
+        self.narrative_engine.templates = [
+            NarrativeTemplate(
+                id="close_allies",
+                title="Close Allies",
+                template="{agent_a.name} and {agent_b.name} stand together.",
+                required_bond_type=BondType.ALLY,
+                min_affinity=30,
+                min_trust=0.6,
+            ),
+            NarrativeTemplate(
+                id="tagged",
+                title="Tagged",
+                template="{agent_a.name} and {agent_b.name} share a history.",
+                required_tags=["veteran"],
+            ),
+            NarrativeTemplate(
+                id="too_rare",
+                title="Too Rare",
+                template="{agent_a.name} meets {agent_b.name}.",
+                rarity=0.0,
+            ),
+        ]
+        agent_a = self.game_state.agents["agent_maria"]
+        agent_b = self.game_state.agents["agent_sofia"]
+        relationship = Relationship(agent_id=agent_b.id, bond_type=BondType.ALLY)
+        # Allies start with randomised values, so pin the ones under test
+        relationship.affinity = 40
+        relationship.trust = 0.7
+
+        # Zero-weight templates match but are never drawn
+        for _ in range(20):
+            template = self.narrative_engine._find_matching_template(
+                agent_a, agent_b, relationship, {}
+            )
+            self.assertEqual(template.id, "close_allies")
+
+        agent_b.social_tags.add("veteran")
+        relationship.trust = 0.3
+        template = self.narrative_engine._find_matching_template(
+            agent_a, agent_b, relationship, {}
+        )
+        self.assertEqual(template.id, "tagged")
+
+        self.narrative_engine.recently_used = ["tagged"]
+        self.assertIsNone(
+            self.narrative_engine._find_matching_template(
+                agent_a, agent_b, relationship, {}
+            )
+        )
+
+    def test_alias_table_sampling(self):
+        """Test that alias sampling follows the weights"""
+        import random
+        from game.sampling import AliasTable
+
+        table = AliasTable(["a", "b", "c"], [1, 3, 0])
+        rng = random.Random(5)
+        draws = [table.sample(rng) for _ in range(4000)]
+
+        self.assertNotIn("c", draws)
+        self.assertAlmostEqual(draws.count("b") / len(draws), 0.75, delta=0.03)
+
 
 if __name__ == "__main__":
     # Run the tests
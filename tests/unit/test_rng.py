@@ -0,0 +1,102 @@
+"""
+Tests for the seeded per-subsystem random streams
+"""
+
+import os
+import random
+import sys
+import unittest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.game.core import GameState
+from src.game.rng import RNGService, get_rng, get_rng_service, set_rng_service
+
+
+class TestRNGService(unittest.TestCase):
+    """Test stream derivation, independence and state round trips"""
+
+    def tearDown(self):
+        set_rng_service(None)
+
+    def test_streams_do_not_depend_on_draw_order(self):
+        """Test that one subsystem's draws never shift another's"""
+        first = RNGService(42)
+        first.stream("core").random()
+        first.stream("core").random()
+        missions_first = [first.stream("missions").random() for _ in range(5)]
+
+        second = RNGService(42)
+        missions_second = [second.stream("missions").random() for _ in range(5)]
+
+        self.assertEqual(missions_first, missions_second)
+        self.assertNotEqual(
+            second.stream("agent", "a1").random(), second.stream("agent", "a2").random()
+        )
+
+    def test_state_round_trip(self):
+        """Test that restored streams continue exactly where they stopped"""
+        service = RNGService(7)
+        service.stream("factions", "resistance").random()
+        service.stream("emotions").gauss(0.0, 1.0)
+
+        restored = RNGService.from_state(service.get_state())
+
+        for key in ("factions", "emotions"):
+            stream = service.stream(*key.split("/"))
+            self.assertEqual(
+                [stream.random() for _ in range(3)],
+                [restored.stream(*key.split("/")).random() for _ in range(3)],
+            )
+
+    def test_unseeded_games_use_global_random(self):
+        """Test that unseeded games keep the global random module"""
+        with GameState().rng_scope():
+            self.assertIsNone(get_rng_service())
+            self.assertIs(get_rng("core"), random)
+
+    def test_games_keep_their_own_streams(self):
+        """Test that other games never swap out a seeded game's streams"""
+        seeded = GameState(seed=5)
+        plain = GameState()
+        self.assertIs(get_rng_service(), seeded.rng_service)
+
+        with plain.rng_scope():
+            self.assertIs(get_rng("core"), random)
+        self.assertIs(get_rng_service(), seeded.rng_service)
+
+    def test_seeded_campaign_ignores_other_games(self):
+        """Test that turns of another game do not change a seeded campaign"""
+
+        def play(seed, interleave):
+            game_state = GameState(seed=seed)
+            game_state.initialize_game()
+            for _ in range(3):
+                if interleave:
+                    other = GameState()
+                    other.initialize_game()
+                    other.advance_turn(interactive=False)
+                game_state.advance_turn(interactive=False)
+            summary = game_state.get_status_summary()
+            return summary["factions"], summary["faction_cohesion"]
+
+        self.assertEqual(play(11, False), play(11, True))
+
+    def test_seeded_games_are_reproducible(self):
+        """Test that two games with the same seed play out identically"""
+
+        def play(seed):
+            game_state = GameState(seed=seed)
+            game_state.initialize_game()
+            for _ in range(5):
+                game_state.advance_turn(interactive=False)
+            summary = game_state.get_status_summary()
+            return summary["factions"], summary["faction_cohesion"]
+
+        self.assertEqual(play(11), play(11))
+        self.assertIsNotNone(get_rng_service())
+
+
+if __name__ == "__main__":
+    unittest.main()
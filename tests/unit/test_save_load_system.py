@@ -293,6 +293,161 @@ class TestSaveLoadSystem(unittest.TestCase):
                         mock_print.call_count, len(save_files) + 2
                     )  # +2 for header and footer
 
+    def test_binary_save_round_trip(self):
+        """Test that binary saves restore every section and the metadata"""
+        game_state = {
+            "turn": 7,
+            "date": "1975-04-01",
+            "agents": [
+                {"name": f"Agent{i}", "skills": list(range(20))} for i in range(50)
+            ],
+            "factions": [{"name": "Red Brigades", "strength": 30}],
+            "social_network": {"relationships": {"a": {"b": {"affinity": 40}}}},
+            "public_support": 45,
+        }
+        game = MagicMock()
+        game.to_dict.return_value = game_state
+
+        filename = self.save_manager.save_game(
+            game, "binary_save", save_format="binary"
+        )
+        self.assertTrue(filename.endswith(".yolsave"))
+        self.assertIn(filename, self.save_manager.list_saves())
+
+        metadata = self.save_manager.get_save_metadata(filename)
+        self.assertEqual(metadata["turn"], 7)
+        self.assertEqual(metadata["agent_count"], 50)
+
+        self.cli.game = MagicMock()
+        self.assertTrue(self.save_manager.load_game(self.cli, filename))
+        self.cli.game.from_dict.assert_called_once_with(game_state)
+
+    def test_autosave_uses_binary_format(self):
+        """Test that autosaves are written in the compressed format"""
+        game = MagicMock()
+        game.turn = 3
+        game.to_dict.return_value = {"turn": 3, "agents": []}
+
+        filename = self.save_manager.autosave(game)
+
+        self.assertTrue(filename.endswith(".yolsave"))
+        save_path = os.path.join(self.test_save_dir, filename)
+        with open(save_path, "rb") as f:
+            self.assertEqual(f.read(8), b"YOLSAVE\x01")
+
+    def test_save_index_avoids_reading_saves(self):
+        """Test that indexed saves are listed without opening their bodies"""
+        game = MagicMock()
+        game.to_dict.return_value = {"turn": 4, "agents": [{"name": "Agent1"}]}
+        self.save_manager.save_game(game, "indexed_json")
+        self.save_manager.save_game(game, "indexed_binary", save_format="binary")
+
+        with patch.object(
+            self.save_manager, "get_save_metadata", side_effect=AssertionError
+        ):
+            all_metadata = self.save_manager.get_all_save_metadata()
+
+        self.assertEqual(
+            set(all_metadata), {"indexed_json.json", "indexed_binary.yolsave"}
+        )
+        for metadata in all_metadata.values():
+            self.assertEqual(metadata["turn"], 4)
+            self.assertEqual(metadata["agent_count"], 1)
+
+    def test_rebuild_save_index(self):
+        """Test that a lost index is rebuilt from the save files"""
+        game = MagicMock()
+        game.to_dict.return_value = {"turn": 9, "agents": []}
+        self.save_manager.save_game(game, "first")
+        self.save_manager.save_game(game, "second", save_format="binary")
+        os.remove(os.path.join(self.test_save_dir, ".save_index"))
+
+        self.assertEqual(self.save_manager.rebuild_save_index(), 2)
+        self.assertNotIn(".save_index", self.save_manager.list_saves())
+        with patch.object(
+            self.save_manager, "get_save_metadata", side_effect=AssertionError
+        ):
+            all_metadata = self.save_manager.get_all_save_metadata()
+        self.assertEqual(all_metadata["second.yolsave"]["turn"], 9)
+
+    def test_background_autosave_writes_snapshot(self):
+        """Test that background autosaves are unaffected by later changes"""
+        self.save_manager.async_autosave = True
+        live_state = {"turn": 6, "agents": [{"name": "Agent1", "stress": 10}]}
+        game = MagicMock()
+        game.turn = 6
+        game.to_dict.return_value = live_state
+
+        filename = self.save_manager.autosave(game)
+        live_state["agents"][0]["stress"] = 90
+        live_state["agents"].append({"name": "Agent2"})
+        self.save_manager.wait_for_autosave()
+
+        self.assertIsNone(self.save_manager.last_autosave_error)
+        self.cli.game = MagicMock()
+        self.assertTrue(self.save_manager.load_game(self.cli, filename))
+        self.cli.game.from_dict.assert_called_once_with(
+            {"turn": 6, "agents": [{"name": "Agent1", "stress": 10}]}
+        )
+        self.assertEqual(
+            self.save_manager.get_all_save_metadata()[filename]["agent_count"], 1
+        )
+
+    def test_delta_saves_replay_and_rewind(self):
+        """Test delta save chains, rewinding and compaction"""
+        import copy
+
+        self.save_manager.delta_compact_every = 3
+        state = {
+            "turn": 1,
+            "agents": [{"name": f"Agent{i}", "stress": 0} for i in range(20)],
+            "narrative": ["The campaign begins."],
+        }
+        game = MagicMock()
+        game.to_dict.side_effect = lambda: state
+        journal_path = os.path.join(self.test_save_dir, "campaign.yoldelta")
+
+        history = {}
+        for turn in range(1, 5):
+            state["turn"] = turn
+            state["agents"][turn]["stress"] += 10
+            state["narrative"].append(f"Turn {turn} passes.")
+            history[turn] = copy.deepcopy(state)
+            filename = self.save_manager.save_delta(game, "campaign")
+            if turn == 2:
+                journal_size = os.path.getsize(journal_path)
+
+        # Each delta record holds only the changed agent and narrative line
+        self.assertLess(journal_size, len(json.dumps(history[2])) / 2)
+
+        # Turn 4 was the third delta record; turn 5 compacts into a new base
+        self.assertEqual(self.save_manager.load_delta_state(filename), history[4])
+        self.assertEqual(
+            self.save_manager.load_delta_state(filename, turn=2), history[2]
+        )
+        self.assertEqual(self.save_manager.get_save_metadata(filename)["turn"], 4)
+
+        state["turn"] = 5
+        self.save_manager.save_delta(game, "campaign")
+        self.assertFalse(os.path.exists(journal_path))
+        self.cli.game = MagicMock()
+        self.assertTrue(self.save_manager.load_game(self.cli, filename))
+        self.cli.game.from_dict.assert_called_once_with(state)
+
+        # A crash while compacting never leaves a journal for the wrong base
+        turn_5 = copy.deepcopy(state)
+        state["turn"] = 6
+        self.save_manager.save_delta(game, "campaign")
+        self.save_manager._delta_chains[filename]["records"] = 3
+        state["turn"] = 7
+        with patch.object(
+            self.save_manager, "_write_binary", side_effect=OSError("disk full")
+        ):
+            with self.assertRaises(OSError):
+                self.save_manager.save_delta(game, "campaign")
+        self.assertFalse(os.path.exists(journal_path))
+        self.assertEqual(self.save_manager.load_delta_state(filename), turn_5)
+
 
 if __name__ == "__main__":
     unittest.main()
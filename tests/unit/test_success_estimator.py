@@ -0,0 +1,190 @@
+"""
+Tests for the shared mission success estimator
+"""
+
+import itertools
+import os
+import random
+import sys
+import unittest
+
+# Add the src directory to the path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from src.game.character_creation import (
+    BackgroundType,
+    CharacterCreator,
+    PersonalityTrait,
+)
+from src.game.core import GameState
+from src.game.enhanced_mission_system import EnhancedMissionExecutor
+from src.game.equipment_enhanced import EnhancedEquipmentManager
+from src.game.equipment_integration import EquipmentIntegrationManager
+from src.game.mission_execution_engine import MissionExecutionEngine
+from src.game.mission_planning import MissionPlanner, MissionType
+from src.game.success_estimator import (
+    EmotionalSuccessModel,
+    ExecutionSuccessModel,
+    SuccessEstimator,
+)
+
+MISSION_TYPES = ["propaganda", "sabotage", "intelligence", "rescue", "recruitment"]
+
+
+def _agents(count, rng):
+    return [
+        {
+            "id": f"agent_{i}",
+            "name": f"Agent {i}",
+            "skills": {
+                "stealth": rng.uniform(0, 5),
+                "social": {"level": rng.uniform(0, 5)},
+                "combat": {"level": rng.randint(1, 5)},
+                "technical": rng.uniform(0, 5),
+            },
+            "emotional_state": {
+                "trauma_level": rng.uniform(0, 0.5),
+                "fear": rng.uniform(-0.5, 1),
+                "anger": rng.uniform(-0.5, 1),
+                "trust": rng.uniform(-0.5, 1),
+                "joy": rng.uniform(0, 1),
+                "sadness": rng.uniform(0, 1),
+            },
+            "equipment": {"quality": rng.randint(0, 10)},
+        }
+        for i in range(count)
+    ]
+
+
+class TestSuccessEstimator(unittest.TestCase):
+    """Test the success models against the methods they mirror"""
+
+    def setUp(self):
+        self.rng = random.Random(3)
+        game_state = GameState()
+        self.engine = MissionExecutionEngine(
+            game_state, EquipmentIntegrationManager(EnhancedEquipmentManager())
+        )
+        self.executor = EnhancedMissionExecutor(game_state)
+
+    def test_models_match_engine_formulas(self):
+        """Test execution and emotional models against the engine helpers"""
+        agents = _agents(8, self.rng)
+        estimator = SuccessEstimator()
+        for _ in range(200):
+            mission = {
+                "type": self.rng.choice(MISSION_TYPES),
+                "complexity": self.rng.randint(1, 9),
+                "difficulty": self.rng.choice(["easy", "medium", "hard"]),
+            }
+            location = {"security_level": self.rng.randint(1, 10)}
+            team = self.rng.sample(agents, self.rng.randint(0, 5))
+
+            expected = self.engine._apply_execution_modifiers(
+                self.engine._calculate_base_success(mission, team, location),
+                mission,
+                team,
+                location,
+            )
+            model = ExecutionSuccessModel(mission, location)
+            self.assertAlmostEqual(estimator.evaluate(model, team), expected)
+
+            expected = self.executor._calculate_emotional_success_probability(
+                mission, team, None
+            )
+            model = EmotionalSuccessModel(mission)
+            self.assertAlmostEqual(estimator.evaluate(model, team), expected)
+
+    def test_incremental_team_and_feature_cache(self):
+        """Test add/remove evaluation and per-estimator feature caching"""
+        agents = _agents(4, self.rng)
+        mission = {"type": "sabotage", "complexity": 4}
+        model = ExecutionSuccessModel(mission, {"security_level": 4})
+        estimator = SuccessEstimator()
+
+        team = estimator.team(model, agents[:3])
+        team.remove(agents[1])
+        self.assertAlmostEqual(
+            team.probability(), model.evaluate([agents[0], agents[2]])
+        )
+
+        before = estimator.features(model, agents[0])
+        agents[0]["emotional_state"]["trauma_level"] = 1.0
+        self.assertEqual(estimator.features(model, agents[0]), before)
+        self.assertNotEqual(SuccessEstimator().features(model, agents[0]), before)
+
+    def test_best_team_matches_exhaustive_search(self):
+        """Test that pruned search finds the best combination"""
+        for _ in range(30):
+            agents = _agents(9, self.rng)
+            for agent in agents:
+                agent["skills"]["stealth"] *= 0.3
+            mission = {
+                "type": self.rng.choice(MISSION_TYPES),
+                "complexity": self.rng.randint(1, 9),
+                "difficulty": "hard",
+            }
+            for model in (
+                ExecutionSuccessModel(mission, {"security_level": 9}),
+                EmotionalSuccessModel(mission),
+            ):
+                estimator = SuccessEstimator()
+                size = self.rng.randint(1, 4)
+                probability, team = estimator.best_team(model, agents, size)
+                best = max(
+                    model.evaluate(combo)
+                    for combo in itertools.combinations(agents, size)
+                )
+                self.assertEqual(len(team), size)
+                self.assertAlmostEqual(probability, best)
+                self.assertAlmostEqual(model.evaluate(team), best)
+
+    def test_planner_suggests_team(self):
+        """Test MissionPlanner.suggest_team against planned odds"""
+        creator = CharacterCreator()
+        roster = [
+            creator.create_character(
+                name=f"Operative {i}",
+                background_type=background,
+                primary_trait=PersonalityTrait.CAUTIOUS,
+                secondary_trait=PersonalityTrait.ANALYTICAL,
+            )
+            for i, background in enumerate(list(BackgroundType)[:5])
+        ]
+        planner = MissionPlanner()
+
+        probability, team = planner.suggest_team(
+            MissionType.SABOTAGE, "industrial_zone", roster, 2
+        )
+        best = max(
+            planner.create_mission_plan(
+                MissionType.SABOTAGE, "industrial_zone", list(combo)
+            ).success_probability
+            for combo in itertools.combinations(roster, 2)
+        )
+        self.assertEqual(len(team), 2)
+        self.assertAlmostEqual(probability, best)
+
+        # Later suggestions see skill changes made since the last one
+        for character in roster:
+            for skill in vars(character.skills):
+                setattr(character.skills, skill, 0)
+        previous = probability
+        probability, _ = planner.suggest_team(
+            MissionType.SABOTAGE, "industrial_zone", roster, 2
+        )
+        self.assertLess(probability, previous)
+        best = max(
+            planner.create_mission_plan(
+                MissionType.SABOTAGE, "industrial_zone", list(combo)
+            ).success_probability
+            for combo in itertools.combinations(roster, 2)
+        )
+        self.assertAlmostEqual(probability, best)
+
+        with self.assertRaises(ValueError):
+            planner.suggest_team(MissionType.SABOTAGE, "nowhere", roster, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()